@@ -1,2 +1,4 @@
 """Brandmint — Unified brand creation orchestrator."""
-__version__ = "4.4.0"
+from ._version import __version__
+
+__all__ = ["__version__"]
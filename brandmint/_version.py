@@ -0,0 +1,2 @@
+"""Brandmint version (kept dependency-free so it can be read without loading the package)."""
+__version__ = "4.4.0"
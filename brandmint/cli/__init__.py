@@ -1 +1,17 @@
 """Brandmint CLI — Typer-based command interface."""
+import sys
+
+
+def main():
+    """Entry point for both `brandmint` and `bm` commands.
+
+    `bm --version` is answered here without importing Typer/Click; every
+    other invocation is handed to the Typer app.
+    """
+    if sys.argv[1:] in (["--version"], ["-V"]):
+        from .._version import __version__
+        print(__version__)
+        return
+
+    from .app import app
+    app()
@@ -0,0 +1,16 @@
+"""
+Brandmint CLI — Typer options shared across commands.
+
+Declared once at module level so every command that takes them reuses the
+same OptionInfo instead of building an identical one per signature.
+"""
+from typing import Annotated, Optional
+
+import typer
+
+CONFIG_OPTION = typer.Option(..., "--config", "-c", help="Path to brand-config.yaml")
+
+OutputDir = Annotated[
+    Optional[str],
+    typer.Option("--output-dir", "-o", help="Override output directory"),
+]
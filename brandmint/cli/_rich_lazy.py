@@ -0,0 +1,48 @@
+"""
+Brandmint CLI — Lazily imported Rich names shared by command modules.
+
+Each name resolves its Rich module on first call or attribute access, so
+command modules can import them at module level without loading Rich
+until output is actually produced.
+
+Usage:
+    from ._rich_lazy import Confirm, Table
+
+    table = Table(title="Stats")          # imports rich.table here
+    Confirm.ask("Continue?")              # imports rich.prompt here
+"""
+
+import importlib
+from typing import Any
+
+
+class _Lazy:
+    """Proxy for ``module.attr`` that imports the module on first use."""
+
+    __slots__ = ("_module", "_attr", "_target")
+
+    def __init__(self, module: str, attr: str):
+        self._module = module
+        self._attr = attr
+        self._target = None
+
+    def _resolve(self) -> Any:
+        target = self._target
+        if target is None:
+            target = getattr(importlib.import_module(self._module), self._attr)
+            self._target = target
+        return target
+
+    def __call__(self, *args, **kwargs):
+        return self._resolve()(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._resolve(), name)
+
+    def __repr__(self) -> str:
+        return f"<lazy {self._module}.{self._attr}>"
+
+
+Console = _Lazy("rich.console", "Console")
+Table = _Lazy("rich.table", "Table")
+Confirm = _Lazy("rich.prompt", "Confirm")
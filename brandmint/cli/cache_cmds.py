@@ -0,0 +1,56 @@
+"""
+Brandmint CLI — `bm cache` cache subcommands.
+
+Loaded on demand by :class:`brandmint.cli.app.LazyGroup`.
+"""
+import typer
+
+from ._rich_lazy import Confirm
+from .app import _console
+
+app = typer.Typer(name="cache", help="Prompt and asset cache management", no_args_is_help=True)
+
+
+@app.command("stats")
+def cache_stats():
+    """Show cache statistics."""
+    from ..core.cache import get_prompt_cache
+    
+    cache = get_prompt_cache()
+    stats = cache.stats()
+    
+    _console().print(
+        "[bold cyan]📦 Prompt Cache Statistics[/bold cyan]\n"
+        f"  {'Total Entries':<16}{stats['total_entries']:>10}\n"
+        f"  {'Valid Entries':<16}[green]{stats['valid_entries']:>10}[/green]\n"
+        f"  {'Expired Entries':<16}[yellow]{stats['expired_entries']:>10}[/yellow]\n"
+        f"  {'Cache Size':<16}{stats['total_size_mb']:>7.2f} MB\n"
+        f"  {'Location':<16}[dim]{stats['cache_dir']}[/dim]",
+        highlight=False,
+    )
+
+
+@app.command("clear")
+def cache_clear(
+    expired: bool = typer.Option(False, "--expired", help="Only clear expired entries"),
+    force: bool = typer.Option(False, "--force", "-f", help="Skip confirmation"),
+):
+    """Clear cached prompts."""
+    from ..core.cache import get_prompt_cache
+    
+    cache = get_prompt_cache()
+    
+    if expired:
+        # Only clear expired
+        removed = cache.clear_expired()
+        _console().print(f"[green]Cleared {removed} expired cache entries.[/green]")
+    else:
+        # Clear all
+        stats = cache.stats()
+        if not force and stats["total_entries"] > 0:
+            if not Confirm.ask(f"Clear all {stats['total_entries']} cache entries?"):
+                _console().print("[dim]Cancelled.[/dim]")
+                return
+        
+        cache.clear_all()
+        _console().print(f"[green]Cache cleared. Removed {stats['total_entries']} entries.[/green]")
@@ -11,12 +11,17 @@ Usage:
     print(get_status_icon("in_progress"))
 """
 
-from enum import Enum
+import functools
+import sys
 from typing import Optional
 
 
-class StatusType(str, Enum):
-    """Standard status types used across brandmint."""
+class StatusType:
+    """Standard status types used across brandmint.
+
+    Plain string constants (not an Enum) so they can be used directly as
+    dictionary keys and compared against raw status strings.
+    """
     PENDING = "pending"
     IN_PROGRESS = "in_progress"
     COMPLETED = "completed"
@@ -120,39 +125,52 @@ class EmojiIcons:
 
 # ---------------------------------------------------------------------------
 # Status icon mapping
+#
+# Status spellings are a small, fixed set, so the public getters below are
+# memoized with a bounded cache.
 # ---------------------------------------------------------------------------
 
-_STATUS_ICON_MAP = {
-    StatusType.PENDING: Icons.PENDING,
-    StatusType.IN_PROGRESS: Icons.IN_PROGRESS,
-    StatusType.COMPLETED: Icons.COMPLETED,
-    StatusType.FAILED: Icons.FAILED,
-    StatusType.SKIPPED: Icons.SKIPPED,
-    StatusType.WAITING: Icons.WAITING,
-    StatusType.CACHED: Icons.CACHED,
-}
+# (status, icon, emoji, style) — single source of truth for status rendering.
+_STATUS_ROWS = (
+    (StatusType.PENDING, Icons.PENDING, EmojiIcons.PENDING, "dim"),
+    (StatusType.IN_PROGRESS, Icons.IN_PROGRESS, EmojiIcons.IN_PROGRESS, "yellow"),
+    (StatusType.COMPLETED, Icons.COMPLETED, EmojiIcons.COMPLETED, "green"),
+    (StatusType.FAILED, Icons.FAILED, EmojiIcons.FAILED, "red"),
+    (StatusType.SKIPPED, Icons.SKIPPED, EmojiIcons.SKIPPED, "dim"),
+    (StatusType.WAITING, Icons.WAITING, EmojiIcons.WAITING, "cyan"),
+    (StatusType.CACHED, Icons.CACHED, EmojiIcons.CACHED, "blue"),
+)
 
-_STATUS_EMOJI_MAP = {
-    StatusType.PENDING: EmojiIcons.PENDING,
-    StatusType.IN_PROGRESS: EmojiIcons.IN_PROGRESS,
-    StatusType.COMPLETED: EmojiIcons.COMPLETED,
-    StatusType.FAILED: EmojiIcons.FAILED,
-    StatusType.SKIPPED: EmojiIcons.SKIPPED,
-    StatusType.WAITING: EmojiIcons.WAITING,
-    StatusType.CACHED: EmojiIcons.CACHED,
+# Raw status string -> (icon, emoji, style), including hyphenated spellings
+# ("in-progress") so one lookup yields everything a status line needs.
+_STATUS_TABLE: dict[str, tuple[str, str, str]] = {
+    spelling: (icon, emoji, style)
+    for status, icon, emoji, style in _STATUS_ROWS
+    for spelling in (status, status.replace("_", "-"))
 }
 
-_STATUS_STYLE_MAP = {
-    StatusType.PENDING: "dim",
-    StatusType.IN_PROGRESS: "yellow",
-    StatusType.COMPLETED: "green",
-    StatusType.FAILED: "red",
-    StatusType.SKIPPED: "dim",
-    StatusType.WAITING: "cyan",
-    StatusType.CACHED: "blue",
-}
+
+@functools.lru_cache(maxsize=64)
+def _normalize_status(raw: str) -> Optional[str]:
+    """Map any accepted spelling (e.g. "In-Progress") to its StatusType value.
+
+    Returns None for unrecognized statuses.
+    """
+    key = raw.lower().replace("-", "_")
+    return key if key in _STATUS_TABLE else None
 
 
+def _lookup_status(status: str) -> Optional[tuple[str, str, str]]:
+    """Return the (icon, emoji, style) row for a status, or None if unknown."""
+    row = _STATUS_TABLE.get(status)
+    if row is None:
+        key = _normalize_status(status)
+        if key is not None:
+            row = _STATUS_TABLE[key]
+    return row
+
+
+@functools.lru_cache(maxsize=32)
 def get_status_icon(status: str, emoji: bool = False) -> str:
     """Get the appropriate icon for a status string.
     
@@ -163,15 +181,13 @@ def get_status_icon(status: str, emoji: bool = False) -> str:
     Returns:
         Icon character/emoji for the status
     """
-    try:
-        status_type = StatusType(status.lower().replace("-", "_"))
-    except ValueError:
+    row = _lookup_status(status)
+    if row is None:
         return Icons.QUESTION
-    
-    icon_map = _STATUS_EMOJI_MAP if emoji else _STATUS_ICON_MAP
-    return icon_map.get(status_type, Icons.QUESTION)
+    return row[1] if emoji else row[0]
 
 
+@functools.lru_cache(maxsize=32)
 def get_status_style(status: str) -> str:
     """Get the Rich style for a status string.
     
@@ -181,14 +197,11 @@ def get_status_style(status: str) -> str:
     Returns:
         Rich style string (e.g., "green", "red")
     """
-    try:
-        status_type = StatusType(status.lower().replace("-", "_"))
-    except ValueError:
-        return "white"
-    
-    return _STATUS_STYLE_MAP.get(status_type, "white")
+    row = _lookup_status(status)
+    return "white" if row is None else row[2]
 
 
+@functools.lru_cache(maxsize=32)
 def format_status(status: str, emoji: bool = False) -> str:
     """Format a status with icon and Rich markup.
     
@@ -199,8 +212,11 @@ def format_status(status: str, emoji: bool = False) -> str:
     Returns:
         Formatted string like "[green]● completed[/green]"
     """
-    icon = get_status_icon(status, emoji)
-    style = get_status_style(status)
+    row = _lookup_status(status)
+    if row is None:
+        icon, style = Icons.QUESTION, "white"
+    else:
+        icon, style = (row[1] if emoji else row[0]), row[2]
     label = status.replace("_", " ")
     return f"[{style}]{icon} {label}[/{style}]"
 
@@ -224,8 +240,11 @@ def format_status_line(
     Returns:
         Formatted status line like "  ● buyer-persona (2.3s)"
     """
-    icon = get_status_icon(status, emoji)
-    style = get_status_style(status)
+    row = _lookup_status(status)
+    if row is None:
+        icon, style = Icons.QUESTION, "white"
+    else:
+        icon, style = (row[1] if emoji else row[0]), row[2]
     
     parts = [f"  [{style}]{icon}[/{style}] {item_id}"]
     
@@ -242,10 +261,18 @@ def format_status_line(
 # Progress indicators for inline use
 # ---------------------------------------------------------------------------
 
-PROGRESS_CHARS = "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"
+# Spinner frames as a tuple of interned glyphs: indexing returns the same
+# object every time instead of a fresh 1-char string.
+PROGRESS_CHARS = tuple(sys.intern(c) for c in "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏")
 PROGRESS_BLOCKS = "░▒▓█"
 PROGRESS_BAR = "▏▎▍▌▋▊▉█"
 
+# Pre-built bar runs; make_progress_bar slices these instead of repeating
+# glyphs on every redraw.
+_BAR_RUN_LENGTH = 256
+_BAR_FULL = "█" * _BAR_RUN_LENGTH
+_BAR_EMPTY = "░" * _BAR_RUN_LENGTH
+
 
 def make_progress_bar(current: int, total: int, width: int = 20) -> str:
     """Create a simple text progress bar.
@@ -258,9 +285,8 @@ def make_progress_bar(current: int, total: int, width: int = 20) -> str:
     Returns:
         Progress bar string like "[████████░░░░░░░░░░░░]"
     """
-    if total == 0:
-        return f"[{'░' * width}]"
-    
-    filled = int(width * current / total)
+    filled = min(max(int(width * current / total), 0), width) if total else 0
     empty = width - filled
-    return f"[{'█' * filled}{'░' * empty}]"
+    if width > _BAR_RUN_LENGTH:
+        return f"[{'█' * filled}{'░' * empty}]"
+    return f"[{_BAR_FULL[:filled]}{_BAR_EMPTY[:empty]}]"
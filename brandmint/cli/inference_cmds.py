@@ -0,0 +1,59 @@
+"""
+Brandmint CLI — `bm inference` inference subcommands.
+
+Loaded on demand by :class:`brandmint.cli.app.LazyGroup`.
+"""
+import typer
+from pathlib import Path
+from typing import Optional
+
+from ._options import CONFIG_OPTION
+
+app = typer.Typer(name="inference", help="Inference visual integration tools", no_args_is_help=True)
+
+
+@app.command("doctor")
+def inference_doctor(
+    config: Path = CONFIG_OPTION,
+    strict: bool = typer.Option(False, "--strict", help="Exit non-zero if warnings/failures are found"),
+    json_output: bool = typer.Option(False, "--json", help="Output JSON"),
+):
+    """Run inference backend diagnostics."""
+    from .inference import run_doctor
+
+    code = run_doctor(config=config, strict=strict, json_output=json_output)
+    if code != 0:
+        raise typer.Exit(code=code)
+
+
+@app.command("route-test")
+def inference_route_test(
+    config: Path = CONFIG_OPTION,
+    batch: str = typer.Option("products", "--batch", "-b", help="Batch name for route preview"),
+    assets: str = typer.Option(..., "--assets", "-a", help="Comma-separated asset IDs"),
+    json_output: bool = typer.Option(False, "--json", help="Output JSON"),
+):
+    """Preview semantic route decisions for specific assets."""
+    from .inference import run_route_test
+
+    code = run_route_test(config=config, batch=batch, assets=assets, json_output=json_output)
+    if code != 0:
+        raise typer.Exit(code=code)
+
+
+@app.command("rerun-failed")
+def inference_rerun_failed(
+    config: Path = CONFIG_OPTION,
+    runbook: Path = typer.Option(..., "--runbook", help="Runbook JSON path"),
+    backend: Optional[str] = typer.Option(
+        None,
+        "--backend",
+        help="Override rerun backend: scripts|inference (default uses runbook recommendation)",
+    ),
+):
+    """Rerun failed assets from an inference runbook."""
+    from .inference import run_rerun_failed
+
+    code = run_rerun_failed(config=config, runbook=runbook, backend_override=backend)
+    if code != 0:
+        raise typer.Exit(code=code)
@@ -0,0 +1,24 @@
+"""
+Brandmint CLI — `bm install` install subcommands.
+
+Loaded on demand by :class:`brandmint.cli.app.LazyGroup`.
+"""
+import typer
+
+from .app import _console
+
+app = typer.Typer(name="install", help="Installation and setup utilities", no_args_is_help=True)
+
+
+@app.command("skills")
+def install_skills():
+    """Create skill symlinks in ~/.claude/skills/."""
+    from ..installer.setup_skills import install_skills as _install
+    _install(console=_console())
+
+
+@app.command("check")
+def install_check():
+    """Verify brandmint installation is complete."""
+    from ..installer.setup_skills import check_installation
+    check_installation(console=_console())
@@ -26,21 +26,21 @@ Init (``bm init``):
 """
 from __future__ import annotations
 
+import copy
 import json
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 import yaml
 from rich.console import Console
-from rich.prompt import Prompt
-from rich.table import Table
 
-from ..config_approval import build_approval_error, config_launch_status
-from ..core.kickstarter_blueprint import (
-    MANDATORY_KICKSTARTER_SECTIONS,
-    build_kickstarter_readiness_from_outputs,
-)
+from ..core.yaml_compat import YamlDumper as _YamlDumper, YamlLoader as _YamlLoader
+
+# Pipeline, planner, UI and model imports are deferred to the branches that
+# need them so `bm init` and the --json fast path stay light.
 
 console = Console()
 
@@ -77,14 +77,7 @@ def run_launch(
         inference_only_visual: Force inference visual backend for visual batches.
         inference_rollout_mode: Optional rollout override (ring0|ring1|ring2).
     """
-    from ..cli.ui import (
-        render_brand_banner,
-        render_scenario_cards,
-        render_wave_table,
-        render_cost_summary,
-        prompt_scenario_selection,
-        prompt_wave_selection,
-    )
+    from ..config_approval import build_approval_error, config_launch_status
     from ..core.wave_planner import compute_wave_plan
 
     # -- 1. Load brand config -----------------------------------------------
@@ -111,6 +104,15 @@ def run_launch(
         _print_json(cfg, wave_plan, scenario, depth)
         return
 
+    from .ui import (
+        render_brand_banner,
+        render_scenario_cards,
+        render_wave_table,
+        render_cost_summary,
+        prompt_scenario_selection,
+        prompt_wave_selection,
+    )
+
     # -- 3. Brand banner -----------------------------------------------------
     render_brand_banner(cfg, console)
 
@@ -126,13 +128,11 @@ def run_launch(
         else:
             # Non-interactive: use first recommended scenario
             from ..core.context_analyzer import ContextAnalyzer
-            from ..core.scenario_recommender import ScenarioRecommender
             product = _build_product_from_config(cfg)
             analyzer = ContextAnalyzer()
             context = analyzer.analyze(product)
             product.launch_context = context
-            recommender = ScenarioRecommender()
-            matches = recommender.recommend(product, context, limit=1)
+            matches = _recommender().recommend(product, context, limit=1)
             if matches:
                 selected_scenario_id = matches[0].scenario_id
                 scenario_obj = _get_scenario_by_id(selected_scenario_id)
@@ -228,12 +228,12 @@ def run_launch(
 
     # -- 11. Webhook notification --------------------------------------------
     if webhook:
-        from .notifications import send_webhook_notification
+        from .notifications import enqueue_webhook_notification
         brand_name = cfg.get("brand", {}).get("name", "Unknown")
         success = all(
             w.get("status") == "completed" for w in state.waves.values()
         )
-        send_webhook_notification(
+        enqueue_webhook_notification(
             webhook,
             brand_name=brand_name,
             success=success,
@@ -243,8 +243,54 @@ def run_launch(
     console.print("\n[bold green]Launch complete.[/bold green]\n")
 
 
+# Skeleton written by `bm init`; run_init deep-copies it and fills in the
+# answers from the questionnaire.
+_INIT_TEMPLATE: dict = {
+    "execution_context": {
+        "budget_tier": "lean",
+        "launch_channel": "dtc",
+        "maturity_stage": "pre-launch",
+        "depth_level": "focused",
+        "tone": "conversion-focused",
+        "quality_bar": "standard",
+    },
+    "brand": {
+        "name": "",
+        "tagline": "",
+        "archetype": "",
+        "voice": "",
+        "domain": "",
+        "domain_tags": [],
+    },
+    "theme": {
+        "name": "",
+        "description": "",
+        "metaphor": "",
+        "mood_keywords": [],
+    },
+    "palette": {
+        "primary": {"name": "", "hex": "#000000", "role": "60% backgrounds"},
+        "secondary": {"name": "", "hex": "#FFFFFF", "role": "30% text and surfaces"},
+        "accent": {"name": "", "hex": "#FF0000", "role": "10% CTAs and highlights"},
+    },
+    "typography": {
+        "header": {"font": "Inter", "weights": ["Regular", "Bold"]},
+        "body": {"font": "Inter", "weights": ["Regular"]},
+    },
+    "generation": {
+        "output_dir": "generated",
+        "seeds": [42, 137],
+        "resolution": "2K",
+        "output_format": "png",
+        "env_file": "~/.claude/.env",
+    },
+}
+
+
 def run_init(output: Path) -> None:
     """Interactive brand config initializer."""
+    from rich.prompt import Prompt
+
     console.print("\n[bold cyan]Brandmint -- Brand Config Initializer[/bold cyan]\n")
 
     brand_name = Prompt.ask("Brand name")
@@ -267,51 +313,26 @@ def run_init(output: Path) -> None:
 
     tags_list = [t.strip() for t in domain_tags.split(",") if t.strip()]
 
-    config = {
-        "execution_context": {
-            "budget_tier": "lean",
-            "launch_channel": channel,
-            "maturity_stage": "pre-launch",
-            "depth_level": depth,
-            "tone": "conversion-focused",
-            "quality_bar": "standard",
-        },
-        "brand": {
-            "name": brand_name,
-            "tagline": tagline,
-            "archetype": "",
-            "voice": "",
-            "domain": domain,
-            "domain_tags": tags_list,
-        },
-        "theme": {
-            "name": "",
-            "description": "",
-            "metaphor": "",
-            "mood_keywords": [],
-        },
-        "palette": {
-            "primary": {"name": "", "hex": "#000000", "role": "60% backgrounds"},
-            "secondary": {"name": "", "hex": "#FFFFFF", "role": "30% text and surfaces"},
-            "accent": {"name": "", "hex": "#FF0000", "role": "10% CTAs and highlights"},
-        },
-        "typography": {
-            "header": {"font": "Inter", "weights": ["Regular", "Bold"]},
-            "body": {"font": "Inter", "weights": ["Regular"]},
-        },
-        "generation": {
-            "output_dir": "generated",
-            "seeds": [42, 137],
-            "resolution": "2K",
-            "output_format": "png",
-            "env_file": "~/.claude/.env",
-        },
-    }
+    config = copy.deepcopy(_INIT_TEMPLATE)
+    ec = config["execution_context"]
+    ec["launch_channel"] = channel
+    ec["depth_level"] = depth
+    brand = config["brand"]
+    brand["name"] = brand_name
+    brand["tagline"] = tagline
+    brand["domain"] = domain
+    brand["domain_tags"] = tags_list
 
     out = Path(output)
-    out.write_text(
-        yaml.dump(config, default_flow_style=False, allow_unicode=True, sort_keys=False)
-    )
+    with out.open("w", encoding="utf-8") as fh:
+        yaml.dump(
+            config,
+            fh,
+            Dumper=_YamlDumper,
+            default_flow_style=False,
+            allow_unicode=True,
+            sort_keys=False,
+        )
     console.print(f"\n[green]Config saved to:[/green] {out.resolve()}")
     console.print("[dim]Edit the file to fill in palette, typography, and theme.[/dim]\n")
 
@@ -323,6 +344,11 @@ def run_init(output: Path) -> None:
 
 def _render_kickstarter_readiness_snapshot(cfg: dict, brand_dir: Path) -> None:
     """Render current mandatory Kickstarter section coverage when relevant."""
+    from ..core.kickstarter_blueprint import (
+        MANDATORY_KICKSTARTER_SECTIONS,
+        build_kickstarter_readiness_from_outputs,
+    )
+
     outputs_dir = brand_dir / ".brandmint" / "outputs"
     readiness = build_kickstarter_readiness_from_outputs(outputs_dir)
     completed_sections = sum(
@@ -335,6 +361,8 @@ def _render_kickstarter_readiness_snapshot(cfg: dict, brand_dir: Path) -> None:
     if launch_channel != "kickstarter" and not has_progress:
         return
 
+    from rich.table import Table
+
     table = Table(title="Kickstarter Prototype Readiness", show_header=True, header_style="bold magenta")
     table.add_column("Section")
     table.add_column("Coverage", justify="right")
@@ -352,16 +380,71 @@ def _render_kickstarter_readiness_snapshot(cfg: dict, brand_dir: Path) -> None:
     )
 
 
+def _config_cache_path(config_path: Path) -> Path:
+    """JSON sidecar for a parsed config, kept in the brand's .brandmint dir."""
+    return config_path.parent / ".brandmint" / f"{config_path.name}.cache.json"
+
+
+def _read_config_cache(cache_path: Path, source_stat) -> Optional[dict]:
+    """Return the cached config if it was built from this exact file version."""
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(cached, dict)
+        or cached.get("mtime_ns") != source_stat.st_mtime_ns
+        or cached.get("size") != source_stat.st_size
+    ):
+        return None
+    cfg = cached.get("config")
+    return cfg if isinstance(cfg, dict) else None
+
+
+def _write_config_cache(cache_path: Path, source_stat, cfg: dict) -> None:
+    """Atomically write the JSON sidecar; skip configs JSON can't represent."""
+    try:
+        payload = json.dumps(
+            {"mtime_ns": source_stat.st_mtime_ns, "size": source_stat.st_size, "config": cfg}
+        )
+    except (TypeError, ValueError):
+        return
+    # Dates, non-string keys, etc. would not round-trip through JSON.
+    if json.loads(payload)["config"] != cfg:
+        return
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(payload, encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+
 def _load_config(config_path: Path) -> dict:
-    """Load and validate brand config YAML."""
-    if not config_path.exists():
+    """Load and validate brand config YAML.
+
+    Parsed configs are cached as JSON under ``.brandmint/`` next to the
+    config and reused while the YAML's mtime and size are unchanged.
+    """
+    try:
+        source_stat = config_path.stat()
+    except OSError:
         console.print(f"[red]Config not found: {config_path}[/red]")
         sys.exit(1)
+
+    cache_path = _config_cache_path(config_path)
+    cfg = _read_config_cache(cache_path, source_stat)
+    if cfg is not None:
+        return cfg
+
     with open(config_path) as f:
-        cfg = yaml.safe_load(f)
+        cfg = yaml.load(f, Loader=_YamlLoader)
     if not isinstance(cfg, dict):
         console.print("[red]Invalid config: expected YAML dict[/red]")
         sys.exit(1)
+    _write_config_cache(cache_path, source_stat, cfg)
     return cfg
 
 
@@ -390,28 +473,15 @@ def _build_product_from_config(cfg: dict):
         LaunchContext,
         LaunchChannel,
         BudgetTier,
+        CONFIG_BUDGET_TIERS,
+        CONFIG_LAUNCH_CHANNELS,
     )
 
     brand = cfg.get("brand", {})
     ec = cfg.get("execution_context", {})
 
-    channel_map = {
-        "kickstarter": LaunchChannel.KICKSTARTER,
-        "indiegogo": LaunchChannel.INDIEGOGO,
-        "dtc": LaunchChannel.DTC,
-        "saas": LaunchChannel.SAAS,
-        "enterprise": LaunchChannel.ENTERPRISE,
-        "organic": LaunchChannel.ORGANIC,
-    }
-    channel = channel_map.get(ec.get("launch_channel", "dtc"), LaunchChannel.DTC)
-
-    budget_map = {
-        "bootstrapped": BudgetTier.BOOTSTRAPPED,
-        "lean": BudgetTier.LEAN,
-        "standard": BudgetTier.STANDARD,
-        "premium": BudgetTier.PREMIUM,
-    }
-    budget_tier = budget_map.get(ec.get("budget_tier", "standard"), BudgetTier.STANDARD)
+    channel = CONFIG_LAUNCH_CHANNELS.get(ec.get("launch_channel", "dtc"), LaunchChannel.DTC)
+    budget_tier = CONFIG_BUDGET_TIERS.get(ec.get("budget_tier", "standard"), BudgetTier.STANDARD)
 
     return ProductData(
         brand=ProductBrand(
@@ -438,7 +508,7 @@ def _recommend_and_select(cfg: dict, render_cards, prompt_select) -> tuple:
         ``(selected_scenario_id, scenario_object)`` tuple.
     """
     from ..core.context_analyzer import ContextAnalyzer
-    from ..core.scenario_recommender import ScenarioRecommender
+    from .ui import normalize_matches
 
     # Build ProductData from config.
     product = _build_product_from_config(cfg)
@@ -449,8 +519,9 @@ def _recommend_and_select(cfg: dict, render_cards, prompt_select) -> tuple:
     product.launch_context = context
 
     # Recommend scenarios.
-    recommender = ScenarioRecommender()
-    matches = recommender.recommend(product, context, limit=3)
+    recommender = _recommender()
+    # Normalized once; both the cards and the picker read the plain rows.
+    matches = normalize_matches(recommender.recommend(product, context, limit=3))
 
     # Display recommendation cards.
     all_scenarios = recommender.scenarios
@@ -464,15 +535,17 @@ def _recommend_and_select(cfg: dict, render_cards, prompt_select) -> tuple:
     return selected_id, scenario_obj
 
 
-def _get_scenario_by_id(scenario_id: str):
-    """Retrieve a Scenario object from the catalog.  Returns None on miss."""
+@lru_cache(maxsize=1)
+def _recommender():
+    """Shared ScenarioRecommender; its scenario catalog is built once per process."""
     from ..core.scenario_recommender import ScenarioRecommender
 
-    try:
-        recommender = ScenarioRecommender()
-        return recommender.get_scenario(scenario_id)
-    except (ValueError, Exception):
-        return None
+    return ScenarioRecommender()
+
+
+def _get_scenario_by_id(scenario_id: str):
+    """Retrieve a Scenario object from the catalog.  Returns None on miss."""
+    return _recommender().find_scenario(scenario_id)
 
 
 def _build_execution_context(scenario_obj, cfg: dict):
@@ -532,12 +605,11 @@ def _parse_wave_range(waves_str: Optional[str]) -> Optional[range]:
         return None
 
     try:
-        if "-" in waves_str:
-            start, end = waves_str.split("-", 1)
-            return range(int(start.strip()), int(end.strip()) + 1)
-        else:
-            n = int(waves_str)
-            return range(n, n + 1)
+        start, sep, end = waves_str.partition("-")
+        if sep:
+            return range(int(start), int(end) + 1)
+        n = int(waves_str)
+        return range(n, n + 1)
     except ValueError:
         console.print(f"[red]Invalid wave range: '{waves_str}'[/red]")
         return None
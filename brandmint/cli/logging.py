@@ -20,9 +20,9 @@ Usage:
 
 import logging
 import sys
+import time
 from pathlib import Path
 from typing import Optional
-from datetime import datetime
 
 from rich.logging import RichHandler
 from rich.console import Console
@@ -34,8 +34,17 @@ from rich.text import Text
 # ---------------------------------------------------------------------------
 
 _configured = False
+_config_key: Optional[tuple] = None
 _log_file: Optional[Path] = None
 
+# Default target for the log_* helpers; loggers are never garbage collected,
+# so binding it once is safe and skips getLogger's lock on every call.
+_ROOT_LOGGER = logging.getLogger("brandmint")
+
+# Section headers pad titles to a fixed width with this run of dashes.
+_SECTION_WIDTH = 50
+_DASHES = "─" * _SECTION_WIDTH
+
 
 # ---------------------------------------------------------------------------
 # Custom formatter for file output
@@ -79,7 +88,16 @@ def setup_logging(
         def main(verbose: bool = False, debug: bool = False):
             setup_logging(verbose=verbose, debug=debug)
     """
-    global _configured, _log_file
+    global _configured, _config_key, _log_file
+    
+    # Get root brandmint logger
+    root_logger = _ROOT_LOGGER
+    
+    # Re-entry with identical settings: keep the existing handlers (and the
+    # open log file) instead of tearing them down and rebuilding them.
+    config_key = (verbose, debug, quiet, log_file, console)
+    if _configured and config_key == _config_key and root_logger.handlers:
+        return root_logger
     
     # Determine log level
     if debug:
@@ -91,11 +109,11 @@ def setup_logging(
     else:
         level = logging.INFO
     
-    # Get root brandmint logger
-    root_logger = logging.getLogger("brandmint")
     root_logger.setLevel(level)
     
     # Clear existing handlers
+    for handler in root_logger.handlers:
+        handler.close()
     root_logger.handlers.clear()
     
     # Rich console handler
@@ -127,7 +145,7 @@ def setup_logging(
         file_handler.setFormatter(BrandmintFormatter(file_format))
         root_logger.addHandler(file_handler)
         
-        root_logger.debug(f"Logging to file: {_log_file}")
+        root_logger.debug("Logging to file: %s", _log_file)
     
     # Suppress noisy third-party loggers
     logging.getLogger("urllib3").setLevel(logging.WARNING)
@@ -135,6 +153,7 @@ def setup_logging(
     logging.getLogger("httpcore").setLevel(logging.WARNING)
     
     _configured = True
+    _config_key = config_key
     return root_logger
 
 
@@ -174,9 +193,9 @@ def log_section(title: str, logger: Optional[logging.Logger] = None) -> None:
         title: Section title
         logger: Optional logger (uses root brandmint logger if not provided)
     """
-    logger = logger or get_logger("brandmint")
+    logger = logger or _ROOT_LOGGER
     logger.info("")
-    logger.info(f"[bold cyan]{'─' * 3} {title} {'─' * (50 - len(title))}[/bold cyan]")
+    logger.info("[bold cyan]─── %s %s[/bold cyan]", title, _DASHES[len(title):])
 
 
 def log_key_value(
@@ -193,8 +212,8 @@ def log_key_value(
         logger: Optional logger
         level: Log level
     """
-    logger = logger or get_logger("brandmint")
-    logger.log(level, f"  [cyan]{key}:[/cyan] {value}")
+    logger = logger or _ROOT_LOGGER
+    logger.log(level, "  [cyan]%s:[/cyan] %s", key, value)
 
 
 def log_progress(
@@ -211,26 +230,26 @@ def log_progress(
         message: Progress message
         logger: Optional logger
     """
-    logger = logger or get_logger("brandmint")
-    logger.info(f"  [{current}/{total}] {message}")
+    logger = logger or _ROOT_LOGGER
+    logger.info("  [%d/%d] %s", current, total, message)
 
 
 def log_success(message: str, logger: Optional[logging.Logger] = None) -> None:
     """Log a success message with green checkmark."""
-    logger = logger or get_logger("brandmint")
-    logger.info(f"[green]✓[/green] {message}")
+    logger = logger or _ROOT_LOGGER
+    logger.info("[green]✓[/green] %s", message)
 
 
 def log_failure(message: str, logger: Optional[logging.Logger] = None) -> None:
     """Log a failure message with red X."""
-    logger = logger or get_logger("brandmint")
-    logger.error(f"[red]✗[/red] {message}")
+    logger = logger or _ROOT_LOGGER
+    logger.error("[red]✗[/red] %s", message)
 
 
 def log_warning(message: str, logger: Optional[logging.Logger] = None) -> None:
     """Log a warning message with yellow icon."""
-    logger = logger or get_logger("brandmint")
-    logger.warning(f"[yellow]⚠[/yellow] {message}")
+    logger = logger or _ROOT_LOGGER
+    logger.warning("[yellow]⚠[/yellow] %s", message)
 
 
 # ---------------------------------------------------------------------------
@@ -253,26 +272,31 @@ class LoggedOperation:
         level: int = logging.INFO,
     ):
         self.operation = operation
-        self.logger = logger or get_logger("brandmint")
+        self.logger = logger or _ROOT_LOGGER
         self.level = level
-        self.start_time: Optional[datetime] = None
+        self.start_time: Optional[float] = None  # time.perf_counter() value
     
     def __enter__(self):
-        self.start_time = datetime.now()
-        self.logger.log(self.level, f"{self.operation}...")
+        self.start_time = time.perf_counter()
+        self.logger.log(self.level, "%s...", self.operation)
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        duration = (datetime.now() - self.start_time).total_seconds()
+        duration = time.perf_counter() - self.start_time
         
         if exc_type is None:
             self.logger.log(
                 self.level,
-                f"{self.operation}... [green]done[/green] ({duration:.1f}s)"
+                "%s... [green]done[/green] (%.1fs)",
+                self.operation,
+                duration,
             )
         else:
             self.logger.error(
-                f"{self.operation}... [red]failed[/red] ({duration:.1f}s): {exc_val}"
+                "%s... [red]failed[/red] (%.1fs): %s",
+                self.operation,
+                duration,
+                exc_val,
             )
         
         return False  # Don't suppress exceptions
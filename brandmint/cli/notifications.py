@@ -14,17 +14,35 @@ Usage:
     notify_error("Tryambakam Noesis", "API rate limit exceeded")
 """
 
+import atexit
+import json
 import platform
+import random
 import subprocess
 import logging
-from typing import Optional
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Callable, Optional
+from urllib.parse import urlsplit
 
 logger = logging.getLogger(__name__)
 
 
+def _applescript_quote(text: str) -> str:
+    """Quote text as an AppleScript string literal."""
+    return '"' + text.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
 def _macos_notify(title: str, message: str, sound: bool = True) -> bool:
     """Send notification on macOS using osascript.
     
+    NSAppleScript is not an option here: it must run on the main thread,
+    and notifications are delivered from the background worker.
+    
     Args:
         title: Notification title
         message: Notification body text
@@ -33,11 +51,14 @@ def _macos_notify(title: str, message: str, sound: bool = True) -> bool:
     Returns:
         True if notification was sent successfully
     """
+    script = (
+        f"display notification {_applescript_quote(message)} "
+        f"with title {_applescript_quote(title)}"
+    )
+    if sound:
+        script += ' sound name "Glass"'
+
     try:
-        script = f'display notification "{message}" with title "{title}"'
-        if sound:
-            script += ' sound name "Glass"'
-        
         subprocess.run(
             ["osascript", "-e", script],
             capture_output=True,
@@ -49,16 +70,64 @@ def _macos_notify(title: str, message: str, sound: bool = True) -> bool:
         return False
 
 
-def _linux_notify(title: str, message: str) -> bool:
-    """Send notification on Linux using notify-send.
+def _linux_notify_in_process(title: str, message: str) -> Optional[bool]:
+    """Call org.freedesktop.Notifications over D-Bus via jeepney.
+
+    Returns None when jeepney is not installed or no session bus is
+    reachable, so the caller can fall back to notify-send.
+    """
+    try:
+        from jeepney import DBusAddress, MessageType, new_method_call
+        from jeepney.io.blocking import open_dbus_connection
+    except ImportError:
+        return None
+
+    address = DBusAddress(
+        "/org/freedesktop/Notifications",
+        bus_name="org.freedesktop.Notifications",
+        interface="org.freedesktop.Notifications",
+    )
+    # Notify(app_name, replaces_id, app_icon, summary, body, actions, hints, expire_timeout)
+    call = new_method_call(
+        address,
+        "Notify",
+        "susssasa{sv}i",
+        ("brandmint", 0, "", title, message, [], {}, -1),
+    )
+    try:
+        with open_dbus_connection(bus="SESSION") as connection:
+            reply = connection.send_and_get_reply(call, timeout=5)
+    except (OSError, KeyError) as e:
+        # No session bus (headless/SSH) or no notification daemon.
+        logger.debug(f"D-Bus notification unavailable: {e}")
+        return None
+    except Exception as e:
+        logger.debug(f"Linux notification failed: {e}")
+        return False
+    if reply.header.message_type == MessageType.error:
+        # e.g. ServiceUnknown when no notification daemon is running.
+        logger.debug(f"D-Bus notification rejected: {reply.body}")
+        return None
+    return True
+
+
+def _linux_notify(title: str, message: str, sound: bool = True) -> bool:
+    """Send notification on Linux.
+    
+    Uses D-Bus in-process (jeepney) when available, otherwise notify-send.
     
     Args:
         title: Notification title
         message: Notification body text
+        sound: Accepted for signature parity with macOS; ignored
         
     Returns:
         True if notification was sent successfully
     """
+    sent = _linux_notify_in_process(title, message)
+    if sent is not None:
+        return sent
+
     try:
         subprocess.run(
             ["notify-send", title, message],
@@ -71,11 +140,33 @@ def _linux_notify(title: str, message: str) -> bool:
         return False
 
 
+_SYSTEM = platform.system()
+
+# Platform notifier, resolved once; None where notifications are unsupported.
+_NOTIFIER: Optional[Callable[[str, str, bool], bool]] = (
+    _macos_notify if _SYSTEM == "Darwin" else _linux_notify if _SYSTEM == "Linux" else None
+)
+
+# Single background worker: notifications are delivered in order without
+# blocking the pipeline on a desktop RPC or subprocess timeout.
+_NOTIFY_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="brandmint-notify")
+atexit.register(_NOTIFY_POOL.shutdown, wait=False)
+
+
+def _deliver(notifier: Callable[..., bool], *args) -> None:
+    """Run a platform notifier on the worker thread, logging any failure."""
+    try:
+        if not notifier(*args):
+            logger.debug("Notification was not delivered")
+    except Exception as e:
+        logger.debug(f"Notification error: {e}")
+
+
 def send_notification(title: str, message: str, sound: bool = True) -> bool:
     """Send a system notification (cross-platform).
     
-    Automatically detects the platform and uses the appropriate
-    notification mechanism.
+    Uses the notification mechanism for the current platform. Delivery
+    happens on a background thread.
     
     Args:
         title: Notification title
@@ -83,19 +174,17 @@ def send_notification(title: str, message: str, sound: bool = True) -> bool:
         sound: Play notification sound (macOS only)
         
     Returns:
-        True if notification was sent successfully
+        True if the notification was queued for delivery
     """
-    system = platform.system()
-    
-    if system == "Darwin":
-        return _macos_notify(title, message, sound)
-    elif system == "Linux":
-        return _linux_notify(title, message)
-    else:
+    notifier = _NOTIFIER
+    if notifier is None:
         # Windows or unknown - skip notification
-        logger.debug(f"Notifications not supported on {system}")
+        logger.debug(f"Notifications not supported on {_SYSTEM}")
         return False
 
+    _NOTIFY_POOL.submit(_deliver, notifier, title, message, sound)
+    return True
+
 
 def notify_completion(
     brand_name: str,
@@ -186,6 +275,220 @@ def notify_waiting_for_input(brand_name: str, skill_id: str) -> bool:
 # Webhook Notifications
 # =============================================================================
 
+# orjson (optional, brandmint[notifications]) encodes straight to bytes;
+# stdlib json is the fallback.
+try:
+    from orjson import dumps as _json_bytes
+except ImportError:
+    def _json_bytes(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+_WEBHOOK_TIMEOUT = 10.0
+_WEBHOOK_RETRIES = 3
+_WEBHOOK_BACKOFF_BASE = 1.0
+_WEBHOOK_BACKOFF_MAX = 30.0
+_WEBHOOK_JITTER = 0.5
+_RETRYABLE_STATUS = frozenset({408, 429, 500, 502, 503, 504})
+
+
+@lru_cache(maxsize=1)
+def _webhook_session():
+    """Shared HTTP session so repeat posts to a webhook host reuse its connection."""
+    import requests
+
+    session = requests.Session()
+    session.headers["Content-Type"] = "application/json"
+    return session
+
+
+def _retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given as delta-seconds or an HTTP-date."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Exponential backoff with jitter so concurrent pipelines don't retry in step."""
+    delay = min(_WEBHOOK_BACKOFF_BASE * (2 ** attempt), _WEBHOOK_BACKOFF_MAX)
+    return delay * (1 + random.random() * _WEBHOOK_JITTER)
+
+
+class _TokenBucket:
+    """Blocking token bucket: bursts up to ``capacity``, refills at ``rate``/s."""
+
+    def __init__(self, capacity: int, rate: float):
+        self.capacity = capacity
+        self.rate = rate
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until one is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+# (capacity, refill per second) by webhook kind, matching the documented
+# Slack (1 req/s) and Discord (5 req/2s) webhook limits.
+_RATE_LIMITS = {
+    "slack": (1, 1.0),
+    "discord": (5, 2.5),
+    "generic": (10, 10.0),
+}
+_BUCKETS: dict = {}
+_BUCKETS_LOCK = threading.Lock()
+
+
+def _rate_limiter(webhook_url: str) -> _TokenBucket:
+    """Return the shared token bucket for the webhook's host."""
+    host = urlsplit(webhook_url).hostname or ""
+    with _BUCKETS_LOCK:
+        bucket = _BUCKETS.get(host)
+        if bucket is None:
+            bucket = _BUCKETS[host] = _TokenBucket(*_RATE_LIMITS[_classify_webhook_url(webhook_url)])
+    return bucket
+
+
+def _post_webhook(webhook_url: str, data: bytes) -> bool:
+    """POST a JSON body, retrying transient failures with backoff.
+
+    Connection errors, timeouts and 408/429/5xx responses are retried up
+    to ``_WEBHOOK_RETRIES`` times; other 4xx responses fail immediately.
+    """
+    import requests
+
+    session = _webhook_session()
+    bucket = _rate_limiter(webhook_url)
+    for attempt in range(_WEBHOOK_RETRIES + 1):
+        retry_after = None
+        bucket.acquire()
+        try:
+            response = session.post(webhook_url, data=data, timeout=_WEBHOOK_TIMEOUT)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            error = str(e)
+        except requests.RequestException as e:
+            error = str(e)
+            break
+        else:
+            status = response.status_code
+            if status in (200, 204):
+                return True
+            error = f"HTTP {status}"
+            if status not in _RETRYABLE_STATUS:
+                break
+            if status in (429, 503):
+                retry_after = _retry_after_seconds(response.headers.get("Retry-After"))
+
+        if attempt == _WEBHOOK_RETRIES:
+            break
+        delay = retry_after if retry_after is not None else _backoff_delay(attempt)
+        delay = min(delay, _WEBHOOK_BACKOFF_MAX)
+        logger.debug(f"Webhook attempt {attempt + 1} failed ({error}); retrying in {delay:.1f}s")
+        time.sleep(delay)
+
+    logger.warning(f"Webhook notification failed: {error}")
+    return False
+
+
+_SLACK_HOSTS = frozenset({"hooks.slack.com", "slack.com"})
+_DISCORD_HOSTS = frozenset(
+    {"discord.com", "discordapp.com", "ptb.discord.com", "canary.discord.com"}
+)
+
+
+@lru_cache(maxsize=512)
+def _classify_webhook_url(webhook_url: str) -> str:
+    """Return the payload format for a webhook URL: slack, discord or generic.
+
+    Only the hostname is compared, so a generic endpoint that merely
+    mentions slack.com in its path or query is not misdetected.
+    """
+    host = urlsplit(webhook_url).hostname or ""
+    if host in _SLACK_HOSTS:
+        return "slack"
+    if host in _DISCORD_HOSTS:
+        return "discord"
+    return "generic"
+
+
+# Per-outcome text, fixed at import so each payload needs one substitution.
+_STATUS_TEXT = {True: ("✅", "completed successfully"), False: ("❌", "failed")}
+_SLACK_HEADLINE = {
+    ok: f"{emoji} *Brandmint Pipeline {text}*" for ok, (emoji, text) in _STATUS_TEXT.items()
+}
+_SLACK_SUMMARY = {
+    ok: f"{emoji} *%s* pipeline {text}\n• Waves completed: %s\n"
+    for ok, (emoji, text) in _STATUS_TEXT.items()
+}
+_DISCORD_TITLE = {ok: f"Brandmint Pipeline {text.title()}" for ok, (_, text) in _STATUS_TEXT.items()}
+_DISCORD_STATUS = {ok: f"{emoji} {text}" for ok, (emoji, text) in _STATUS_TEXT.items()}
+
+
+def _slack_payload(brand_name: str, success: bool, waves_completed: int, message: Optional[str]) -> dict:
+    success = bool(success)
+    text = _SLACK_SUMMARY[success] % (brand_name, waves_completed)
+    if message:
+        text += f"• {message}"
+    return {
+        "text": _SLACK_HEADLINE[success],
+        "blocks": [{"type": "section", "text": {"type": "mrkdwn", "text": text}}],
+    }
+
+
+def _discord_payload(brand_name: str, success: bool, waves_completed: int, message: Optional[str]) -> dict:
+    success = bool(success)
+    fields = [
+        {"name": "Status", "value": _DISCORD_STATUS[success], "inline": True},
+        {"name": "Waves", "value": str(waves_completed), "inline": True},
+    ]
+    if message:
+        fields.append({"name": "Note", "value": message})
+    return {
+        "embeds": [{
+            "title": _DISCORD_TITLE[success],
+            "description": f"{brand_name}",
+            "color": 0x00FF00 if success else 0xFF0000,
+            "fields": fields,
+        }]
+    }
+
+
+def _generic_payload(brand_name: str, success: bool, waves_completed: int, message: Optional[str]) -> dict:
+    return {
+        "event": "brandmint.pipeline.complete",
+        "brand": brand_name,
+        "success": success,
+        "waves_completed": waves_completed,
+        "message": message,
+    }
+
+
+_PAYLOAD_BUILDERS: dict = {
+    "slack": _slack_payload,
+    "discord": _discord_payload,
+    "generic": _generic_payload,
+}
+
+
 def send_webhook_notification(
     webhook_url: str,
     brand_name: str,
@@ -207,69 +510,47 @@ def send_webhook_notification(
     Returns:
         True if webhook was sent successfully
     """
-    import json
-    import urllib.request
-    import urllib.error
-    
-    status_emoji = "✅" if success else "❌"
-    status_text = "completed successfully" if success else "failed"
-    
-    # Detect webhook type from URL
-    if "slack.com" in webhook_url or "hooks.slack.com" in webhook_url:
-        # Slack format
-        payload = {
-            "text": f"{status_emoji} *Brandmint Pipeline {status_text}*",
-            "blocks": [
-                {
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": f"{status_emoji} *{brand_name}* pipeline {status_text}\n"
-                                f"• Waves completed: {waves_completed}\n"
-                                + (f"• {message}" if message else "")
-                    }
-                }
-            ]
-        }
-    elif "discord.com" in webhook_url or "discordapp.com" in webhook_url:
-        # Discord format
-        color = 0x00FF00 if success else 0xFF0000
-        payload = {
-            "embeds": [{
-                "title": f"Brandmint Pipeline {status_text.title()}",
-                "description": f"{brand_name}",
-                "color": color,
-                "fields": [
-                    {"name": "Status", "value": status_emoji + " " + status_text, "inline": True},
-                    {"name": "Waves", "value": str(waves_completed), "inline": True},
-                ],
-            }]
-        }
-        if message:
-            payload["embeds"][0]["fields"].append({"name": "Note", "value": message})
-    else:
-        # Generic JSON format
-        payload = {
-            "event": "brandmint.pipeline.complete",
-            "brand": brand_name,
-            "success": success,
-            "waves_completed": waves_completed,
-            "message": message,
-        }
-    
+    kind = _classify_webhook_url(webhook_url)
+    payload = _PAYLOAD_BUILDERS[kind](brand_name, success, waves_completed, message)
+
     try:
-        data = json.dumps(payload).encode("utf-8")
-        request = urllib.request.Request(
-            webhook_url,
-            data=data,
-            headers={"Content-Type": "application/json"},
-            method="POST",
-        )
-        with urllib.request.urlopen(request, timeout=10) as response:
-            return response.status == 200 or response.status == 204
-    except (urllib.error.URLError, urllib.error.HTTPError) as e:
-        logger.warning(f"Webhook notification failed: {e}")
-        return False
+        return _post_webhook(webhook_url, _json_bytes(payload))
     except Exception as e:
         logger.debug(f"Webhook error: {e}")
         return False
+
+
+# Webhooks queued with enqueue_webhook_notification are posted off the
+# caller's thread. Per-service semaphores cap concurrent posts to any one
+# provider; the executor's workers are joined at interpreter exit, so
+# queued notifications are still delivered after the pipeline returns.
+_WEBHOOK_POOL = ThreadPoolExecutor(max_workers=10, thread_name_prefix="brandmint-webhook")
+_WEBHOOK_SLOTS = {
+    "slack": threading.BoundedSemaphore(5),
+    "discord": threading.BoundedSemaphore(5),
+    "generic": threading.BoundedSemaphore(10),
+}
+
+
+def _send_webhook_in_slot(webhook_url: str, *args) -> bool:
+    with _WEBHOOK_SLOTS[_classify_webhook_url(webhook_url)]:
+        return send_webhook_notification(webhook_url, *args)
+
+
+def enqueue_webhook_notification(
+    webhook_url: str,
+    brand_name: str,
+    success: bool,
+    waves_completed: int,
+    message: Optional[str] = None,
+) -> "Future[bool]":
+    """Queue a webhook notification and return without waiting for it.
+
+    Takes the same arguments as :func:`send_webhook_notification`.
+
+    Returns:
+        Future resolving to True if the webhook was sent successfully
+    """
+    return _WEBHOOK_POOL.submit(
+        _send_webhook_in_slot, webhook_url, brand_name, success, waves_completed, message
+    )
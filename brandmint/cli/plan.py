@@ -2,48 +2,52 @@
 Brandmint CLI — Plan subcommands.
 Ported from orchv2 CLI (context analysis, scenario recommendation, comparison).
 """
+import copy
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
+
+import yaml
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
+from ..core.yaml_compat import YamlLoader as _YamlLoader
+
 console = Console()
 
 
+@lru_cache(maxsize=32)
+def _parse_brand_config(path: str, mtime_ns: int) -> dict:
+    """Parse a brand config; the mtime key drops stale entries after edits."""
+    with open(path) as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
 def _load_brand_config(config_path: Path) -> dict:
     """Load brand config YAML."""
-    import yaml
-    with open(config_path) as f:
-        return yaml.safe_load(f)
+    path = Path(config_path).resolve()
+    return copy.deepcopy(_parse_brand_config(str(path), path.stat().st_mtime_ns))
 
 
 def _build_product_from_config(cfg: dict):
     """Build orchv2 ProductData from brand-config.yaml."""
-    from ..models.product import ProductData, ProductBrand, LaunchContext, LaunchChannel, BudgetTier
+    from ..models.product import (
+        ProductData,
+        ProductBrand,
+        LaunchContext,
+        LaunchChannel,
+        BudgetTier,
+        CONFIG_BUDGET_TIERS,
+        CONFIG_LAUNCH_CHANNELS,
+    )
 
     brand = cfg.get("brand", {})
     ec = cfg.get("execution_context", {})
 
-    # Map channel string to enum
-    channel_map = {
-        "kickstarter": LaunchChannel.KICKSTARTER,
-        "indiegogo": LaunchChannel.INDIEGOGO,
-        "dtc": LaunchChannel.DTC,
-        "saas": LaunchChannel.SAAS,
-        "enterprise": LaunchChannel.ENTERPRISE,
-    }
-    channel = channel_map.get(ec.get("launch_channel", "dtc"), LaunchChannel.DTC)
-
-    # Map budget tier
-    budget_map = {
-        "bootstrapped": BudgetTier.BOOTSTRAPPED,
-        "lean": BudgetTier.LEAN,
-        "standard": BudgetTier.STANDARD,
-        "premium": BudgetTier.PREMIUM,
-    }
-    budget_tier = budget_map.get(ec.get("budget_tier", "standard"), BudgetTier.STANDARD)
+    channel = CONFIG_LAUNCH_CHANNELS.get(ec.get("launch_channel", "dtc"), LaunchChannel.DTC)
+    budget_tier = CONFIG_BUDGET_TIERS.get(ec.get("budget_tier", "standard"), BudgetTier.STANDARD)
 
     return ProductData(
         brand=ProductBrand(
@@ -63,6 +67,20 @@ def _build_product_from_config(cfg: dict):
     )
 
 
+@lru_cache(maxsize=1)
+def _analyzer():
+    """Shared ContextAnalyzer; it holds only its keyword tables."""
+    from ..core.context_analyzer import ContextAnalyzer
+    return ContextAnalyzer()
+
+
+@lru_cache(maxsize=1)
+def _recommender():
+    """Shared ScenarioRecommender, so its scenario catalog is built once."""
+    from ..core.scenario_recommender import ScenarioRecommender
+    return ScenarioRecommender()
+
+
 def run_context(config: Path):
     """Analyze brand context — detect 6 business dimensions."""
     console.print("\n[bold cyan]Analyzing Brand Context...[/bold cyan]\n")
@@ -70,10 +88,8 @@ def run_context(config: Path):
     cfg = _load_brand_config(config)
     product = _build_product_from_config(cfg)
 
-    from ..core.context_analyzer import ContextAnalyzer
-    analyzer = ContextAnalyzer()
-    context = analyzer.analyze(product)
-    explanations = analyzer.explain_detection(product, context)
+    context = _analyzer().analyze(product)
+    explanations = _analyzer().explain_detection(product, context)
 
     # Display
     budget_str = f"${context.budget_amount:,}" if context.budget_amount else context.budget_tier.value
@@ -105,14 +121,9 @@ def run_recommend(config: Path, limit: int = 3):
     cfg = _load_brand_config(config)
     product = _build_product_from_config(cfg)
 
-    from ..core.context_analyzer import ContextAnalyzer
-    from ..core.scenario_recommender import ScenarioRecommender
+    context = _analyzer().analyze(product)
 
-    analyzer = ContextAnalyzer()
-    context = analyzer.analyze(product)
-    product.launch_context = context
-
-    recommender = ScenarioRecommender()
+    recommender = _recommender()
     matches = recommender.recommend(product, context, limit=limit)
 
     # Compact context
@@ -158,10 +169,9 @@ def run_compare(scenarios_str: str):
     scenario_ids = [s.strip() for s in scenarios_str.split(",")]
     console.print("\n[bold cyan]Scenario Comparison[/bold cyan]\n")
 
-    from ..core.scenario_recommender import ScenarioRecommender
     from ..models.scenario import ScenarioType
 
-    recommender = ScenarioRecommender()
+    recommender = _recommender()
     table = Table(title="Scenario Comparison", show_header=True)
     table.add_column("Metric", style="cyan")
 
@@ -178,11 +188,16 @@ def run_compare(scenarios_str: str):
         console.print("[red]No valid scenarios to compare[/red]")
         return
 
-    table.add_row("Skills", *[str(len(s.skill_ids)) for s in scenario_objs])
-    table.add_row("Est. Cost", *[f"${s.estimated_cost_usd:,}" for s in scenario_objs])
-    table.add_row("Timeline", *[s.estimated_timeline_days for s in scenario_objs])
-    table.add_row("Budget Tier", *[s.best_for_budget.value for s in scenario_objs])
-    table.add_row("Quality", *[s.execution_context.quality_bar for s in scenario_objs])
+    # One pass over the scenarios, filling every metric row together.
+    rows = {"Skills": [], "Est. Cost": [], "Timeline": [], "Budget Tier": [], "Quality": []}
+    for s in scenario_objs:
+        rows["Skills"].append(str(len(s.skill_ids)))
+        rows["Est. Cost"].append(f"${s.estimated_cost_usd:,}")
+        rows["Timeline"].append(s.estimated_timeline_days)
+        rows["Budget Tier"].append(s.best_for_budget.value)
+        rows["Quality"].append(s.execution_context.quality_bar)
+    for metric, values in rows.items():
+        table.add_row(metric, *values)
 
     console.print(table)
     console.print()
@@ -0,0 +1,39 @@
+"""
+Brandmint CLI — `bm plan` plan subcommands.
+
+Loaded on demand by :class:`brandmint.cli.app.LazyGroup`.
+"""
+import typer
+from pathlib import Path
+
+from ._options import CONFIG_OPTION
+
+app = typer.Typer(name="plan", help="Scenario planning and context analysis", no_args_is_help=True)
+
+
+@app.command("context")
+def plan_context(
+    config: Path = CONFIG_OPTION,
+):
+    """Analyze brand context (budget, channel, maturity, timeline, team, depth)."""
+    from .plan import run_context
+    run_context(config)
+
+
+@app.command("recommend")
+def plan_recommend(
+    config: Path = CONFIG_OPTION,
+    limit: int = typer.Option(3, "--limit", "-l", help="Number of scenarios to recommend"),
+):
+    """Recommend execution scenarios based on detected context."""
+    from .plan import run_recommend
+    run_recommend(config, limit=limit)
+
+
+@app.command("compare")
+def plan_compare(
+    scenarios: str = typer.Option(..., "--scenarios", "-s", help="Comma-separated scenario IDs"),
+):
+    """Compare multiple scenarios side-by-side."""
+    from .plan import run_compare
+    run_compare(scenarios)
@@ -5,15 +5,26 @@ Post-pipeline publishing to NotebookLM.
 """
 from __future__ import annotations
 
+import copy
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Set
 
 import yaml
 from rich.console import Console
 
+from ..core.yaml_compat import YamlLoader as _YamlLoader
+
 console = Console()
 
 
+@lru_cache(maxsize=32)
+def _parse_config(path: str, mtime_ns: int) -> dict:
+    """Parse brand-config.yaml; the mtime key drops stale entries after edits."""
+    with open(path) as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
 def _load_config(config: Path):
     """Load and validate brand-config.yaml. Returns (config_path, cfg, brand_dir)."""
     config = config.resolve()
@@ -21,8 +32,8 @@ def _load_config(config: Path):
         console.print(f"[red]Config not found: {config}[/red]")
         raise SystemExit(1)
 
-    with open(config) as f:
-        cfg = yaml.safe_load(f)
+    # Callers apply CLI overrides in place, so hand out a private copy.
+    cfg = copy.deepcopy(_parse_config(str(config), config.stat().st_mtime_ns))
 
     brand_dir = config.parent
     return config, cfg, brand_dir
@@ -0,0 +1,41 @@
+"""
+Brandmint CLI — `bm publish` publish subcommands.
+
+Loaded on demand by :class:`brandmint.cli.app.LazyGroup`.
+"""
+import typer
+from pathlib import Path
+from typing import Optional
+
+from ._options import CONFIG_OPTION
+
+app = typer.Typer(name="publish", help="Post-pipeline publishing (NotebookLM)", no_args_is_help=True)
+
+
+@app.command("notebooklm")
+def publish_notebooklm(
+    config: Path = CONFIG_OPTION,
+    artifacts: Optional[str] = typer.Option(None, "--artifacts", "-a", help="Comma-separated artifact IDs (default: all)"),
+    force: bool = typer.Option(False, "--force", "-f", help="Recreate notebook from scratch"),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Show plan without executing"),
+    max_sources: int = typer.Option(50, "--max-sources", "-m", help="Max sources to upload (default: 50, NotebookLM Standard plan limit)"),
+    no_synthesize: bool = typer.Option(False, "--no-synthesize", help="Skip LLM prose synthesis, use mechanical rendering"),
+    synthesis_model: str = typer.Option("", "--synthesis-model", help="OpenRouter model for prose synthesis (default: claude-3.5-haiku)"),
+    clear_prose_cache: bool = typer.Option(False, "--clear-prose-cache", help="Clear cached synthesized prose before building"),
+    max_parallel: int = typer.Option(3, "--max-parallel", help="Max parallel artifact workers (default: 3)"),
+    source_profile: str = typer.Option("", "--source-profile", "-p", help="Source profile to use (brand-public, strategy-internal, kickstarter-conditional, debug-internal)"),
+):
+    """Publish brand intelligence to NotebookLM and generate artifacts."""
+    from .publish import run_notebooklm_publish
+    run_notebooklm_publish(
+        config,
+        artifacts=artifacts,
+        force=force,
+        dry_run=dry_run,
+        max_sources=max_sources,
+        no_synthesize=no_synthesize,
+        synthesis_model=synthesis_model,
+        clear_prose_cache=clear_prose_cache,
+        max_parallel=max_parallel,
+        source_profile=source_profile,
+    )
@@ -6,45 +6,50 @@ Unified skill registry management (text + visual + meta skills).
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional
 
+import yaml
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
 from ..core.skills_registry import SkillsRegistry
+from ..core.yaml_compat import YamlLoader as _YamlLoader
 
 console = Console()
 
 
-def _load_visual_assets() -> List[Dict[str, object]]:
-    """Load visual assets from asset-registry.yaml."""
-    visual_skills: List[Dict[str, object]] = []
-    registry_path = Path(__file__).resolve().parent.parent.parent / "assets" / "asset-registry.yaml"
+_ASSET_REGISTRY_PATH = Path(__file__).resolve().parent.parent.parent / "assets" / "asset-registry.yaml"
+
+
+@lru_cache(maxsize=1)
+def _parse_visual_assets(mtime_ns: int) -> tuple:
+    """Parse asset-registry.yaml; the mtime key drops the entry after edits."""
+    with open(_ASSET_REGISTRY_PATH) as f:
+        registry = yaml.load(f, Loader=_YamlLoader) or {}
 
-    if not registry_path.exists():
-        return visual_skills
+    return tuple(
+        {
+            "id": asset_id,
+            "name": asset_def.get("name", asset_id),
+            "model": asset_def.get("model", ""),
+            "tags": asset_def.get("tags", []),
+        }
+        for asset_id, asset_def in registry.get("assets", {}).items()
+    )
 
+
+def _load_visual_assets() -> List[Dict[str, object]]:
+    """Load visual assets from asset-registry.yaml."""
     try:
-        import yaml
-
-        with open(registry_path) as f:
-            registry = yaml.safe_load(f) or {}
-
-        for asset_id, asset_def in registry.get("assets", {}).items():
-            visual_skills.append(
-                {
-                    "id": asset_id,
-                    "name": asset_def.get("name", asset_id),
-                    "model": asset_def.get("model", ""),
-                    "tags": asset_def.get("tags", []),
-                }
-            )
+        return list(_parse_visual_assets(_ASSET_REGISTRY_PATH.stat().st_mtime_ns))
+    except FileNotFoundError:
+        return []
     except Exception as e:
         console.print(f"[yellow]Warning: failed to read visual registry: {e}[/yellow]")
-
-    return visual_skills
+        return []
 
 
 def _truncate(text: str, limit: int = 72) -> str:
@@ -67,7 +72,7 @@ def run_list(source: Optional[str] = None, tags: Optional[str] = None):
     show_visual = source in (None, "all", "visual")
 
     # Filter by tags
-    tag_filter = set(tags.split(",")) if tags else None
+    tag_filter = frozenset(tags.split(",")) if tags else None
 
     if show_text:
         table = Table(title=f"Text Skills ({len(text_skills)})", show_header=True)
@@ -89,12 +94,12 @@ def run_list(source: Optional[str] = None, tags: Optional[str] = None):
         table.add_column("Model", style="dim")
         table.add_column("Tags", style="dim")
 
-        displayed = 0
-        for asset in visual_skills:
+        shown = visual_skills
+        if tag_filter:
+            shown = [a for a in visual_skills if not tag_filter.isdisjoint(a.get("tags") or ())]
+
+        for asset in shown:
             tags_list = asset.get("tags", []) or []
-            if tag_filter and not tag_filter.intersection(set(tags_list)):
-                continue
-            displayed += 1
             table.add_row(
                 str(asset.get("id", "")),
                 str(asset.get("name", "")),
@@ -0,0 +1,59 @@
+"""
+Brandmint CLI — `bm registry` registry subcommands.
+
+Loaded on demand by :class:`brandmint.cli.app.LazyGroup`.
+"""
+import typer
+from pathlib import Path
+from typing import Optional
+
+app = typer.Typer(name="registry", help="Unified skill registry management", no_args_is_help=True)
+
+
+@app.command("list")
+def registry_list(
+    source: Optional[str] = typer.Option(None, "--source", "-s", help="Filter: text, visual, meta, or all"),
+    tags: Optional[str] = typer.Option(None, "--tags", "-t", help="Filter by domain tags (comma-separated)"),
+):
+    """List all registered skills (text + visual)."""
+    from .registry import run_list
+    run_list(source=source, tags=tags)
+
+
+@app.command("sync")
+def registry_sync(
+    output: Optional[Path] = typer.Option(
+        None,
+        "--output",
+        "-o",
+        help="Output JSON path (default: ./.brandmint/registry.json)",
+    ),
+):
+    """Sync skill registry to JSON file."""
+    from .registry import run_sync
+    run_sync(output=output)
+
+
+@app.command("info")
+def registry_info(
+    skill_id: str = typer.Argument(..., help="Skill ID to show details for"),
+):
+    """Show detailed information about a specific skill."""
+    from .registry import run_info
+    run_info(skill_id)
+
+
+@app.command("doctor")
+def registry_doctor(
+    strict: bool = typer.Option(
+        False,
+        "--strict",
+        help="Exit with non-zero status if issues are found",
+    ),
+):
+    """Run registry diagnostics (conflicts, aliases, skill resolvability)."""
+    from .registry import run_doctor
+
+    code = run_doctor(strict=strict)
+    if code != 0:
+        raise typer.Exit(code=code)
@@ -7,11 +7,13 @@ Generates summaries of pipeline runs including:
 - Time taken per wave
 - Assets generated
 """
+import copy
+import io
 import json
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
-from dataclasses import dataclass, field, asdict
+from typing import Optional, TextIO
+from dataclasses import dataclass, field, fields
 import typer
 from rich.console import Console
 from rich.table import Table
@@ -19,11 +21,12 @@ from rich.panel import Panel
 import yaml
 
 from ..core.kickstarter_blueprint import MANDATORY_KICKSTARTER_SECTIONS
+from ..core.yaml_compat import YamlLoader as _YamlLoader
 
 console = Console()
 
 
-@dataclass
+@dataclass(slots=True)
 class SkillExecution:
     """Record of a single skill execution."""
     skill_id: str
@@ -35,7 +38,7 @@ class SkillExecution:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AssetExecution:
     """Record of an asset generation."""
     asset_id: str
@@ -48,7 +51,7 @@ class AssetExecution:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionReport:
     """Complete execution report."""
     brand_name: str
@@ -77,9 +80,42 @@ class ExecutionReport:
     assets_generated: int = 0
     assets_failed: int = 0
     
+    def add_skill(self, skill: SkillExecution) -> None:
+        """Record a skill execution and bump the matching summary counter."""
+        self.skills.append(skill)
+        if skill.status == "success":
+            self.skills_succeeded += 1
+        elif skill.status == "failed":
+            self.skills_failed += 1
+        elif skill.status == "skipped":
+            self.skills_skipped += 1
+
+    def add_asset(self, asset: AssetExecution) -> None:
+        """Record an asset execution and bump the matching summary counter."""
+        self.assets.append(asset)
+        if asset.status == "success":
+            self.assets_generated += 1
+        elif asset.status == "failed":
+            self.assets_failed += 1
+
     def to_dict(self) -> dict:
-        """Convert to dictionary."""
-        return asdict(self)
+        """Convert to dictionary.
+
+        Equivalent to ``dataclasses.asdict`` but walks precomputed field
+        names and only deep-copies the free-form container fields.
+        """
+        data = {}
+        for name in _REPORT_FIELDS:
+            if name == "skills":
+                value = [{n: getattr(s, n) for n in _SKILL_FIELDS} for s in self.skills]
+            elif name == "assets":
+                value = [{n: getattr(a, n) for n in _ASSET_FIELDS} for a in self.assets]
+            else:
+                value = getattr(self, name)
+                if isinstance(value, (list, dict)):
+                    value = copy.deepcopy(value)
+            data[name] = value
+        return data
     
     @classmethod
     def from_dict(cls, data: dict) -> "ExecutionReport":
@@ -92,42 +128,95 @@ class ExecutionReport:
         return cls(**data, skills=skills, assets=assets, routing_decisions=routing_decisions)
 
 
+# Field names resolved once; to_dict runs on every save_report.
+_SKILL_FIELDS = tuple(f.name for f in fields(SkillExecution))
+_ASSET_FIELDS = tuple(f.name for f in fields(AssetExecution))
+_REPORT_FIELDS = tuple(f.name for f in fields(ExecutionReport))
+
+
+# Run summary fields mirrored into the state file's leading "header" entry.
+_HEADER_FIELDS = ("brand_name", "scenario", "status", "started_at", "completed_at")
+_HEADER_PREFIX = '{"header":'
+
+
 def get_state_file(config_path: Path) -> Path:
-    """Get state file path for a config."""
+    """Get state file path for a config.
+
+    Kept separate from the executor's ``.brandmint-state.json`` so report
+    saves never clobber wave state.
+    """
+    return config_path.parent / ".brandmint-report.json"
+
+
+def _legacy_state_file(config_path: Path) -> Path:
+    """YAML state file written by earlier releases."""
     return config_path.parent / ".brandmint-state.yaml"
 
 
+def _read_state(config_path: Path) -> dict:
+    """Read the report state, migrating from the legacy YAML file if needed."""
+    try:
+        with open(get_state_file(config_path), encoding="utf-8") as f:
+            return json.load(f) or {}
+    except FileNotFoundError:
+        pass
+    try:
+        with open(_legacy_state_file(config_path), encoding="utf-8") as f:
+            return yaml.load(f, Loader=_YamlLoader) or {}
+    except FileNotFoundError:
+        return {}
+
+
 def load_report(config_path: Path) -> Optional[ExecutionReport]:
     """Load execution report from state file."""
-    state_file = get_state_file(config_path)
-    if not state_file.exists():
-        return None
-    
-    with open(state_file) as f:
-        data = yaml.safe_load(f)
-    
-    if not data or "report" not in data:
+    data = _read_state(config_path)
+    if "report" not in data:
         return None
     
     return ExecutionReport.from_dict(data["report"])
 
 
+def load_report_header(config_path: Path) -> Optional[dict]:
+    """Load just the run summary fields (see ``_HEADER_FIELDS``).
+
+    ``save_report`` writes these on the first line of the state file, so
+    status polls read one short line instead of every skill and asset
+    record. Files without that line fall back to a full load.
+    """
+    try:
+        with open(get_state_file(config_path), encoding="utf-8") as f:
+            first_line = f.readline()
+    except FileNotFoundError:
+        first_line = ""
+    if first_line.startswith(_HEADER_PREFIX) and first_line.endswith(",\n"):
+        try:
+            return json.loads(first_line[:-2] + "}")["header"]
+        except (ValueError, KeyError):
+            pass
+
+    report = load_report(config_path)
+    if report is None:
+        return None
+    return {name: getattr(report, name) for name in _HEADER_FIELDS}
+
+
 def save_report(config_path: Path, report: ExecutionReport):
     """Save execution report to state file."""
-    state_file = get_state_file(config_path)
-    
-    # Load existing state or create new
-    if state_file.exists():
-        with open(state_file) as f:
-            state = yaml.safe_load(f) or {}
-    else:
-        state = {}
+    # Load existing state (or the legacy YAML state on first save)
+    state = _read_state(config_path)
+    state.pop("header", None)
     
     state["report"] = report.to_dict()
     state["last_updated"] = datetime.now().isoformat()
+    header = {name: state["report"][name] for name in _HEADER_FIELDS}
     
-    with open(state_file, "w") as f:
-        yaml.safe_dump(state, f, default_flow_style=False)
+    # Header object goes first, on its own line, for load_report_header
+    body = json.dumps(state, separators=(",", ":"))
+    with open(get_state_file(config_path), "w", encoding="utf-8") as f:
+        f.write(_HEADER_PREFIX)
+        json.dump(header, f, separators=(",", ":"))
+        f.write(",\n")
+        f.write(body[1:])
 
 
 def _kickstarter_section_rows(report: ExecutionReport) -> list[tuple[str, dict]]:
@@ -174,38 +263,93 @@ def _fallback_summary_rows(report: ExecutionReport) -> list[dict]:
         }
     return list(summaries.values())
 
+# Static report scaffolding, filled in with %-formatting per render.
+_MARKDOWN_HEADER = """\
+# Brandmint Execution Report
+
+**Brand:** %s
+**Scenario:** %s
+**Status:** %s
+
+## Timing
+
+- Started: %s
+- Completed: %s
+- Duration: %.1fs
+
+## Costs
+
+| Item | Amount |
+|------|--------|
+| Estimated | $%.2f |
+| Actual | $%.2f |
+| Variance | $%+.2f |
+
+## Skills Summary
+
+- Succeeded: %s
+- Failed: %s
+- Skipped: %s
+"""
+
+_MARKDOWN_FOOTER = "---\n*Generated by Brandmint at %s*"
 
+_HTML_HEAD = """<!DOCTYPE html>
+<html>
+<head>
+    <title>Brandmint Report - %s</title>
+    <style>
+        body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; max-width: 900px; margin: 40px auto; padding: 20px; }
+        h1 { color: #333; border-bottom: 2px solid #6366f1; padding-bottom: 10px; }
+        h2 { color: #4f46e5; margin-top: 30px; }
+        .status { display: inline-block; padding: 4px 12px; border-radius: 4px; font-weight: 600; }
+        .status-completed { background: #dcfce7; color: #166534; }
+        .status-failed { background: #fee2e2; color: #991b1b; }
+        .status-in_progress { background: #fef3c7; color: #92400e; }
+        table { width: 100%%; border-collapse: collapse; margin: 20px 0; }
+        th, td { padding: 12px; text-align: left; border-bottom: 1px solid #e5e7eb; }
+        th { background: #f9fafb; font-weight: 600; }
+        .cost-box { display: grid; grid-template-columns: repeat(3, 1fr); gap: 20px; margin: 20px 0; }
+        .cost-card { background: #f3f4f6; padding: 20px; border-radius: 8px; text-align: center; }
+        .cost-card .value { font-size: 24px; font-weight: 700; color: #4f46e5; }
+        .cost-card .label { font-size: 14px; color: #6b7280; margin-top: 5px; }
+    </style>
+</head>
+"""
 
-def format_markdown(report: ExecutionReport) -> str:
-    """Format report as Markdown."""
-    lines = [
-        f"# Brandmint Execution Report",
-        f"",
-        f"**Brand:** {report.brand_name}",
-        f"**Scenario:** {report.scenario}",
-        f"**Status:** {report.status}",
-        f"",
-        f"## Timing",
-        f"",
-        f"- Started: {report.started_at}",
-        f"- Completed: {report.completed_at or 'In progress'}",
-        f"- Duration: {report.total_duration_seconds:.1f}s",
-        f"",
-        f"## Costs",
-        f"",
-        f"| Item | Amount |",
-        f"|------|--------|",
-        f"| Estimated | ${report.estimated_cost_usd:.2f} |",
-        f"| Actual | ${report.actual_cost_usd:.2f} |",
-        f"| Variance | ${report.actual_cost_usd - report.estimated_cost_usd:+.2f} |",
-        f"",
-        f"## Skills Summary",
-        f"",
-        f"- Succeeded: {report.skills_succeeded}",
-        f"- Failed: {report.skills_failed}",
-        f"- Skipped: {report.skills_skipped}",
-        f"",
-    ]
+
+# Per-row table templates as bound %-formatters; each takes a tuple.
+_SKILL_ROW = "| %s | %s | %s | %.1fs |".__mod__
+_ASSET_ROW = "| %s | %s | %s | $%.3f | %s |".__mod__
+_HTML_SKILL_ROW = "<tr><td>%s</td><td>%s</td><td>%s</td><td>%.1fs</td></tr>".__mod__
+_HTML_ASSET_ROW = "<tr><td>%s</td><td>%s</td><td>%s</td><td>$%.3f</td><td>%s</td></tr>".__mod__
+
+
+def format_markdown(
+    report: ExecutionReport,
+    generated_at: Optional[str] = None,
+    out: Optional[TextIO] = None,
+) -> Optional[str]:
+    """Format report as Markdown.
+
+    ``generated_at`` stamps the footer; defaults to the current time.
+    When ``out`` is given the document is written to it line by line and
+    ``None`` is returned instead of the joined string.
+    """
+    lines = [_MARKDOWN_HEADER % (
+        report.brand_name,
+        report.scenario,
+        report.status,
+        report.started_at,
+        report.completed_at or "In progress",
+        report.total_duration_seconds,
+        report.estimated_cost_usd,
+        report.actual_cost_usd,
+        report.actual_cost_usd - report.estimated_cost_usd,
+        report.skills_succeeded,
+        report.skills_failed,
+        report.skills_skipped,
+    )]
     
     if report.skills:
         lines.extend([
@@ -214,8 +358,10 @@ def format_markdown(report: ExecutionReport) -> str:
             f"| Skill | Wave | Status | Duration |",
             f"|-------|------|--------|----------|",
         ])
-        for skill in report.skills:
-            lines.append(f"| {skill.skill_id} | {skill.wave} | {skill.status} | {skill.duration_seconds:.1f}s |")
+        lines.extend(
+            _SKILL_ROW((s.skill_id, s.wave, s.status, s.duration_seconds))
+            for s in report.skills
+        )
         lines.append("")
     
     if report.assets:
@@ -230,8 +376,10 @@ def format_markdown(report: ExecutionReport) -> str:
             f"| Asset | Batch | Status | Cost | Provider |",
             f"|-------|-------|--------|------|----------|",
         ])
-        for asset in report.assets:
-            lines.append(f"| {asset.asset_id} | {asset.batch} | {asset.status} | ${asset.cost_usd:.3f} | {asset.provider} |")
+        lines.extend(
+            _ASSET_ROW((a.asset_id, a.batch, a.status, a.cost_usd, a.provider))
+            for a in report.assets
+        )
         lines.append("")
 
     if report.kickstarter_readiness:
@@ -285,12 +433,14 @@ def format_markdown(report: ExecutionReport) -> str:
             )
         lines.append("")
     
-    lines.extend([
-        f"---",
-        f"*Generated by Brandmint at {datetime.now().isoformat()}*",
-    ])
+    footer = _MARKDOWN_FOOTER % (generated_at or datetime.now().isoformat())
     
-    return "\n".join(lines)
+    if out is None:
+        lines.append(footer)
+        return "\n".join(lines)
+    out.writelines(line + "\n" for line in lines)
+    out.write(footer)
+    return None
 
 
 def format_json(report: ExecutionReport) -> str:
@@ -298,32 +448,23 @@ def format_json(report: ExecutionReport) -> str:
     return json.dumps(report.to_dict(), indent=2)
 
 
-def format_html(report: ExecutionReport) -> str:
-    """Format report as HTML."""
-    # Simple HTML template
+def format_html(
+    report: ExecutionReport,
+    generated_at: Optional[str] = None,
+    out: Optional[TextIO] = None,
+) -> Optional[str]:
+    """Format report as HTML.
+
+    ``generated_at`` stamps the footer; defaults to the current time.
+    When ``out`` is given the document is written to it section by section
+    and ``None`` is returned instead of the full string.
+    """
+    buf = io.StringIO() if out is None else out
+    write = buf.write
     fallback_rows = _fallback_summary_rows(report)
-    html = f"""<!DOCTYPE html>
-<html>
-<head>
-    <title>Brandmint Report - {report.brand_name}</title>
-    <style>
-        body {{ font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; max-width: 900px; margin: 40px auto; padding: 20px; }}
-        h1 {{ color: #333; border-bottom: 2px solid #6366f1; padding-bottom: 10px; }}
-        h2 {{ color: #4f46e5; margin-top: 30px; }}
-        .status {{ display: inline-block; padding: 4px 12px; border-radius: 4px; font-weight: 600; }}
-        .status-completed {{ background: #dcfce7; color: #166534; }}
-        .status-failed {{ background: #fee2e2; color: #991b1b; }}
-        .status-in_progress {{ background: #fef3c7; color: #92400e; }}
-        table {{ width: 100%; border-collapse: collapse; margin: 20px 0; }}
-        th, td {{ padding: 12px; text-align: left; border-bottom: 1px solid #e5e7eb; }}
-        th {{ background: #f9fafb; font-weight: 600; }}
-        .cost-box {{ display: grid; grid-template-columns: repeat(3, 1fr); gap: 20px; margin: 20px 0; }}
-        .cost-card {{ background: #f3f4f6; padding: 20px; border-radius: 8px; text-align: center; }}
-        .cost-card .value {{ font-size: 24px; font-weight: 700; color: #4f46e5; }}
-        .cost-card .label {{ font-size: 14px; color: #6b7280; margin-top: 5px; }}
-    </style>
-</head>
-<body>
+
+    write(_HTML_HEAD % report.brand_name)
+    write(f"""<body>
     <h1>🎨 Brandmint Execution Report</h1>
     
     <p><strong>Brand:</strong> {report.brand_name}</p>
@@ -356,31 +497,73 @@ def format_html(report: ExecutionReport) -> str:
     <h2>📋 Skills Summary</h2>
     <p>Succeeded: {report.skills_succeeded} | Failed: {report.skills_failed} | Skipped: {report.skills_skipped}</p>
     
-    {"<table><tr><th>Skill</th><th>Wave</th><th>Status</th><th>Duration</th></tr>" + "".join(f"<tr><td>{s.skill_id}</td><td>{s.wave}</td><td>{s.status}</td><td>{s.duration_seconds:.1f}s</td></tr>" for s in report.skills) + "</table>" if report.skills else ""}
+    """)
+    if report.skills:
+        write("<table><tr><th>Skill</th><th>Wave</th><th>Status</th><th>Duration</th></tr>")
+        for s in report.skills:
+            write(_HTML_SKILL_ROW((s.skill_id, s.wave, s.status, s.duration_seconds)))
+        write("</table>")
+
+    write(f"""
     
     <h2>🖼️ Assets Summary</h2>
     <p>Generated: {report.assets_generated} | Failed: {report.assets_failed}</p>
 
-    {"<table><tr><th>Asset</th><th>Batch</th><th>Status</th><th>Cost</th><th>Provider</th></tr>" + "".join(f"<tr><td>{a.asset_id}</td><td>{a.batch}</td><td>{a.status}</td><td>${a.cost_usd:.3f}</td><td>{a.provider}</td></tr>" for a in report.assets) + "</table>" if report.assets else ""}
+    """)
+    if report.assets:
+        write("<table><tr><th>Asset</th><th>Batch</th><th>Status</th><th>Cost</th><th>Provider</th></tr>")
+        for a in report.assets:
+            write(_HTML_ASSET_ROW((a.asset_id, a.batch, a.status, a.cost_usd, a.provider)))
+        write("</table>")
+
+    write(f"""
 
     <h2>🚀 Kickstarter Readiness</h2>
     <p>All mandatory sections ready: {"Yes" if (report.kickstarter_readiness or {}).get("all_ready") else "No"}</p>
-    {"<table><tr><th>Section</th><th>Status</th><th>Coverage</th><th>Missing</th></tr>" + "".join(f"<tr><td>{title}</td><td>{'Ready' if row.get('ready') else 'In progress'}</td><td>{row.get('completed', 0)}/{row.get('total', 0)}</td><td>{', '.join(row.get('missing_artifact_ids', [])) or '—'}</td></tr>" for title, row in _kickstarter_section_rows(report)) + "</table>" if report.kickstarter_readiness else ""}
+    """)
+    if report.kickstarter_readiness:
+        write("<table><tr><th>Section</th><th>Status</th><th>Coverage</th><th>Missing</th></tr>")
+        for title, row in _kickstarter_section_rows(report):
+            write(f"<tr><td>{title}</td><td>{'Ready' if row.get('ready') else 'In progress'}</td><td>{row.get('completed', 0)}/{row.get('total', 0)}</td><td>{', '.join(row.get('missing_artifact_ids', [])) or '—'}</td></tr>")
+        write("</table>")
+
+    write(f"""
 
     <h2>🧭 Routing Decisions</h2>
     <p>Recorded: {len(report.routing_decisions)}</p>
-    {"<table><tr><th>Asset</th><th>Batch</th><th>Media Skill</th><th>Reason</th><th>Confidence</th></tr>" + "".join(f"<tr><td>{r.get('asset_id','')}</td><td>{r.get('batch','')}</td><td>{r.get('media_skill_id','')}</td><td>{r.get('reason','')}</td><td>{r.get('confidence','')}</td></tr>" for r in report.routing_decisions) + "</table>" if report.routing_decisions else ""}
+    """)
+    if report.routing_decisions:
+        write("<table><tr><th>Asset</th><th>Batch</th><th>Media Skill</th><th>Reason</th><th>Confidence</th></tr>")
+        for r in report.routing_decisions:
+            write(f"<tr><td>{r.get('asset_id','')}</td><td>{r.get('batch','')}</td><td>{r.get('media_skill_id','')}</td><td>{r.get('reason','')}</td><td>{r.get('confidence','')}</td></tr>")
+        write("</table>")
+
+    write(f"""
 
     <h2>🔁 Provider Fallback Summary</h2>
     <p>Recorded: {len(fallback_rows)}</p>
-    {"<table><tr><th>Batch</th><th>Final Provider</th><th>Attempts</th><th>Providers Tried</th><th>Configured Order</th></tr>" + "".join(f"<tr><td>{r.get('batch','')}</td><td>{r.get('provider_used','')}</td><td>{r.get('attempts','')}</td><td>{r.get('providers_tried','')}</td><td>{r.get('fallback_order','')}</td></tr>" for r in fallback_rows) + "</table>" if fallback_rows else ""}
+    """)
+    if fallback_rows:
+        write("<table><tr><th>Batch</th><th>Final Provider</th><th>Attempts</th><th>Providers Tried</th><th>Configured Order</th></tr>")
+        for r in fallback_rows:
+            write(f"<tr><td>{r.get('batch','')}</td><td>{r.get('provider_used','')}</td><td>{r.get('attempts','')}</td><td>{r.get('providers_tried','')}</td><td>{r.get('fallback_order','')}</td></tr>")
+        write("</table>")
+
+    write(f"""
     
     <hr>
-    <p><em>Generated by Brandmint at {datetime.now().isoformat()}</em></p>
+    <p><em>Generated by Brandmint at {generated_at or datetime.now().isoformat()}</em></p>
 </body>
 </html>
-"""
-    return html
+""")
+    if out is None:
+        return buf.getvalue()
+    return None
+
+
+# Rich colors for the console summary; variance is indexed by "over budget".
+_STATUS_COLOR = {"completed": "green", "failed": "red", "in_progress": "yellow"}
+_VARIANCE_COLOR = ("green", "red")
 
 
 def render_report_table(report: ExecutionReport):
@@ -388,7 +571,7 @@ def render_report_table(report: ExecutionReport):
     # Header panel
     console.print(Panel(
         f"[bold]{report.brand_name}[/bold] — {report.scenario}\n"
-        f"Status: [{'green' if report.status == 'completed' else 'yellow'}]{report.status}[/]",
+        f"Status: [{_STATUS_COLOR.get(report.status, 'yellow')}]{report.status}[/]",
         title="📊 Execution Report"
     ))
     
@@ -399,7 +582,7 @@ def render_report_table(report: ExecutionReport):
     cost_table.add_row("Estimated", f"${report.estimated_cost_usd:.2f}")
     cost_table.add_row("Actual", f"${report.actual_cost_usd:.2f}")
     variance = report.actual_cost_usd - report.estimated_cost_usd
-    color = "green" if variance <= 0 else "red"
+    color = _VARIANCE_COLOR[variance > 0]
     cost_table.add_row("Variance", f"[{color}]${variance:+.2f}[/]")
     console.print(cost_table)
     
@@ -437,27 +620,27 @@ def run_report(config_path: Path, format: str = "markdown", output: Optional[Pat
         console.print("[yellow]No execution data found.[/] Run `bm launch` first.")
         raise typer.Exit(1)
     
-    # Format output
-    if format == "markdown":
-        content = format_markdown(report)
-    elif format == "json":
-        content = format_json(report)
-    elif format == "html":
-        content = format_html(report)
-    else:
+    if format not in ("markdown", "json", "html"):
         console.print(f"[red]Unknown format:[/] {format}")
         raise typer.Exit(1)
     
-    # Write output
+    # Write output, streaming Markdown/HTML straight into the file
     if output:
-        output.write_text(content)
+        generated_at = datetime.now().isoformat()
+        with output.open("w", encoding="utf-8") as f:
+            if format == "markdown":
+                format_markdown(report, generated_at=generated_at, out=f)
+            elif format == "html":
+                format_html(report, generated_at=generated_at, out=f)
+            else:
+                f.write(format_json(report))
         console.print(f"[green]Report saved to:[/] {output}")
     else:
         # For non-JSON, render rich table to console
         if format != "json":
             render_report_table(report)
         else:
-            console.print(content)
+            console.print(format_json(report))
 
 
 # Export for use by executor
@@ -466,6 +649,7 @@ __all__ = [
     "SkillExecution", 
     "AssetExecution",
     "load_report",
+    "load_report_header",
     "save_report",
     "run_report",
 ]
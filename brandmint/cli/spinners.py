@@ -53,6 +53,59 @@ BRAND_COLORS = {
 # Progress bar configurations
 # ---------------------------------------------------------------------------
 
+# Column prototypes are built once and shared by every Progress the factories
+# return; these columns keep no per-task state. TimeRemainingColumn caches
+# renders by task id, so it is still created per Progress.
+_ASSET_COLUMNS = (
+    SpinnerColumn("dots12", style="cyan"),
+    TextColumn("[bold cyan]{task.description}[/bold cyan]"),
+    BarColumn(bar_width=30, complete_style="green", finished_style="bold green"),
+    MofNCompleteColumn(),
+    TextColumn("•"),
+    TimeElapsedColumn(),
+)
+
+_WAVE_COLUMNS = (
+    TextColumn("[bold blue]Wave {task.fields[wave_num]}[/bold blue]"),
+    SpinnerColumn("dots", style="blue"),
+    TextColumn("{task.description}"),
+    BarColumn(bar_width=25, complete_style="cyan"),
+    TaskProgressColumn(),
+)
+
+_BATCH_COLUMNS = (
+    SpinnerColumn("arc", style="yellow"),
+    TextColumn("[yellow]{task.description}[/yellow]"),
+    BarColumn(bar_width=20, complete_style="yellow", finished_style="bold green"),
+    MofNCompleteColumn(),
+    TimeElapsedColumn(),
+)
+
+_SKILL_COLUMNS = (
+    SpinnerColumn("dots2", style="magenta"),
+    TextColumn("[magenta]{task.description}[/magenta]"),
+    TimeElapsedColumn(),
+)
+
+_API_SPINNER_COLUMNS = (
+    SpinnerColumn("dots12", style="cyan"),
+    TextColumn("{task.description}"),
+    TimeElapsedColumn(),
+)
+
+_PIPELINE_SPINNER_COLUMN = SpinnerColumn("point", style="bold cyan")
+_PIPELINE_INIT_COLUMN = TextColumn("[dim]initializing...[/dim]")
+
+_MULTI_COLUMNS = (
+    SpinnerColumn("dots", style="cyan"),
+    TextColumn("[bold]{task.fields[name]}[/bold]"),
+    BarColumn(bar_width=15),
+    TaskProgressColumn(),
+    TextColumn("•"),
+    TimeElapsedColumn(),
+)
+
+
 def create_asset_progress(console: Optional[Console] = None) -> Progress:
     """Create a progress tracker for visual asset generation.
     
@@ -65,16 +118,7 @@ def create_asset_progress(console: Optional[Console] = None) -> Progress:
                 generate(asset)
                 progress.advance(task)
     """
-    return Progress(
-        SpinnerColumn("dots12", style="cyan"),
-        TextColumn("[bold cyan]{task.description}[/bold cyan]"),
-        BarColumn(bar_width=30, complete_style="green", finished_style="bold green"),
-        MofNCompleteColumn(),
-        TextColumn("•"),
-        TimeElapsedColumn(),
-        console=console,
-        transient=False,
-    )
+    return Progress(*_ASSET_COLUMNS, console=console, transient=False)
 
 
 def create_wave_progress(console: Optional[Console] = None) -> Progress:
@@ -83,11 +127,7 @@ def create_wave_progress(console: Optional[Console] = None) -> Progress:
     Shows: wave indicator, description, bar, percentage, time remaining.
     """
     return Progress(
-        TextColumn("[bold blue]Wave {task.fields[wave_num]}[/bold blue]"),
-        SpinnerColumn("dots", style="blue"),
-        TextColumn("{task.description}"),
-        BarColumn(bar_width=25, complete_style="cyan"),
-        TaskProgressColumn(),
+        *_WAVE_COLUMNS,
         TimeRemainingColumn(),
         console=console,
         transient=False,
@@ -99,15 +139,7 @@ def create_batch_progress(console: Optional[Console] = None) -> Progress:
     
     Shows: spinner, batch name, bar, count.
     """
-    return Progress(
-        SpinnerColumn("arc", style="yellow"),
-        TextColumn("[yellow]{task.description}[/yellow]"),
-        BarColumn(bar_width=20, complete_style="yellow", finished_style="bold green"),
-        MofNCompleteColumn(),
-        TimeElapsedColumn(),
-        console=console,
-        transient=True,
-    )
+    return Progress(*_BATCH_COLUMNS, console=console, transient=True)
 
 
 def create_skill_progress(console: Optional[Console] = None) -> Progress:
@@ -115,13 +147,7 @@ def create_skill_progress(console: Optional[Console] = None) -> Progress:
     
     Simpler display for prompt generation / output waiting.
     """
-    return Progress(
-        SpinnerColumn("dots2", style="magenta"),
-        TextColumn("[magenta]{task.description}[/magenta]"),
-        TimeElapsedColumn(),
-        console=console,
-        transient=True,
-    )
+    return Progress(*_SKILL_COLUMNS, console=console, transient=True)
 
 
 # ---------------------------------------------------------------------------
@@ -149,13 +175,7 @@ def create_api_spinner(description: str, console: Optional[Console] = None):
         def update(self, text: str):
             self._progress.update(self._task_id, description=text)
     
-    with Progress(
-        SpinnerColumn("dots12", style="cyan"),
-        TextColumn("{task.description}"),
-        TimeElapsedColumn(),
-        console=console,
-        transient=True,
-    ) as progress:
+    with Progress(*_API_SPINNER_COLUMNS, console=console, transient=True) as progress:
         task = progress.add_task(description)
         yield SpinnerStatus(progress, task)
 
@@ -169,9 +189,9 @@ def create_pipeline_spinner(stage: str, console: Optional[Console] = None):
     console = console or Console()
     
     with Progress(
-        SpinnerColumn("point", style="bold cyan"),
+        _PIPELINE_SPINNER_COLUMN,
         TextColumn(f"[bold]{stage}[/bold]"),
-        TextColumn("[dim]initializing...[/dim]"),
+        _PIPELINE_INIT_COLUMN,
         console=console,
         transient=True,
     ) as progress:
@@ -227,35 +247,24 @@ def create_multi_progress(console: Optional[Console] = None) -> Progress:
     
     Supports tracking multiple concurrent operations.
     """
-    return Progress(
-        SpinnerColumn("dots", style="cyan"),
-        TextColumn("[bold]{task.fields[name]}[/bold]"),
-        BarColumn(bar_width=15),
-        TaskProgressColumn(),
-        TextColumn("•"),
-        TimeElapsedColumn(),
-        console=console,
-    )
+    return Progress(*_MULTI_COLUMNS, console=console)
 
 
 # ---------------------------------------------------------------------------
 # Utility functions
 # ---------------------------------------------------------------------------
 
+# Cost precision by magnitude: < $0.01, < $1, and everything else.
+_COST_FMT = ("$%.4f", "$%.3f", "$%.2f")
+
+
 def format_duration(seconds: float) -> str:
     """Format seconds as human-readable duration."""
     if seconds < 60:
-        return f"{seconds:.1f}s"
-    minutes = int(seconds // 60)
-    secs = int(seconds % 60)
-    return f"{minutes}m {secs}s"
+        return "%.1fs" % seconds
+    return "%dm %ds" % divmod(int(seconds), 60)
 
 
 def format_cost(amount: float) -> str:
     """Format cost with appropriate precision."""
-    if amount < 0.01:
-        return f"${amount:.4f}"
-    elif amount < 1:
-        return f"${amount:.3f}"
-    else:
-        return f"${amount:.2f}"
+    return _COST_FMT[(amount >= 0.01) + (amount >= 1)] % amount
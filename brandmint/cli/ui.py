@@ -2,18 +2,23 @@
 Brandmint CLI -- Rich TUI display components.
 Reusable rendering functions for the launch wizard and wave executor.
 """
+import io
+import os
+from functools import lru_cache
+from itertools import islice
 from typing import List, Optional, Dict, Any
 from time import sleep
+from types import MappingProxyType
 
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.table import Table
 from rich.prompt import Prompt, IntPrompt
 from rich.text import Text
 from rich.live import Live
 
-from ..models.wave import Wave, WaveStatus
-from .icons import Icons, get_status_icon, get_status_style, format_status_line
+from ..models.wave import Wave
+from .icons import Icons, format_status_line
 
 
 # ---------------------------------------------------------------------------
@@ -22,18 +27,159 @@ from .icons import Icons, get_status_icon, get_status_style, format_status_line
 
 _TEXT_COST_PER_SKILL = 600
 
+# Brand name reveal: at most 40 ms per character and 0.3 s in total.
+_BANNER_FRAME_SECONDS = 0.04
+_BANNER_ANIMATION_SECONDS = 0.3
+
+# Registry model and cost per seed for each asset (costs mirror
+# VISUAL_ASSET_COSTS in wave_planner.py); unlisted assets use the default.
+# Read-only so callers cannot mutate the shared table.
+_ASSET_INFO = MappingProxyType({
+    "2A": ("nano-banana-pro", 0.08),
+    "2B": ("nano-banana-pro", 0.05),
+    "2C": ("nano-banana-pro", 0.05),
+    "3A": ("nano-banana-pro", 0.05),
+    "3B": ("nano-banana-pro", 0.05),
+    "3C": ("nano-banana-pro", 0.05),
+    "4A": ("nano-banana-pro", 0.08),
+    "4B": ("nano-banana-pro", 0.05),
+    "5A": ("nano-banana-pro", 0.04),
+    "5B": ("nano-banana-pro", 0.08),
+    "5C": ("nano-banana-pro", 0.04),
+    "5D": ("nano-banana-pro", 0.08),
+    "7A": ("nano-banana-pro", 0.08),
+    "8A": ("nano-banana-pro", 0.08),
+    "9A": ("nano-banana-pro", 0.08),
+    "10A": ("nano-banana-pro", 0.08),
+    "10B": ("nano-banana-pro", 0.08),
+    "10C": ("nano-banana-pro", 0.08),
+    "APP-ICON": ("nano-banana-pro", 0.05),
+    "OG-IMAGE": ("nano-banana-pro", 0.08),
+    "IG-STORY": ("nano-banana-pro", 0.08),
+    "APP-SCREENSHOT": ("nano-banana-pro", 0.08),
+    "PITCH-HERO": ("nano-banana-pro", 0.08),
+    "TWITTER-HEADER": ("nano-banana-pro", 0.08),
+    "EMAIL-HERO": ("nano-banana-pro", 0.08),
+})
+_ASSET_DEFAULT = ("nano-banana-pro", 0.08)
+
+# Pre-styled execution summary labels; values are appended as plain text
+# so the summary never goes through the markup parser.
+_SUMMARY_LABELS = tuple(
+    Text(label, style="bold")
+    for label in (
+        "Waves completed:",
+        "Text skills run:",
+        "Visual assets generated:",
+        "Estimated cost:",
+    )
+)
+
+# Table column schemas: (header, add_column kwargs) per column.
+_WAVE_PLAN_COLUMNS = (
+    ("Wave", {"style": "cyan", "justify": "right"}),
+    ("Name", {}),
+    ("Text Skills", {"justify": "right"}),
+    ("Visual Assets", {"justify": "right"}),
+    ("Est. Cost", {"justify": "right", "style": "green"}),
+)
+_BUDGET_COLUMNS = (
+    ("Wave", {"style": "cyan", "justify": "right"}),
+    ("Text Cost", {"justify": "right", "style": "green"}),
+    ("Visual Cost", {"justify": "right", "style": "green"}),
+    ("Total", {"justify": "right", "style": "bold green"}),
+)
+_ASSET_COST_COLUMNS = (
+    ("Asset", {"style": "cyan"}),
+    ("Model", {"style": "dim"}),
+    ("× Seeds", {"justify": "right"}),
+    ("Cost", {"justify": "right", "style": "green"}),
+)
+_COST_SUMMARY_COLUMNS = (
+    ("Category", {}),
+    ("Items", {"justify": "right"}),
+    ("Cost", {"justify": "right", "style": "green"}),
+)
+
+_MISSING = object()
+
+
+def _field(obj: Any, name: str, default: Any = None) -> Any:
+    """Read ``name`` from a model instance or a plain dict."""
+    if isinstance(obj, dict):
+        return obj.get(name, default)
+    return getattr(obj, name, default)
+
+
+def normalize_matches(matches: list) -> list[dict]:
+    """Flatten scenario matches (models or dicts) into plain dicts.
+
+    Each row has ``sid`` (plain string), ``score``, ``reasoning``, ``pros``
+    and ``cons``. Rows that are already normalized pass through, so the
+    wizard can normalize once and hand the result to every renderer.
+    """
+    rows: list[dict] = []
+    for match in matches:
+        if isinstance(match, dict) and "sid" in match:
+            rows.append(match)
+            continue
+        rows.append({
+            "sid": _enum_value(_field(match, "scenario_id", "")),
+            "score": _field(match, "match_score", 0),
+            "reasoning": _field(match, "reasoning", ""),
+            "pros": _field(match, "pros", []),
+            "cons": _field(match, "cons", []),
+        })
+    return rows
+
+
+def _make_table(title: str, columns: tuple) -> Table:
+    """Create a headed Table from one of the column schemas above."""
+    table = Table(show_header=True, title=title)
+    for header, options in columns:
+        table.add_column(header, **options)
+    return table
+
+
+def _enum_value(value: Any) -> str:
+    """Return an enum member's ``.value``, or ``str()`` for anything else."""
+    raw = getattr(value, "value", _MISSING)
+    return str(value) if raw is _MISSING else raw
+
 
 # ---------------------------------------------------------------------------
 # Brand banner
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=64)
+def _pretty_label(key: str) -> str:
+    """Turn a palette key like ``deep_green`` into ``Deep Green``."""
+    return key.replace("_", " ").title()
+
+
+@lru_cache(maxsize=8)
+def _palette_swatches(entries: tuple) -> str:
+    """Build the banner palette line from ``(label, hex)`` entries.
+
+    Cached because a config's palette does not change between renders.
+    """
+    parts: list[str] = []
+    for label, hex_val in entries:
+        h = hex_val.lstrip("#")
+        parts.append(f"[on #{h}]  [/on #{h}] {_pretty_label(label)}")
+    return "\n[bold]Palette:[/bold] " + "  ".join(parts)
+
+
 def render_brand_banner(config: dict, console: Console, animated: bool = True) -> None:
     """Display brand header panel with name, domain tags, execution context, and palette.
     
     Args:
         config: Brand configuration dict
         console: Rich console instance
-        animated: If True, show typing animation for brand name
+        animated: If True, show typing animation for brand name. Skipped
+            when the console is not a terminal or BRANDMINT_NO_ANIM=1.
+
+    Non-terminal consoles (CI logs, pipes) get a single plain-text line.
     """
     brand = config.get("brand", {})
     ec = config.get("execution_context", {})
@@ -43,19 +189,25 @@ def render_brand_banner(config: dict, console: Console, animated: bool = True) -
     tags = brand.get("domain_tags", [])
     channel = ec.get("launch_channel", "dtc")
     depth = ec.get("depth_level", "focused")
+    tag_str = ", ".join(tags) if tags else "general"
 
-    # Build palette swatch line using Rich ANSI color markup
-    swatches = ""
-    if palette:
-        parts: list[str] = []
-        for label, hex_val in list(palette.items())[:6]:
-            h = hex_val.lstrip("#")
-            display = label.replace("_", " ").title()
-            parts.append(f"[on #{h}]  [/on #{h}] {display}")
-        swatches = "\n[bold]Palette:[/bold] " + "  ".join(parts)
+    if not console.is_terminal:
+        console.out(
+            f"BRANDMINT {name.upper()} | domain={tag_str} | channel={channel} | depth={depth}",
+            highlight=False,
+        )
+        return
+
+    swatches = _palette_swatches(tuple(islice(palette.items(), 6))) if palette else ""
 
     # Animated brand name reveal
-    if animated:
+    if (
+        animated
+        and name
+        and console.is_terminal
+        and os.environ.get("BRANDMINT_NO_ANIM") != "1"
+    ):
+        delay = min(_BANNER_FRAME_SECONDS, _BANNER_ANIMATION_SECONDS / (len(name) + 1))
         console.print()
         with Live(console=console, refresh_per_second=30, transient=True) as live:
             for i in range(len(name) + 1):
@@ -64,15 +216,15 @@ def render_brand_banner(config: dict, console: Console, animated: bool = True) -
                 text.append(name[:i].upper(), style="bold cyan")
                 text.append("▌" if i < len(name) else "", style="cyan dim")
                 live.update(text)
-                sleep(0.04)
-
-    body = (
-        f"[bold]{name.upper()}[/bold]\n\n"
-        f"[cyan]{Icons.CHEVRON} Domain:[/cyan] {', '.join(tags) if tags else 'general'}\n"
-        f"[cyan]{Icons.CHEVRON} Channel:[/cyan] {channel}  {Icons.BULLET}  "
-        f"[cyan]Depth:[/cyan] {depth}"
-        f"{swatches}"
-    )
+                sleep(delay)
+
+    body = "".join([
+        f"[bold]{name.upper()}[/bold]\n\n",
+        f"[cyan]{Icons.CHEVRON} Domain:[/cyan] {tag_str}\n",
+        f"[cyan]{Icons.CHEVRON} Channel:[/cyan] {channel}  {Icons.BULLET}  ",
+        f"[cyan]Depth:[/cyan] {depth}",
+        swatches,
+    ])
 
     console.print(Panel(body, title=f"{Icons.BRAND} BRANDMINT {Icons.DASH} Launch Wizard", border_style="cyan"))
 
@@ -82,33 +234,50 @@ def render_brand_banner(config: dict, console: Console, animated: bool = True) -
 # ---------------------------------------------------------------------------
 
 def render_scenario_cards(matches: list, scenarios: list, console: Console) -> None:
-    """Display ranked scenario recommendation panels."""
+    """Display ranked scenario recommendation panels.
+
+    Non-terminal consoles get the same details as plain text lines.
+    """
     scenario_map: Dict[str, Any] = {}
     for s in scenarios:
-        key = s.id if hasattr(s, "id") else s.get("id", "")
-        key = key.value if hasattr(key, "value") else str(key)
-        scenario_map[key] = s
-
-    for idx, match in enumerate(matches):
-        sid = match.scenario_id if hasattr(match, "scenario_id") else match.get("scenario_id", "")
-        sid_str = sid.value if hasattr(sid, "value") else str(sid)
-        score = match.match_score if hasattr(match, "match_score") else match.get("match_score", 0)
-        reasoning = match.reasoning if hasattr(match, "reasoning") else match.get("reasoning", "")
-        pros = match.pros if hasattr(match, "pros") else match.get("pros", [])
-        cons = match.cons if hasattr(match, "cons") else match.get("cons", [])
+        scenario_map[_enum_value(_field(s, "id", ""))] = s
+
+    plain = not console.is_terminal
+    plain_lines: list[str] = []
+    panels: list[Panel] = []
+    for idx, match in enumerate(normalize_matches(matches)):
+        sid_str = match["sid"]
+        score = match["score"]
+        reasoning = match["reasoning"]
+        pros = match["pros"]
+        cons = match["cons"]
 
         scenario = scenario_map.get(sid_str)
         if scenario is None:
             continue
 
-        s_name = scenario.name if hasattr(scenario, "name") else scenario.get("name", sid_str)
-        s_emoji = scenario.emoji if hasattr(scenario, "emoji") else scenario.get("emoji", "")
-        s_skills = scenario.skill_ids if hasattr(scenario, "skill_ids") else scenario.get("skill_ids", [])
-        s_cost = scenario.estimated_cost_usd if hasattr(scenario, "estimated_cost_usd") else scenario.get("estimated_cost_usd", 0)
-        s_timeline = scenario.estimated_timeline_days if hasattr(scenario, "estimated_timeline_days") else scenario.get("estimated_timeline_days", "")
+        s_name = _field(scenario, "name", sid_str)
+        s_emoji = _field(scenario, "emoji", "")
+        s_skills = _field(scenario, "skill_ids", [])
+        s_cost = _field(scenario, "estimated_cost_usd", 0)
+        s_timeline = _field(scenario, "estimated_timeline_days", "")
+        pct = int(score * 100)
+
+        if plain:
+            plain_lines.append(
+                f"#{idx + 1} {s_name} ({sid_str}) - {pct}% match"
+                f"{' (recommended)' if idx == 0 else ''}"
+            )
+            plain_lines.append(
+                f"   skills={len(s_skills)} cost=${s_cost} timeline={s_timeline}"
+            )
+            if reasoning:
+                plain_lines.append(f"   {reasoning}")
+            plain_lines.extend(f"   + {p}" for p in pros)
+            plain_lines.extend(f"   x {c}" for c in cons)
+            continue
 
         label = "  [bold green]<- RECOMMENDED[/bold green]" if idx == 0 else ""
-        pct = int(score * 100)
 
         lines = [
             f"[bold]Match:[/bold] {pct}%{label}",
@@ -127,7 +296,12 @@ def render_scenario_cards(matches: list, scenarios: list, console: Console) -> N
                 lines.append(f"  [red]x {c}[/red]")
 
         title = f"#{idx + 1} - {s_emoji} {s_name}"
-        console.print(Panel("\n".join(lines), title=title, border_style="cyan" if idx == 0 else "dim"))
+        panels.append(Panel("\n".join(lines), title=title, border_style="cyan" if idx == 0 else "dim"))
+
+    if plain_lines:
+        console.out("\n".join(plain_lines), highlight=False)
+    elif panels:
+        console.print(Group(*panels))
 
 
 # ---------------------------------------------------------------------------
@@ -136,12 +310,7 @@ def render_scenario_cards(matches: list, scenarios: list, console: Console) -> N
 
 def render_wave_table(waves: List[Wave], console: Console) -> None:
     """Display wave plan overview table with totals."""
-    table = Table(show_header=True, title="Wave Plan")
-    table.add_column("Wave", style="cyan", justify="right")
-    table.add_column("Name")
-    table.add_column("Text Skills", justify="right")
-    table.add_column("Visual Assets", justify="right")
-    table.add_column("Est. Cost", justify="right", style="green")
+    table = _make_table("Wave Plan", _WAVE_PLAN_COLUMNS)
 
     total_text = 0
     total_visual = 0
@@ -181,26 +350,28 @@ def render_wave_table(waves: List[Wave], console: Console) -> None:
 
 def render_wave_progress(wave: Wave, state: dict, console: Console) -> None:
     """Display execution progress for a single wave."""
-    items: list[str] = []
+    buf = io.StringIO()
+    write = buf.write
 
     skills_state = state.get("text_skills", {})
     assets_state = state.get("visual_assets", {})
 
     if wave.text_skills:
-        items.append("[bold]Text Skills[/bold]")
+        write("[bold]Text Skills[/bold]")
         for skill_id in wave.text_skills:
-            s = skills_state.get(skill_id, {})
-            items.append(_format_status_line(skill_id, s))
+            write("\n")
+            write(_format_status_line(skill_id, skills_state.get(skill_id, {})))
 
     if wave.visual_assets:
-        items.append("")
-        items.append("[bold]Visual Assets[/bold]")
+        if wave.text_skills:
+            write("\n")
+        write("\n[bold]Visual Assets[/bold]")
         for asset_id in wave.visual_assets:
-            a = assets_state.get(asset_id, {})
-            items.append(_format_status_line(asset_id, a))
+            write("\n")
+            write(_format_status_line(asset_id, assets_state.get(asset_id, {})))
 
     title = f"Wave {wave.number} - {wave.name}"
-    console.print(Panel("\n".join(items), title=title, border_style="cyan"))
+    console.print(Panel(buf.getvalue(), title=title, border_style="cyan"))
 
 
 def _format_status_line(item_id: str, info: dict) -> str:
@@ -228,11 +399,7 @@ def render_skill_prompt(skill_id: str, prompt: str, output_path: str, console: C
 
 def render_cost_summary(waves: List[Wave], console: Console) -> None:
     """Display budget breakdown table."""
-    table = Table(show_header=True, title="Budget Breakdown")
-    table.add_column("Wave", style="cyan", justify="right")
-    table.add_column("Text Cost", justify="right", style="green")
-    table.add_column("Visual Cost", justify="right", style="green")
-    table.add_column("Total", justify="right", style="bold green")
+    table = _make_table("Budget Breakdown", _BUDGET_COLUMNS)
 
     sum_text = 0.0
     sum_visual = 0.0
@@ -266,37 +433,9 @@ def render_cost_summary(waves: List[Wave], console: Console) -> None:
 # Dry-run cost preview (detailed per-asset breakdown)
 # ---------------------------------------------------------------------------
 
-# Asset cost per seed (mirrors VISUAL_ASSET_COSTS in wave_planner.py)
-_ASSET_COSTS = {
-    "2A": 0.08, "2B": 0.05, "2C": 0.05,
-    "3A": 0.05, "3B": 0.05, "3C": 0.05,
-    "4A": 0.08, "4B": 0.05,
-    "5A": 0.04, "5B": 0.08, "5C": 0.04,
-    "7A": 0.08, "8A": 0.08,
-    "APP-ICON": 0.05, "OG-IMAGE": 0.08, "IG-STORY": 0.08,
-    "APP-SCREENSHOT": 0.08, "PITCH-HERO": 0.08,
-    "TWITTER-HEADER": 0.08, "EMAIL-HERO": 0.08,
-}
-
-_ASSET_MODELS = {
-    "2A": "nano-banana-pro", "2B": "nano-banana-pro", "2C": "nano-banana-pro",
-    "3A": "nano-banana-pro", "3B": "nano-banana-pro", "3C": "nano-banana-pro",
-    "4A": "nano-banana-pro", "4B": "nano-banana-pro",
-    "5A": "nano-banana-pro", "5B": "nano-banana-pro", "5C": "nano-banana-pro",
-    "5D": "nano-banana-pro",
-    "7A": "nano-banana-pro", "8A": "nano-banana-pro",
-    "9A": "nano-banana-pro",
-    "10A": "nano-banana-pro", "10B": "nano-banana-pro", "10C": "nano-banana-pro",
-    "APP-ICON": "nano-banana-pro", "OG-IMAGE": "nano-banana-pro",
-    "IG-STORY": "nano-banana-pro", "APP-SCREENSHOT": "nano-banana-pro",
-    "PITCH-HERO": "nano-banana-pro", "TWITTER-HEADER": "nano-banana-pro",
-    "EMAIL-HERO": "nano-banana-pro",
-}
-
-
 def _resolve_display_model(asset_id: str, config: Optional[dict] = None) -> str:
     """Resolve the effective model for display, checking config overrides."""
-    registry_model = _ASSET_MODELS.get(asset_id, "nano-banana-pro")
+    registry_model = _ASSET_INFO.get(asset_id, _ASSET_DEFAULT)[0]
     if config:
         from ..core.providers.model_mapping import resolve_model
         return resolve_model(asset_id, registry_model, config)
@@ -321,22 +460,22 @@ def render_cost_preview(
     console.print(f"[bold cyan]{Icons.SPARKLE} Cost Preview[/bold cyan] (dry-run)")
     console.print(f"[dim]Seeds per asset: {seeds}[/dim]\n")
 
+    # One traversal of the waves feeds both tables.
+    info_get = _ASSET_INFO.get
+    total_text = 0
+    all_assets: List[str] = []
+    for w in waves:
+        total_text += len(w.text_skills)
+        all_assets += w.visual_assets
+    visual_cost = sum(info_get(a, _ASSET_DEFAULT)[1] * seeds for a in all_assets)
+
     if show_assets:
         # Detailed asset table
-        asset_table = Table(show_header=True, title="Visual Asset Costs")
-        asset_table.add_column("Asset", style="cyan")
-        asset_table.add_column("Model", style="dim")
-        asset_table.add_column("× Seeds", justify="right")
-        asset_table.add_column("Cost", justify="right", style="green")
+        asset_table = _make_table("Visual Asset Costs", _ASSET_COST_COLUMNS)
 
         total_asset_cost = 0.0
-        all_assets = []
-        for w in waves:
-            all_assets.extend(w.visual_assets)
-
-        for asset_id in sorted(set(all_assets)):
-            model = _resolve_display_model(asset_id)
-            cost_per = _ASSET_COSTS.get(asset_id, 0.08)
+        for asset_id in sorted({*all_assets}):
+            model, cost_per = info_get(asset_id, _ASSET_DEFAULT)
             cost = cost_per * seeds
             total_asset_cost += cost
             asset_table.add_row(
@@ -357,19 +496,10 @@ def render_cost_preview(
         console.print()
 
     # Summary table
-    summary_table = Table(show_header=True, title="Cost Summary")
-    summary_table.add_column("Category")
-    summary_table.add_column("Items", justify="right")
-    summary_table.add_column("Cost", justify="right", style="green")
+    summary_table = _make_table("Cost Summary", _COST_SUMMARY_COLUMNS)
 
-    total_text = sum(len(w.text_skills) for w in waves)
-    total_visual = sum(len(w.visual_assets) for w in waves)
+    total_visual = len(all_assets)
     text_cost = total_text * (_TEXT_COST_PER_SKILL / 1000)  # Convert to dollars
-    visual_cost = sum(
-        _ASSET_COSTS.get(a, 0.08) * seeds
-        for w in waves
-        for a in w.visual_assets
-    )
 
     summary_table.add_row(
         f"{Icons.SKILL} Text Skills",
@@ -399,32 +529,30 @@ def render_cost_preview(
 
 def prompt_scenario_selection(matches: list, console: Console) -> str:
     """Interactive scenario picker. Returns selected scenario_id string."""
-    console.print("\n[bold]Select a scenario:[/bold]\n")
-
-    for idx, match in enumerate(matches):
-        sid = match.scenario_id if hasattr(match, "scenario_id") else match.get("scenario_id", "")
-        sid_str = sid.value if hasattr(sid, "value") else str(sid)
-        score = match.match_score if hasattr(match, "match_score") else match.get("match_score", 0)
+    rows = normalize_matches(matches)
+    lines = ["\n[bold]Select a scenario:[/bold]\n"]
+    for idx, row in enumerate(rows):
         label = " [green](recommended)[/green]" if idx == 0 else ""
-        console.print(f"  [{idx + 1}] {sid_str} ({int(score * 100)}%){label}")
+        lines.append(f"  [{idx + 1}] {row['sid']} ({int(row['score'] * 100)}%){label}")
+    console.print("\n".join(lines))
 
     choice = IntPrompt.ask(
         "\nEnter number",
         default=1,
         console=console,
     )
-    choice = max(1, min(choice, len(matches)))
-    selected = matches[choice - 1]
-    sid = selected.scenario_id if hasattr(selected, "scenario_id") else selected.get("scenario_id", "")
-    return sid.value if hasattr(sid, "value") else str(sid)
+    choice = max(1, min(choice, len(rows)))
+    return rows[choice - 1]["sid"]
 
 
 def prompt_wave_selection(console: Console) -> Optional[str]:
     """Ask user which waves to run. Returns wave range string or None for all."""
-    console.print("\n[bold]Wave execution:[/bold]\n")
-    console.print("  [1] Execute all waves")
-    console.print("  [2] Select wave range (e.g., 1-3)")
-    console.print("  [3] Exit")
+    console.print(
+        "\n[bold]Wave execution:[/bold]\n\n"
+        "  [1] Execute all waves\n"
+        "  [2] Select wave range (e.g., 1-3)\n"
+        "  [3] Exit"
+    )
 
     choice = IntPrompt.ask("\nEnter choice", default=1, console=console)
 
@@ -444,35 +572,37 @@ def render_execution_summary(state_data: dict, console: Console) -> None:
     """Final summary after execution completes."""
     waves = state_data.get("waves", {})
     total_waves = len(waves)
-    completed_waves = sum(
-        1 for w in waves.values()
-        if w.get("status") == "completed"
-    )
 
+    completed_waves = 0
     total_skills = 0
     total_assets = 0
     total_cost = 0.0
 
     for w in waves.values():
-        ts = w.get("text_skills", {})
-        va = w.get("visual_assets", {})
-        total_skills += sum(1 for s in ts.values() if s.get("status") == "completed")
-        total_assets += sum(1 for a in va.values() if a.get("status") == "completed")
+        if w.get("status") == "completed":
+            completed_waves += 1
+        for s in w.get("text_skills", {}).values():
+            if s.get("status") == "completed":
+                total_skills += 1
+        for a in w.get("visual_assets", {}).values():
+            if a.get("status") == "completed":
+                total_assets += 1
         total_cost += w.get("estimated_cost", 0.0)
 
     state_path = state_data.get("state_file", "execution-state.json")
 
-    lines = [
-        f"[bold]Waves completed:[/bold] {completed_waves}/{total_waves}",
-        f"[bold]Text skills run:[/bold] {total_skills}",
-        f"[bold]Visual assets generated:[/bold] {total_assets}",
-        f"[bold]Estimated cost:[/bold] [green]${total_cost:.2f}[/green]",
-        f"\n[dim]State file: {state_path}[/dim]",
-    ]
+    waves_label, skills_label, assets_label, cost_label = _SUMMARY_LABELS
+    body = Text.assemble(
+        waves_label, f" {completed_waves}/{total_waves}\n",
+        skills_label, f" {total_skills}\n",
+        assets_label, f" {total_assets}\n",
+        cost_label, " ", (f"${total_cost:.2f}", "green"), "\n\n",
+        (f"State file: {state_path}", "dim"),
+    )
 
     console.print()
     console.print(Panel(
-        "\n".join(lines),
+        body,
         title="Execution Summary",
         border_style="green",
     ))
@@ -1,11 +1,16 @@
 """
 Brandmint CLI — Visual subcommands.
 Delegates to existing scripts/run_pipeline.py and scripts/generate_pipeline.py.
+
+The scripts' main(argv) entry points run in-process; set
+BRANDMINT_CLI_SUBPROCESS=1 to run each in a fresh interpreter instead.
 """
+import importlib
 import os
 import json
 import sys
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 from rich.console import Console
@@ -19,19 +24,22 @@ from ..pipeline.inference_runbook import (
 
 console = Console()
 
-# Resolve the scripts directory relative to package
-SCRIPTS_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "scripts")
-
 
+@lru_cache(maxsize=1)
 def _resolve_scripts_dir():
-    """Find the scripts directory (supports both installed and dev modes)."""
-    # Dev mode: brandmint/brandmint/cli/ -> brandmint/scripts/
-    dev_path = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "..", "scripts"))
+    """Find the scripts directory (supports both installed and dev modes).
+
+    Resolved once per process; a missing directory exits and is not cached.
+    """
+    package_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    # Dev mode: brandmint/brandmint/ -> brandmint/scripts/
+    dev_path = os.path.join(os.path.dirname(package_dir), "scripts")
     if os.path.isdir(dev_path):
         return dev_path
 
     # Installed mode: check relative to package
-    pkg_path = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "..", "..", "scripts"))
+    pkg_path = os.path.join(os.path.dirname(os.path.dirname(package_dir)), "scripts")
     if os.path.isdir(pkg_path):
         return pkg_path
 
@@ -39,6 +47,31 @@ def _resolve_scripts_dir():
     sys.exit(1)
 
 
+def _run_script(cmd: list) -> int:
+    """Run ``[python, script, *args]`` and return its exit code.
+
+    The script is imported once (its directory goes on sys.path) and its
+    ``main(argv)`` is called directly, so repeated commands skip interpreter
+    startup and keep module-level caches warm.
+    """
+    script, args = cmd[1], cmd[2:]
+    if os.environ.get("BRANDMINT_CLI_SUBPROCESS") == "1":
+        return subprocess.run(cmd).returncode
+
+    script_dir = os.path.dirname(script)
+    if script_dir not in sys.path:
+        sys.path.insert(0, script_dir)
+    module = importlib.import_module(os.path.splitext(os.path.basename(script))[0])
+    try:
+        module.main(args)
+    except SystemExit as exc:
+        if exc.code is None or isinstance(exc.code, int):
+            return exc.code or 0
+        print(exc.code, file=sys.stderr)
+        return 1
+    return 0
+
+
 def run_generate(config: Path, output_dir: Optional[str] = None, assets: Optional[str] = None):
     """Generate pipeline scripts from brand config."""
     scripts_dir = _resolve_scripts_dir()
@@ -55,8 +88,7 @@ def run_generate(config: Path, output_dir: Optional[str] = None, assets: Optiona
         cmd.extend(["--assets", assets])
 
     console.print(f"[dim]Running: {' '.join(cmd)}[/dim]")
-    result = subprocess.run(cmd)
-    sys.exit(result.returncode)
+    sys.exit(_run_script(cmd))
 
 
 def run_execute(config: Path, batch: str = "all", output_dir: Optional[str] = None, force: bool = False):
@@ -71,8 +103,7 @@ def run_execute(config: Path, batch: str = "all", output_dir: Optional[str] = No
         cmd.append("--force")
 
     console.print(f"[dim]Running: {' '.join(cmd)}[/dim]")
-    result = subprocess.run(cmd)
-    sys.exit(result.returncode)
+    sys.exit(_run_script(cmd))
 
 
 def run_preview(config: Path, assets: Optional[str] = None, json_output: bool = False):
@@ -86,8 +117,7 @@ def run_preview(config: Path, assets: Optional[str] = None, json_output: bool =
     if json_output:
         cmd.append("--json")
 
-    result = subprocess.run(cmd)
-    sys.exit(result.returncode)
+    sys.exit(_run_script(cmd))
 
 
 def run_status(config: Path, output_dir: Optional[str] = None):
@@ -99,8 +129,7 @@ def run_status(config: Path, output_dir: Optional[str] = None):
     if output_dir:
         cmd.extend(["--output-dir", output_dir])
 
-    result = subprocess.run(cmd)
-    sys.exit(result.returncode)
+    sys.exit(_run_script(cmd))
 
 
 def run_verify(config: Path, output_dir: Optional[str] = None):
@@ -112,8 +141,7 @@ def run_verify(config: Path, output_dir: Optional[str] = None):
     if output_dir:
         cmd.extend(["--output-dir", output_dir])
 
-    result = subprocess.run(cmd)
-    sys.exit(result.returncode)
+    sys.exit(_run_script(cmd))
 
 
 def run_diff(left: Path, right: Path, json_output: bool = False, strict: bool = False) -> int:
@@ -0,0 +1,95 @@
+"""
+Brandmint CLI — `bm visual` visual subcommands.
+
+Loaded on demand by :class:`brandmint.cli.app.LazyGroup`.
+"""
+import typer
+from pathlib import Path
+from typing import Optional
+
+from ._options import CONFIG_OPTION, OutputDir
+
+app = typer.Typer(name="visual", help="Visual asset pipeline (generate, execute, preview)", no_args_is_help=True)
+
+
+@app.command("generate")
+def visual_generate(
+    config: Path = CONFIG_OPTION,
+    output_dir: OutputDir = None,
+    assets: Optional[str] = typer.Option(None, "--assets", "-a", help="Comma-separated asset IDs"),
+):
+    """Generate pipeline scripts from brand config."""
+    from .visual import run_generate
+    run_generate(config, output_dir=output_dir, assets=assets)
+
+
+@app.command("execute")
+def visual_execute(
+    config: Path = CONFIG_OPTION,
+    batch: str = typer.Option("all", "--batch", "-b", help="Batch to run: anchor, identity, products, etc."),
+    output_dir: OutputDir = None,
+    force: bool = typer.Option(False, "--force", "-f", help="Bypass cache, regenerate all assets"),
+):
+    """Execute generated pipeline scripts."""
+    from .visual import run_execute
+    run_execute(config, batch=batch, output_dir=output_dir, force=force)
+
+
+@app.command("preview")
+def visual_preview(
+    config: Path = CONFIG_OPTION,
+    assets: Optional[str] = typer.Option(None, "--assets", "-a", help="Comma-separated asset IDs"),
+    json_output: bool = typer.Option(False, "--json", help="Output as JSON (for agents)"),
+):
+    """Preview budget and smart recommendations."""
+    from .visual import run_preview
+    run_preview(config, assets=assets, json_output=json_output)
+
+
+@app.command("status")
+def visual_status(
+    config: Path = CONFIG_OPTION,
+    output_dir: OutputDir = None,
+):
+    """Show which assets exist and which are missing."""
+    from .visual import run_status
+    run_status(config, output_dir=output_dir)
+
+
+@app.command("verify")
+def visual_verify(
+    config: Path = CONFIG_OPTION,
+    output_dir: OutputDir = None,
+):
+    """Validate all generated asset files."""
+    from .visual import run_verify
+    run_verify(config, output_dir=output_dir)
+
+
+@app.command("diff")
+def visual_diff(
+    left: Path = typer.Option(..., "--left", help="Left runbook JSON path"),
+    right: Path = typer.Option(..., "--right", help="Right runbook JSON path"),
+    json_output: bool = typer.Option(False, "--json", help="Output JSON diff"),
+    strict: bool = typer.Option(False, "--strict", help="Exit non-zero if any differences"),
+):
+    """Diff two inference runbooks (routing, skills, prompt fingerprint)."""
+    from .visual import run_diff
+
+    code = run_diff(left=left, right=right, json_output=json_output, strict=strict)
+    if code != 0:
+        raise typer.Exit(code=code)
+
+
+@app.command("contract-verify")
+def visual_contract_verify(
+    runbook: Path = typer.Option(..., "--runbook", help="Runbook JSON path"),
+    strict: bool = typer.Option(False, "--strict", help="Exit non-zero if contracts fail"),
+    json_output: bool = typer.Option(False, "--json", help="Output JSON"),
+):
+    """Validate generated outputs against runbook expected output contract."""
+    from .visual import run_contract_verify
+
+    code = run_contract_verify(runbook=runbook, strict=strict, json_output=json_output)
+    if code != 0:
+        raise typer.Exit(code=code)
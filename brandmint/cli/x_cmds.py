@@ -0,0 +1,226 @@
+"""
+Brandmint CLI — `bm x` X/Twitter automation subcommands.
+
+Loaded on demand by :class:`brandmint.cli.app.LazyGroup`.
+"""
+import typer
+from typing import Optional
+
+from ._rich_lazy import Table
+from .app import _console
+
+app = typer.Typer(name="x", help="X/Twitter automation with dry-run safeguards", no_args_is_help=True)
+
+
+@app.command("preflight")
+def x_preflight(
+    json_output: bool = typer.Option(False, "--json", help="Output JSON"),
+):
+    """Run OAuth/scope checks before X automation."""
+    from ..automation.x_preflight import run_preflight
+
+    result = run_preflight()
+    if json_output:
+        _console().print_json(data=result.to_dict())
+    else:
+        for check in result.checks:
+            icon = "[green]✓[/green]" if check.passed else "[red]✗[/red]"
+            _console().print(f"  {icon} {check.name}: {check.message}")
+        _console().print()
+        if result.all_passed:
+            _console().print("[green]All preflight checks passed.[/green]")
+        else:
+            _console().print(f"[yellow]{result.summary}[/yellow]")
+            raise typer.Exit(code=1)
+
+
+@app.command("post")
+def x_post(
+    text: str = typer.Option(..., "--text", "-t", help="Tweet text"),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Preview without posting"),
+    json_output: bool = typer.Option(False, "--json", help="Output JSON"),
+):
+    """Post a tweet."""
+    from ..automation.x_actions import XAction, XActionExecutor, XActionRequest
+    from ..automation.x_audit import XAuditLog
+
+    executor = XActionExecutor()
+    audit = XAuditLog()
+    request = XActionRequest(action=XAction.POST_TWEET, payload={"text": text}, dry_run=dry_run)
+    result = executor.execute(request)
+    audit.log_action(action=request.action.value, payload=request.payload, dry_run=dry_run, success=result.success, error=result.error, response=result.response)
+
+    if json_output:
+        _console().print_json(data=result.to_dict())
+    elif result.success:
+        if dry_run:
+            _console().print(f"[yellow]DRY RUN:[/yellow] Would post tweet via {result.response.get('app', 'unknown')}")
+        else:
+            _console().print(f"[green]Tweet posted.[/green]")
+    else:
+        _console().print(f"[red]Failed:[/red] {result.error}")
+        raise typer.Exit(code=1)
+
+
+@app.command("like")
+def x_like(
+    tweet_id: str = typer.Option(..., "--tweet-id", help="Tweet ID to like"),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Preview without liking"),
+    json_output: bool = typer.Option(False, "--json", help="Output JSON"),
+):
+    """Like a tweet."""
+    from ..automation.x_actions import XAction, XActionExecutor, XActionRequest
+    from ..automation.x_audit import XAuditLog
+
+    executor = XActionExecutor()
+    audit = XAuditLog()
+    request = XActionRequest(action=XAction.POST_LIKE, payload={"tweet_id": tweet_id}, dry_run=dry_run)
+    result = executor.execute(request)
+    audit.log_action(action=request.action.value, payload=request.payload, dry_run=dry_run, success=result.success, error=result.error)
+
+    if json_output:
+        _console().print_json(data=result.to_dict())
+    elif result.success:
+        _console().print(f"[yellow]DRY RUN:[/yellow] Would like tweet {tweet_id}" if dry_run else f"[green]Liked tweet {tweet_id}.[/green]")
+    else:
+        _console().print(f"[red]Failed:[/red] {result.error}")
+        raise typer.Exit(code=1)
+
+
+@app.command("retweet")
+def x_retweet(
+    tweet_id: str = typer.Option(..., "--tweet-id", help="Tweet ID to retweet"),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Preview without retweeting"),
+    json_output: bool = typer.Option(False, "--json", help="Output JSON"),
+):
+    """Retweet a tweet."""
+    from ..automation.x_actions import XAction, XActionExecutor, XActionRequest
+    from ..automation.x_audit import XAuditLog
+
+    executor = XActionExecutor()
+    audit = XAuditLog()
+    request = XActionRequest(action=XAction.POST_RETWEET, payload={"tweet_id": tweet_id}, dry_run=dry_run)
+    result = executor.execute(request)
+    audit.log_action(action=request.action.value, payload=request.payload, dry_run=dry_run, success=result.success, error=result.error)
+
+    if json_output:
+        _console().print_json(data=result.to_dict())
+    elif result.success:
+        _console().print(f"[yellow]DRY RUN:[/yellow] Would retweet {tweet_id}" if dry_run else f"[green]Retweeted {tweet_id}.[/green]")
+    else:
+        _console().print(f"[red]Failed:[/red] {result.error}")
+        raise typer.Exit(code=1)
+
+
+@app.command("dm")
+def x_dm(
+    user: str = typer.Option(..., "--user", "-u", help="X handle to DM"),
+    text: str = typer.Option(..., "--text", "-t", help="Message text"),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Preview without sending"),
+    json_output: bool = typer.Option(False, "--json", help="Output JSON"),
+):
+    """Send a direct message."""
+    from ..automation.x_actions import XAction, XActionExecutor, XActionRequest
+    from ..automation.x_audit import XAuditLog
+
+    executor = XActionExecutor()
+    audit = XAuditLog()
+    request = XActionRequest(action=XAction.DM_SEND, payload={"user": user, "text": text}, dry_run=dry_run)
+    result = executor.execute(request)
+    audit.log_action(action=request.action.value, payload=request.payload, dry_run=dry_run, success=result.success, error=result.error)
+
+    if json_output:
+        _console().print_json(data=result.to_dict())
+    elif result.success:
+        _console().print(f"[yellow]DRY RUN:[/yellow] Would DM @{user}" if dry_run else f"[green]DM sent to @{user}.[/green]")
+    else:
+        _console().print(f"[red]Failed:[/red] {result.error}")
+        raise typer.Exit(code=1)
+
+
+@app.command("follow")
+def x_follow(
+    user: str = typer.Option(..., "--user", "-u", help="X handle to follow"),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Preview without following"),
+    json_output: bool = typer.Option(False, "--json", help="Output JSON"),
+):
+    """Follow a user."""
+    from ..automation.x_actions import XAction, XActionExecutor, XActionRequest
+    from ..automation.x_audit import XAuditLog
+
+    executor = XActionExecutor()
+    audit = XAuditLog()
+    request = XActionRequest(action=XAction.USER_FOLLOW, payload={"user": user}, dry_run=dry_run)
+    result = executor.execute(request)
+    audit.log_action(action=request.action.value, payload=request.payload, dry_run=dry_run, success=result.success, error=result.error)
+
+    if json_output:
+        _console().print_json(data=result.to_dict())
+    elif result.success:
+        _console().print(f"[yellow]DRY RUN:[/yellow] Would follow @{user}" if dry_run else f"[green]Following @{user}.[/green]")
+    else:
+        _console().print(f"[red]Failed:[/red] {result.error}")
+        raise typer.Exit(code=1)
+
+
+@app.command("audit")
+def x_audit(
+    since: Optional[str] = typer.Option(None, "--since", help="ISO date filter (e.g., 2026-03-20)"),
+    action: Optional[str] = typer.Option(None, "--action", "-a", help="Filter by action type"),
+    limit: int = typer.Option(20, "--limit", "-l", help="Max entries to show"),
+    json_output: bool = typer.Option(False, "--json", help="Output JSON"),
+):
+    """Query X automation audit log."""
+    from ..automation.x_audit import XAuditLog
+
+    audit = XAuditLog()
+    entries = audit.query(since=since, action=action, limit=limit)
+
+    if json_output:
+        _console().print_json(data=[e.to_json() for e in entries])
+    elif not entries:
+        _console().print("[dim]No audit entries found.[/dim]")
+    else:
+        table = Table(title="X Audit Log", show_header=True, header_style="bold cyan")
+        table.add_column("Timestamp", style="dim")
+        table.add_column("Action")
+        table.add_column("Dry Run")
+        table.add_column("Success")
+        table.add_column("Operator")
+        table.add_column("Error", style="red")
+
+        for entry in entries:
+            table.add_row(
+                entry.timestamp[:19],
+                entry.action,
+                "✓" if entry.dry_run else "",
+                "[green]✓[/green]" if entry.success else "[red]✗[/red]",
+                entry.operator,
+                (entry.error or "")[:40],
+            )
+        _console().print(table)
+
+
+@app.command("smoke-test")
+def x_smoke_test(
+    account: Optional[str] = typer.Option(None, "--account", help="Test account handle"),
+    dry_run: bool = typer.Option(True, "--dry-run/--live", help="Run in dry-run mode (default: True)"),
+    json_output: bool = typer.Option(False, "--json", help="Output JSON"),
+):
+    """Run smoke test against a safe test account."""
+    from ..automation.x_smoke_test import run_smoke_test
+
+    result = run_smoke_test(safe_account=account, dry_run=dry_run)
+    if json_output:
+        _console().print_json(data=result.to_dict())
+    else:
+        for step in result.steps:
+            icon = "[green]✓[/green]" if step.passed else "[red]✗[/red]"
+            msg = step.error or "OK"
+            _console().print(f"  {icon} {step.name}: {msg}")
+        _console().print()
+        if result.all_passed:
+            _console().print(f"[green]{result.summary}[/green]")
+        else:
+            _console().print(f"[red]{result.summary}[/red]")
+            raise typer.Exit(code=1)
@@ -10,12 +10,23 @@ Implements intelligent caching to avoid redundant API calls:
 import hashlib
 import json
 import shutil
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict
 from typing import Optional, Any
 import yaml
 
+from .yaml_compat import YamlLoader as _YamlLoader
+
+# orjson (optional, brandmint[notifications]) parses entries on the get()
+# path; stdlib json is the fallback and always does the writing.
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 
 # Default cache directory
 DEFAULT_CACHE_DIR = Path.home() / ".cache" / "brandmint"
@@ -23,6 +34,41 @@ DEFAULT_CACHE_DIR = Path.home() / ".cache" / "brandmint"
 # Cache expiration (default: 7 days)
 DEFAULT_EXPIRATION_DAYS = 7
 
+# The index change log is folded into index.json once it holds more than
+# twice as many lines as there are live entries (and at least this many).
+_LOG_COMPACT_MIN_LINES = 64
+
+# Parsed entries kept in memory per PromptCache, least recently used first out.
+_MEMORY_ENTRIES = 256
+
+
+def _digest(*parts: str) -> str:
+    """16-hex-char BLAKE2b digest of ``parts`` joined by ``:``.
+
+    Cache addressing only; parts are fed incrementally so long prompts are
+    not copied into a joined string first.
+    """
+    h = hashlib.blake2b(digest_size=8)
+    h.update(parts[0].encode())
+    for part in parts[1:]:
+        h.update(b":")
+        h.update(part.encode())
+    return h.hexdigest()
+
+
+def _read_json(path: Path) -> Any:
+    """Parse a JSON cache file."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _write_json(path: Path, data: Any):
+    """Write a compact JSON cache file."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, separators=(",", ":"))
+
 
 @dataclass
 class CacheEntry:
@@ -49,7 +95,11 @@ class PromptCache:
     """
     Cache for prompts and their generated outputs.
     
-    Uses content hash as key to detect identical prompts.
+    Uses content hash as key to detect identical prompts. Index changes
+    are appended to ``index.log`` and folded into the ``index.json``
+    snapshot by :meth:`compact`. Recently used entries are also held in
+    memory, so values returned by :meth:`get` are shared and must not be
+    mutated.
     """
     
     def __init__(
@@ -60,29 +110,94 @@ class PromptCache:
         self.cache_dir = cache_dir or DEFAULT_CACHE_DIR
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.expiration_days = expiration_days
-        self._index_path = self.cache_dir / "index.yaml"
+        self._index_path = self.cache_dir / "index.json"
+        self._log_path = self.cache_dir / "index.log"
         self._index = self._load_index()
+        self._memory: OrderedDict = OrderedDict()
+        self._memory_lock = threading.Lock()
     
     def _load_index(self) -> dict:
-        """Load cache index from disk."""
-        if self._index_path.exists():
-            with open(self._index_path) as f:
-                return yaml.safe_load(f) or {}
-        return {}
+        """Load the index snapshot and replay the change log over it."""
+        try:
+            index = _read_json(self._index_path) or {}
+        except FileNotFoundError:
+            legacy_index = self.cache_dir / "index.yaml"
+            index = self._migrate_yaml(legacy_index) if legacy_index.exists() else {}
+        
+        self._log_lines = 0
+        torn = False
+        try:
+            with open(self._log_path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        torn = True  # write cut short by an interrupted run
+                        continue
+                    self._log_lines += 1
+                    if record["op"] == "set":
+                        index[record["key"]] = record["meta"]
+                    else:
+                        index.pop(record["key"], None)
+        except FileNotFoundError:
+            pass
+        if torn:
+            # Later appends would run on from the partial line; start afresh.
+            _write_json(self._index_path, index)
+            self._log_path.unlink()
+            self._log_lines = 0
+        return index
+    
+    def _migrate_yaml(self, legacy_index: Path) -> dict:
+        """Convert a YAML index and its entry files to JSON (one-time)."""
+        with open(legacy_index, encoding="utf-8") as f:
+            index = yaml.load(f, Loader=_YamlLoader) or {}
+        for key in list(index):
+            legacy_entry = self.cache_dir / f"{key}.yaml"
+            if not legacy_entry.exists():
+                del index[key]
+                continue
+            with open(legacy_entry, encoding="utf-8") as f:
+                _write_json(self._entry_path(key), yaml.load(f, Loader=_YamlLoader))
+            legacy_entry.unlink()
+        _write_json(self._index_path, index)
+        legacy_index.unlink()
+        return index
+    
+    def _append_log(self, record: dict):
+        """Append one index change, compacting once the log outgrows the index."""
+        with open(self._log_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self._log_lines += 1
+        if self._log_lines > max(2 * len(self._index), _LOG_COMPACT_MIN_LINES):
+            self.compact()
+    
+    def compact(self):
+        """Write the index snapshot to disk and truncate the change log."""
+        _write_json(self._index_path, self._index)
+        self._log_path.unlink(missing_ok=True)
+        self._log_lines = 0
+    
+    def _remember(self, key: str, entry: CacheEntry):
+        """Put an entry at the hot end of the in-memory LRU."""
+        with self._memory_lock:
+            self._memory[key] = entry
+            self._memory.move_to_end(key)
+            if len(self._memory) > _MEMORY_ENTRIES:
+                self._memory.popitem(last=False)
     
-    def _save_index(self):
-        """Save cache index to disk."""
-        with open(self._index_path, "w") as f:
-            yaml.safe_dump(self._index, f)
+    def _forget(self, key: str):
+        """Drop an entry from the in-memory LRU."""
+        with self._memory_lock:
+            self._memory.pop(key, None)
     
     def _hash_prompt(self, prompt: str, provider: str = "", model: str = "") -> str:
         """Generate hash key for a prompt."""
-        content = f"{provider}:{model}:{prompt}"
-        return hashlib.sha256(content.encode()).hexdigest()[:16]
+        return _digest(provider, model, prompt)
     
     def _entry_path(self, key: str) -> Path:
         """Get path for a cache entry."""
-        return self.cache_dir / f"{key}.yaml"
+        return self.cache_dir / f"{key}.json"
     
     def get(self, prompt: str, provider: str = "", model: str = "") -> Optional[Any]:
         """
@@ -92,19 +207,24 @@ class PromptCache:
         """
         key = self._hash_prompt(prompt, provider, model)
         
-        if key not in self._index:
-            return None
-        
-        entry_path = self._entry_path(key)
-        if not entry_path.exists():
-            del self._index[key]
-            self._save_index()
-            return None
-        
-        with open(entry_path) as f:
-            data = yaml.safe_load(f)
+        with self._memory_lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
         
-        entry = CacheEntry.from_dict(data)
+        if entry is None:
+            if key not in self._index:
+                return None
+            
+            try:
+                data = _read_json(self._entry_path(key))
+            except FileNotFoundError:
+                del self._index[key]
+                self._append_log({"op": "del", "key": key})
+                return None
+            
+            entry = CacheEntry.from_dict(data)
+            self._remember(key, entry)
         
         if entry.is_expired():
             self.invalidate(prompt, provider, model)
@@ -134,20 +254,22 @@ class PromptCache:
             metadata=metadata or {},
         )
         
-        with open(self._entry_path(key), "w") as f:
-            yaml.safe_dump(entry.to_dict(), f)
+        _write_json(self._entry_path(key), entry.to_dict())
+        self._remember(key, entry)
         
-        self._index[key] = {
+        meta = {
             "prompt_preview": prompt[:100] + "..." if len(prompt) > 100 else prompt,
             "provider": provider,
             "model": model,
             "created_at": entry.created_at,
         }
-        self._save_index()
+        self._index[key] = meta
+        self._append_log({"op": "set", "key": key, "meta": meta})
     
     def invalidate(self, prompt: str, provider: str = "", model: str = ""):
         """Remove a cached entry."""
         key = self._hash_prompt(prompt, provider, model)
+        self._forget(key)
         
         entry_path = self._entry_path(key)
         if entry_path.exists():
@@ -155,7 +277,7 @@ class PromptCache:
         
         if key in self._index:
             del self._index[key]
-            self._save_index()
+            self._append_log({"op": "del", "key": key})
     
     def clear_expired(self) -> int:
         """Remove all expired entries. Returns count of removed entries."""
@@ -165,9 +287,7 @@ class PromptCache:
         for key in list(self._index.keys()):
             entry_path = self._entry_path(key)
             if entry_path.exists():
-                with open(entry_path) as f:
-                    data = yaml.safe_load(f)
-                entry = CacheEntry.from_dict(data)
+                entry = CacheEntry.from_dict(_read_json(entry_path))
                 if entry.is_expired():
                     entry_path.unlink()
                     keys_to_remove.append(key)
@@ -177,9 +297,9 @@ class PromptCache:
         
         for key in keys_to_remove:
             del self._index[key]
+            self._forget(key)
         
-        if keys_to_remove:
-            self._save_index()
+        self.compact()
         
         return removed
     
@@ -189,24 +309,24 @@ class PromptCache:
             shutil.rmtree(self.cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self._index = {}
-        self._save_index()
+        with self._memory_lock:
+            self._memory.clear()
+        self.compact()
     
     def stats(self) -> dict:
         """Get cache statistics."""
         total_entries = len(self._index)
         total_size = sum(
             f.stat().st_size 
-            for f in self.cache_dir.glob("*.yaml")
-            if f.name != "index.yaml"
+            for f in self.cache_dir.glob("*.json")
+            if f.name != "index.json"
         )
         
         expired_count = 0
         for key in self._index:
             entry_path = self._entry_path(key)
             if entry_path.exists():
-                with open(entry_path) as f:
-                    data = yaml.safe_load(f)
-                if CacheEntry.from_dict(data).is_expired():
+                if CacheEntry.from_dict(_read_json(entry_path)).is_expired():
                     expired_count += 1
         
         return {
@@ -283,7 +403,7 @@ class AssetCache:
         metadata: Optional[dict] = None,
     ):
         """Register a generated asset in the cache."""
-        prompt_hash = hashlib.sha256(prompt.encode()).hexdigest()[:16]
+        prompt_hash = _digest(prompt)
         
         self._manifest["assets"][asset_id] = {
             "file_path": str(file_path.absolute()),
@@ -3,7 +3,7 @@ Scenario Recommender - Generates context-aware execution scenarios
 Phase 1 implementation
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from ..models.product import ProductData, LaunchContext, BudgetTier, LaunchChannel, MaturityStage
 from ..models.scenario import (
     Scenario,
@@ -20,6 +20,8 @@ class ScenarioRecommender:
     
     def __init__(self):
         self.scenarios = self._build_scenario_catalog()
+        # ScenarioType is a str enum, so raw ID strings hit this index too.
+        self._scenarios_by_id: Dict[str, Scenario] = {s.id: s for s in self.scenarios}
     
     def recommend(
         self,
@@ -56,12 +58,16 @@ class ScenarioRecommender:
         
         return matches[:limit]
     
+    def find_scenario(self, scenario_id: str) -> Optional[Scenario]:
+        """Get a scenario by ID, or None if it is not in the catalog"""
+        return self._scenarios_by_id.get(scenario_id)
+    
     def get_scenario(self, scenario_id: ScenarioType) -> Scenario:
         """Get a scenario by ID"""
-        for scenario in self.scenarios:
-            if scenario.id == scenario_id:
-                return scenario
-        raise ValueError(f"Scenario not found: {scenario_id}")
+        scenario = self.find_scenario(scenario_id)
+        if scenario is None:
+            raise ValueError(f"Scenario not found: {scenario_id}")
+        return scenario
     
     def _explain_match(
         self,
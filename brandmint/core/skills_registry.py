@@ -9,16 +9,25 @@ from __future__ import annotations
 
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import yaml
 
 from ..models.skill import SkillMetadata, SkillSource, UnifiedSkill
+from .yaml_compat import YamlLoader as _YamlLoader
 
 # Discovery candidates in priority order.
 SKILL_FILE_CANDIDATES = ("SKILL.md", "skill.md", "instructions.md")
 
+# Directories never searched for skills.
+SKIPPED_DIR_NAMES = frozenset({".git", "node_modules", "__pycache__"})
+
+# Skill files are read on a thread pool once a source has more than this many.
+PARALLEL_READ_THRESHOLD = 8
+PARALLEL_READ_WORKERS = 16
+
 # Known compatibility aliases.
 DEFAULT_ID_ALIASES = {
     "buyer-persona": "buyer-persona-generator",
@@ -40,6 +49,14 @@ ALLOWED_CONFLICT_POLICIES = {
 }
 
 
+def _read_skill_text(path: Path):
+    """Read a skill file, returning the OSError instead of raising it."""
+    try:
+        return path.read_text(encoding="utf-8", errors="ignore")
+    except OSError as e:
+        return e
+
+
 class SkillsRegistry:
     """Discovers, merges, and manages skills from multiple sources."""
 
@@ -211,11 +228,12 @@ class SkillsRegistry:
             return None
         try:
             p = Path(path_str).expanduser()
-            if p.exists():
-                return p.resolve()
-            return p.absolute()
         except Exception:
             return None
+        try:
+            return p.resolve(strict=True)
+        except (OSError, RuntimeError):
+            return p.absolute()
 
     def _merge_skills(self, existing: UnifiedSkill, incoming: UnifiedSkill) -> None:
         """Merge incoming data into existing skill record."""
@@ -249,12 +267,12 @@ class SkillsRegistry:
         """Load skills from skills/manifest.yaml."""
         manifest_path = self.skills_dir / "manifest.yaml"
 
-        if not manifest_path.exists():
+        try:
+            with open(manifest_path) as f:
+                data = yaml.load(f, Loader=_YamlLoader)
+        except FileNotFoundError:
             return []
 
-        with open(manifest_path) as f:
-            data = yaml.safe_load(f)
-
         skills = []
         for part in data.get("parts", []):
             for skill_data in part.get("skills", []):
@@ -273,25 +291,34 @@ class SkillsRegistry:
 
     def _load_local_brand_skills(self) -> List[UnifiedSkill]:
         """Discover skills from brandmint repo skills/**/SKILL.md."""
-        if not self.brand_skills_dir.exists():
-            return []
-
-        skills: List[UnifiedSkill] = []
-        for skill_md in self._discover_skill_files(self.brand_skills_dir, recursive=True):
-            skill = self._parse_claude_skill(skill_md)
-            if skill:
-                skills.append(skill)
-
-        return skills
+        return self._parse_skill_files(
+            self._discover_skill_files(self.brand_skills_dir, recursive=True)
+        )
 
     def _load_claude_skills(self) -> List[UnifiedSkill]:
         """Discover skills from ~/.claude/skills/**/(SKILL.md|skill.md|instructions.md)."""
-        if not self.claude_skills_dir.exists():
-            return []
+        return self._parse_skill_files(
+            self._discover_skill_files(self.claude_skills_dir, recursive=True)
+        )
+
+    def _parse_skill_files(self, skill_files: List[Path]) -> List[UnifiedSkill]:
+        """Read skill files (concurrently for large sources), then parse in order.
+
+        Only the file reads run on the pool; parsing registers aliases and
+        warnings, so it stays sequential to keep results deterministic.
+        """
+        if len(skill_files) > PARALLEL_READ_THRESHOLD:
+            with ThreadPoolExecutor(max_workers=PARALLEL_READ_WORKERS) as pool:
+                contents = list(pool.map(_read_skill_text, skill_files))
+        else:
+            contents = [_read_skill_text(path) for path in skill_files]
 
         skills: List[UnifiedSkill] = []
-        for skill_md in self._discover_skill_files(self.claude_skills_dir, recursive=True):
-            skill = self._parse_claude_skill(skill_md)
+        for skill_md, content in zip(skill_files, contents):
+            if isinstance(content, OSError):
+                self._warn(f"Failed to parse {skill_md}: {content}")
+                continue
+            skill = self._parse_claude_skill(skill_md, content)
             if skill:
                 skills.append(skill)
 
@@ -299,35 +326,57 @@ class SkillsRegistry:
 
     def _discover_skill_files(self, base_dir: Path, recursive: bool = True) -> List[Path]:
         """Discover candidate skill markdown files with deterministic precedence."""
-        if not base_dir.exists():
+        if SKIPPED_DIR_NAMES.intersection(base_dir.parts):
             return []
 
-        selected_by_parent: Dict[str, Path] = {}
-
-        for candidate in SKILL_FILE_CANDIDATES:
-            iterator = base_dir.rglob(candidate) if recursive else base_dir.glob(f"*/{candidate}")
-            for file_path in iterator:
-                if not file_path.is_file():
-                    continue
-                parts = set(file_path.parts)
-                if ".git" in parts or "node_modules" in parts or "__pycache__" in parts:
-                    continue
-                # Vendor upstream snapshots are source archives, not active skill surfaces.
-                if "external" in parts and "upstream" in parts:
-                    continue
+        selected: List[Path] = []
+
+        # One scandir walk instead of an rglob per candidate name. DirEntry
+        # carries the file type from the directory listing, so telling
+        # directories from candidate files needs no per-entry stat; excluded
+        # directories are pruned rather than descended into.
+        stack = [(base_dir, 0)]
+        while stack:
+            parent, depth = stack.pop()
+            parts = parent.parts
+            # Vendor upstream snapshots are source archives, not active skill surfaces.
+            if "external" in parts and "upstream" in parts:
+                continue
+            try:
+                with os.scandir(parent) as it:
+                    entries = list(it)
+            except OSError:
+                continue
 
-                parent_key = str(file_path.parent.absolute())
-                if parent_key in selected_by_parent:
+            found = set()
+            for entry in entries:
+                try:
+                    # Like the glob()s this replaces: rglob never descends
+                    # into symlinked directories, "*/<candidate>" does.
+                    if entry.is_dir(follow_symlinks=not recursive):
+                        if entry.name not in SKIPPED_DIR_NAMES and (recursive or depth == 0):
+                            stack.append((parent / entry.name, depth + 1))
+                    elif entry.name in SKILL_FILE_CANDIDATES and entry.is_file():
+                        found.add(entry.name)
+                except OSError:
                     continue
 
-                selected_by_parent[parent_key] = file_path
+            # Non-recursive mirrors glob("*/<candidate>"): immediate subdirectories only.
+            if found and (recursive or depth == 1):
+                for candidate in SKILL_FILE_CANDIDATES:
+                    if candidate in found:
+                        selected.append(parent / candidate)
+                        break
 
-        return sorted(selected_by_parent.values(), key=lambda p: str(p))
+        return sorted(selected, key=lambda p: str(p))
 
-    def _parse_claude_skill(self, skill_md: Path) -> Optional[UnifiedSkill]:
-        """Parse a skill markdown file."""
+    def _parse_claude_skill(
+        self, skill_md: Path, content: Optional[str] = None
+    ) -> Optional[UnifiedSkill]:
+        """Parse a skill markdown file, reading it unless ``content`` is given."""
         try:
-            content = skill_md.read_text(encoding="utf-8", errors="ignore")
+            if content is None:
+                content = skill_md.read_text(encoding="utf-8", errors="ignore")
 
             # Extract frontmatter
             frontmatter = self._extract_frontmatter(content)
@@ -390,7 +439,7 @@ class SkillsRegistry:
             return {}
 
         try:
-            parsed = yaml.safe_load(match.group(1)) or {}
+            parsed = yaml.load(match.group(1), Loader=_YamlLoader) or {}
             if isinstance(parsed, dict):
                 return parsed
             return {}
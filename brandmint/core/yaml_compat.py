@@ -0,0 +1,18 @@
+"""
+YAML loader/dumper selection shared across brandmint.
+
+Prefers the LibYAML-backed safe loader and dumper; falls back to the pure
+Python ones when PyYAML was built without LibYAML.
+
+Usage:
+    from ..core.yaml_compat import YamlLoader
+
+    data = yaml.load(f, Loader=YamlLoader)
+"""
+
+try:
+    from yaml import CSafeDumper as YamlDumper, CSafeLoader as YamlLoader
+except ImportError:  # pragma: no cover - depends on PyYAML build
+    from yaml import SafeDumper as YamlDumper, SafeLoader as YamlLoader
+
+__all__ = ["YamlDumper", "YamlLoader"]
@@ -26,6 +26,24 @@ class BudgetTier(str, Enum):
     PREMIUM = "premium"             # >$100K
 
 
+# brand-config.yaml ``execution_context`` strings, as used by the launch
+# wizard and the plan commands; unknown values fall back to DTC / STANDARD.
+CONFIG_LAUNCH_CHANNELS = {
+    "kickstarter": LaunchChannel.KICKSTARTER,
+    "indiegogo": LaunchChannel.INDIEGOGO,
+    "dtc": LaunchChannel.DTC,
+    "saas": LaunchChannel.SAAS,
+    "enterprise": LaunchChannel.ENTERPRISE,
+    "organic": LaunchChannel.ORGANIC,
+}
+CONFIG_BUDGET_TIERS = {
+    "bootstrapped": BudgetTier.BOOTSTRAPPED,
+    "lean": BudgetTier.LEAN,
+    "standard": BudgetTier.STANDARD,
+    "premium": BudgetTier.PREMIUM,
+}
+
+
 class MaturityStage(str, Enum):
     """Brand/product maturity"""
     PRE_LAUNCH = "pre-launch"
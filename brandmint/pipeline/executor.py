@@ -490,7 +490,7 @@ class WaveExecutor:
                 duration_seconds=round(duration, 1),
             )
             # Track in report
-            self._report.skills.append(SkillExecution(
+            self._report.add_skill(SkillExecution(
                 skill_id=skill_id,
                 wave=wave_num,
                 status="success",
@@ -508,7 +508,7 @@ class WaveExecutor:
             duration_seconds=round(duration, 1),
         )
         # Track in report
-        self._report.skills.append(SkillExecution(
+        self._report.add_skill(SkillExecution(
             skill_id=skill_id,
             wave=wave_num,
             status="skipped",
@@ -708,7 +708,7 @@ class WaveExecutor:
                     "failed",
                     error=f"Subprocess timed out after {timeout_seconds}s",
                 )
-                self._report.assets.append(AssetExecution(
+                self._report.add_asset(AssetExecution(
                     asset_id=aid,
                     batch=batch_name,
                     status="failed",
@@ -727,7 +727,7 @@ class WaveExecutor:
                     "failed",
                     error=str(exc)[:300],
                 )
-                self._report.assets.append(AssetExecution(
+                self._report.add_asset(AssetExecution(
                     asset_id=aid,
                     batch=batch_name,
                     status="failed",
@@ -770,7 +770,7 @@ class WaveExecutor:
                     duration_seconds=duration,
                     cost_usd=asset_cost,
                 )
-                self._report.assets.append(
+                self._report.add_asset(
                     AssetExecution(
                         asset_id=aid,
                         batch=batch_name,
@@ -791,7 +791,7 @@ class WaveExecutor:
                 "failed",
                 error=error_msg or "Batch did not produce expected output files",
             )
-            self._report.assets.append(
+            self._report.add_asset(
                 AssetExecution(
                     asset_id=aid,
                     batch=batch_name,
@@ -967,23 +967,6 @@ class WaveExecutor:
             w.get("estimated_cost", 0) for w in self.state.waves.values()
         )
         
-        # Count summaries
-        self._report.skills_succeeded = sum(
-            1 for s in self._report.skills if s.status == "success"
-        )
-        self._report.skills_failed = sum(
-            1 for s in self._report.skills if s.status == "failed"
-        )
-        self._report.skills_skipped = sum(
-            1 for s in self._report.skills if s.status == "skipped"
-        )
-        self._report.assets_generated = sum(
-            1 for a in self._report.assets if a.status == "success"
-        )
-        self._report.assets_failed = sum(
-            1 for a in self._report.assets if a.status == "failed"
-        )
-        
         # Save report
         save_report(self.config_path, self._report)
         
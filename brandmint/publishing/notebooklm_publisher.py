@@ -865,11 +865,17 @@ class NotebookLMPublisher:
     def _download_artifacts(
         self, notebook_id: str, artifact_defs: List[dict],
     ) -> None:
-        """Download all completed artifacts."""
+        """Download all completed artifacts.
+
+        Each download is a separate ``notebooklm`` CLI process, so they run
+        concurrently (capped at ``max_parallel``); state updates and output
+        happen on this thread as downloads finish.
+        """
         self.console.print("\n[bold]Downloading artifacts...[/bold]")
         self.artifacts_dir.mkdir(parents=True, exist_ok=True)
         artifacts_state: dict = self.state.get("artifacts", {})
 
+        pending = []
         for adef in artifact_defs:
             aid = adef["id"]
             info = artifacts_state.get(aid, {})
@@ -880,29 +886,47 @@ class NotebookLMPublisher:
                     f"  [dim]⏭ {aid} — already downloaded[/dim]"
                 )
                 continue
+            pending.append((adef, info))
 
-            artifact_id = info.get("artifact_id", "")
-            output_path = self.artifacts_dir / adef["output_filename"]
+        if not pending:
+            _save_state(self.state, self.state_path)
+            return
 
+        def _download_one(adef: dict, info: dict) -> tuple:
+            output_path = self.artifacts_dir / adef["output_filename"]
             ok, error = self.client.download_artifact(
                 artifact_type=adef["download_type"],
                 output_path=str(output_path),
-                artifact_id=artifact_id,
+                artifact_id=info.get("artifact_id", ""),
                 notebook_id=notebook_id,
             )
-            if ok:
-                info["downloaded"] = True
-                info["path"] = str(output_path)
-                info.pop("download_error", None)
-                size_kb = output_path.stat().st_size / 1024
-                self.console.print(
-                    f"  [green]✓[/green] {adef['output_filename']} ({size_kb:.1f} KB)"
-                )
-            else:
-                info["download_error"] = error
-                self.console.print(
-                    f"  [red]✗ {adef['output_filename']} download failed: {error}[/red]"
-                )
+            return output_path, ok, error
+
+        workers = min(len(pending), self.max_parallel)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(_download_one, adef, info): (adef, info)
+                for adef, info in pending
+            }
+            for future in as_completed(futures):
+                adef, info = futures[future]
+                try:
+                    output_path, ok, error = future.result()
+                except Exception as e:
+                    ok, error = False, str(e)
+                if ok:
+                    info["downloaded"] = True
+                    info["path"] = str(output_path)
+                    info.pop("download_error", None)
+                    size_kb = output_path.stat().st_size / 1024
+                    self.console.print(
+                        f"  [green]✓[/green] {adef['output_filename']} ({size_kb:.1f} KB)"
+                    )
+                else:
+                    info["download_error"] = error
+                    self.console.print(
+                        f"  [red]✗ {adef['output_filename']} download failed: {error}[/red]"
+                    )
 
         _save_state(self.state, self.state_path)
 
@@ -3107,7 +3107,7 @@ def gen_manifest(out_dir, v, cfg, exec_ctx, asset_groups=None, selected_asset_id
 # MAIN
 # =====================================================================
 
-def main():
+def main(argv=None):
     parser = argparse.ArgumentParser(
         description="Brandmint -- Generate pipeline scripts from brand config"
     )
@@ -3116,7 +3116,7 @@ def main():
     parser.add_argument("--assets", help="Comma-separated asset IDs to include in the generated bundle")
     parser.add_argument("--refresh-refs", action="store_true",
                         help="Re-scan references/images/ and regenerate reference-map.json before generating pipeline")
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     print("=" * 60)
     print("BRANDMINT -- Pipeline Engine")
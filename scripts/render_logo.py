@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+render_logo.py — Pre-render the `bm version` logo to ANSI.
+
+Renders the Rich markup in brandmint.cli.app.LOGO once and writes the
+escape-coded result to brandmint/cli/logo.ansi, which `bm version` writes
+straight to the terminal without importing Rich.
+
+Usage:
+    python3 scripts/render_logo.py           # rewrite logo.ansi
+    python3 scripts/render_logo.py --check   # exit 1 if logo.ansi is stale
+"""
+from __future__ import annotations
+
+import argparse
+import io
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+LOGO_PATH = REPO_ROOT / "brandmint" / "cli" / "logo.ansi"
+
+
+def render_logo() -> bytes:
+    from rich.console import Console
+
+    from brandmint.cli.app import LOGO
+
+    console = Console(
+        record=True,
+        force_terminal=True,
+        color_system="standard",
+        width=120,
+        file=io.StringIO(),
+    )
+    console.print(LOGO)
+    return console.export_text(styles=True).encode("utf-8")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--check", action="store_true", help="Only verify logo.ansi is up to date")
+    args = parser.parse_args()
+
+    rendered = render_logo()
+    if args.check:
+        if not LOGO_PATH.exists() or LOGO_PATH.read_bytes() != rendered:
+            print(f"{LOGO_PATH.relative_to(REPO_ROOT)} is stale; run scripts/render_logo.py")
+            return 1
+        return 0
+
+    LOGO_PATH.write_bytes(rendered)
+    print(f"Wrote {LOGO_PATH.relative_to(REPO_ROOT)} ({len(rendered)} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1142,7 +1142,7 @@ def cmd_studio(args):
 # CLI
 # =====================================================================
 
-def main():
+def main(argv=None):
     parser = argparse.ArgumentParser(
         prog="run_pipeline",
         description="Brandmint -- Pipeline orchestrator",
@@ -1182,7 +1182,7 @@ def main():
     prv_p.add_argument("--assets", help="Comma-separated asset IDs to preview (e.g., 2A,3A,8A)")
     prv_p.add_argument("--json", action="store_true", help="Output as JSON (for agents)")
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     if not args.command:
         parser.print_help()
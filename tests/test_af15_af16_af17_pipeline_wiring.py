@@ -38,7 +38,9 @@ def _schema_source() -> str:
 
 
 def _cli_app_source() -> str:
-    return (REPO_ROOT / "brandmint" / "cli" / "app.py").read_text()
+    cli_dir = REPO_ROOT / "brandmint" / "cli"
+    sources = [cli_dir / "app.py", *sorted(cli_dir.glob("*_cmds.py"))]
+    return "\n".join(path.read_text() for path in sources)
 
 
 def _cli_visual_source() -> str:
@@ -0,0 +1,101 @@
+import subprocess
+import sys
+
+from typer.testing import CliRunner
+
+from brandmint.cli.app import _LAZY_SUBCOMMANDS, app
+
+
+runner = CliRunner()
+
+
+def test_importing_app_does_not_load_subcommand_modules():
+    code = (
+        "import sys, brandmint.cli.app as m; "
+        "print(sorted(p for p in m._LAZY_SUBCOMMANDS.values() if p in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip() == "[]"
+
+
+def test_lazy_group_dispatches_to_subcommand_module():
+    result = runner.invoke(app, ["plan", "--help"])
+
+    assert result.exit_code == 0
+    assert "recommend" in result.stdout
+    assert _LAZY_SUBCOMMANDS["plan"] in sys.modules
+
+
+def test_single_command_group_stays_a_group():
+    result = runner.invoke(app, ["publish", "--help"])
+
+    assert result.exit_code == 0
+    assert "notebooklm" in result.stdout
+
+
+def test_version_flag_prints_bare_version():
+    from brandmint import __version__
+
+    result = runner.invoke(app, ["--version"])
+
+    assert result.exit_code == 0
+    assert result.stdout.strip() == __version__
+
+
+def test_console_script_version_fast_path_skips_typer():
+    code = (
+        "import sys; sys.argv = ['bm', '--version']; "
+        "import brandmint.cli as cli; cli.main(); "
+        "print('typer' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    version, typer_loaded = result.stdout.split()
+    assert typer_loaded == "False"
+    assert version
+
+
+def test_prerendered_logo_matches_markup():
+    import importlib.util
+    from pathlib import Path
+
+    script = Path(__file__).resolve().parent.parent / "scripts" / "render_logo.py"
+    spec = importlib.util.spec_from_file_location("render_logo", script)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    assert module.LOGO_PATH.read_bytes() == module.render_logo()
+
+
+def test_shared_config_option_is_required_on_each_command():
+    for argv in (["plan", "context"], ["visual", "status"], ["report"]):
+        result = runner.invoke(app, argv)
+
+        assert result.exit_code == 2
+        assert "--config" in result.output
+
+
+def test_batch_emits_one_json_result_per_command():
+    import json
+
+    result = runner.invoke(app, ["batch"], input="bm --version\n\n# comment\nbogus\nbatch\n")
+
+    assert result.exit_code == 0
+    lines = [json.loads(l) for l in result.stdout.splitlines() if l.startswith("{")]
+    assert [(r["command"], r["exit_code"]) for r in lines] == [
+        ("bm --version", 0),
+        ("bogus", 2),
+        ("batch", 2),
+    ]
+    assert "No such command" in lines[1]["error"]
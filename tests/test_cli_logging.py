@@ -0,0 +1,83 @@
+import logging
+
+import pytest
+
+from brandmint.cli.logging import LoggedOperation
+
+
+def test_logged_operation_reports_duration(caplog):
+    logger = logging.getLogger("brandmint.test_logged_operation")
+
+    with caplog.at_level(logging.INFO, logger=logger.name):
+        with LoggedOperation("Generating assets", logger):
+            pass
+
+    assert caplog.messages[0] == "Generating assets..."
+    assert caplog.messages[1].startswith("Generating assets... [green]done[/green] (0.0s")
+
+
+def test_logged_operation_logs_failure(caplog):
+    logger = logging.getLogger("brandmint.test_logged_operation")
+
+    with caplog.at_level(logging.INFO, logger=logger.name):
+        with pytest.raises(RuntimeError):
+            with LoggedOperation("Uploading", logger):
+                raise RuntimeError("boom")
+
+    assert "[red]failed[/red]" in caplog.messages[-1]
+    assert caplog.messages[-1].endswith(": boom")
+
+
+def test_log_section_pads_title_to_fixed_width(caplog):
+    from brandmint.cli.logging import log_section
+
+    logger = logging.getLogger("brandmint.test_log_section")
+    with caplog.at_level(logging.INFO, logger=logger.name):
+        log_section("Wave 1", logger)
+        log_section("x" * 60, logger)
+
+    assert caplog.messages[1] == "[bold cyan]─── Wave 1 " + "─" * 44 + "[/bold cyan]"
+    assert caplog.messages[3] == "[bold cyan]─── " + "x" * 60 + " [/bold cyan]"
+
+
+def test_setup_logging_reuses_handlers_for_same_settings(tmp_path):
+    from brandmint.cli.logging import setup_logging
+
+    log_file = str(tmp_path / "bm.log")
+    root = setup_logging(verbose=True, log_file=log_file)
+    handlers = list(root.handlers)
+
+    assert setup_logging(verbose=True, log_file=log_file).handlers == handlers
+
+    root = setup_logging(debug=True, log_file=log_file)
+    assert root.handlers != handlers
+    assert root.level == logging.DEBUG
+    setup_logging()
+
+
+def test_helpers_defer_formatting_to_handlers(caplog):
+    from brandmint.cli.logging import log_key_value, log_progress, log_success
+
+    logger = logging.getLogger("brandmint.test_helpers")
+    with caplog.at_level(logging.INFO, logger=logger.name):
+        log_key_value("Budget", "100%", logger)
+        log_progress(2, 5, "buyer-persona", logger)
+        log_success("done", logger)
+
+    assert caplog.messages == [
+        "  [cyan]Budget:[/cyan] 100%",
+        "  [2/5] buyer-persona",
+        "[green]✓[/green] done",
+    ]
+    assert caplog.records[0].args == ("Budget", "100%")
+
+
+def test_helpers_default_to_brandmint_logger(caplog):
+    from brandmint.cli.logging import log_warning
+
+    with caplog.at_level(logging.WARNING, logger="brandmint"):
+        log_warning("careful")
+
+    assert [(r.name, r.getMessage()) for r in caplog.records] == [
+        ("brandmint", "[yellow]⚠[/yellow] careful"),
+    ]
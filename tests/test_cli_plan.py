@@ -0,0 +1,52 @@
+import os
+from pathlib import Path
+
+from brandmint.cli import plan, publish
+
+
+def _write_config(path: Path, name: str, mtime_ns: int) -> None:
+    path.write_text(f"brand:\n  name: {name}\n", encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_brand_config_is_parsed_once_per_mtime(tmp_path: Path, monkeypatch):
+    config = tmp_path / "brand-config.yaml"
+    _write_config(config, "Acme", 1_000_000_000)
+    plan._parse_brand_config.cache_clear()
+
+    first = plan._load_brand_config(config)
+    first["brand"]["name"] = "mutated"
+    assert plan._load_brand_config(config)["brand"]["name"] == "Acme"
+    assert plan._parse_brand_config.cache_info().misses == 1
+
+    _write_config(config, "Beta", 2_000_000_000)
+    assert plan._load_brand_config(config)["brand"]["name"] == "Beta"
+
+
+def test_publish_config_overrides_do_not_leak_into_cache(tmp_path: Path):
+    config = tmp_path / "brand-config.yaml"
+    _write_config(config, "Acme", 1_000_000_000)
+
+    _, cfg, brand_dir = publish._load_config(config)
+    cfg.setdefault("publishing", {})["source_profile"] = "minimal"
+
+    _, again, _ = publish._load_config(config)
+    assert "publishing" not in again
+    assert brand_dir == tmp_path.resolve()
+
+
+def test_build_product_maps_context_strings_to_enums():
+    from brandmint.models.product import BudgetTier, LaunchChannel
+
+    product = plan._build_product_from_config(
+        {"brand": {"name": "Acme"}, "execution_context": {"launch_channel": "saas", "budget_tier": "premium"}}
+    )
+    assert product.launch_context.channel is LaunchChannel.SAAS
+    assert product.launch_context.budget_tier is BudgetTier.PREMIUM
+
+    organic = plan._build_product_from_config({"execution_context": {"launch_channel": "organic"}})
+    assert organic.launch_context.channel is LaunchChannel.ORGANIC
+
+    fallback = plan._build_product_from_config({"execution_context": {"launch_channel": "retail"}})
+    assert fallback.launch_context.channel is LaunchChannel.DTC
+    assert fallback.launch_context.budget_tier is BudgetTier.STANDARD
@@ -0,0 +1,61 @@
+from rich.console import Console
+
+from brandmint.cli import registry
+
+
+class _EmptyRegistry:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def get_all_skills(self):
+        return []
+
+    def get_conflicts(self):
+        return []
+
+
+def _capture_console(monkeypatch) -> Console:
+    console = Console(record=True, width=200)
+    monkeypatch.setattr(registry, "console", console)
+    return console
+
+
+def test_run_list_filters_visual_assets_by_tag(monkeypatch):
+    console = _capture_console(monkeypatch)
+    monkeypatch.setattr(registry, "SkillsRegistry", _EmptyRegistry)
+    monkeypatch.setattr(
+        registry,
+        "_load_visual_assets",
+        lambda: [
+            {"id": "HERO", "name": "Hero", "model": "m", "tags": ["web", "dtc"]},
+            {"id": "STORY", "name": "Story", "model": "m", "tags": ["social"]},
+            {"id": "BARE", "name": "Bare", "model": "m", "tags": None},
+        ],
+    )
+
+    registry.run_list(source="visual", tags="social,app")
+    filtered = console.export_text()
+    assert "STORY" in filtered
+    assert "HERO" not in filtered and "BARE" not in filtered
+
+    registry.run_list(source="visual")
+    unfiltered = console.export_text()
+    assert all(asset_id in unfiltered for asset_id in ("HERO", "STORY", "BARE"))
+
+
+def test_visual_assets_are_parsed_once_per_mtime(tmp_path, monkeypatch):
+    import os
+
+    path = tmp_path / "asset-registry.yaml"
+    path.write_text("assets:\n  HERO:\n    name: Hero\n    tags: [web]\n", encoding="utf-8")
+    os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+    monkeypatch.setattr(registry, "_ASSET_REGISTRY_PATH", path)
+    registry._parse_visual_assets.cache_clear()
+
+    assert registry._load_visual_assets() == [{"id": "HERO", "name": "Hero", "model": "", "tags": ["web"]}]
+    registry._load_visual_assets()
+    assert registry._parse_visual_assets.cache_info().misses == 1
+
+    path.unlink()
+    assert registry._load_visual_assets() == []
+    registry._parse_visual_assets.cache_clear()
@@ -0,0 +1,231 @@
+from pathlib import Path
+
+from brandmint.cli.report import (
+    AssetExecution,
+    ExecutionReport,
+    SkillExecution,
+    get_state_file,
+    load_report,
+    save_report,
+)
+
+
+def _report() -> ExecutionReport:
+    return ExecutionReport(
+        brand_name="Prototype Brand",
+        scenario="launch-ready",
+        started_at="2026-03-10T10:00:00",
+        skills=[SkillExecution(skill_id="buyer-persona", wave=1, status="success", duration_seconds=1.5)],
+        assets=[AssetExecution(asset_id="2A", batch="identity", status="success", cost_usd=0.08)],
+        routing_decisions=[{"asset_id": "2A", "batch": "identity"}],
+    )
+
+
+def test_save_and_load_report_round_trip(tmp_path: Path) -> None:
+    config = tmp_path / "brand-config.yaml"
+    config.write_text("brand: {}\n")
+
+    save_report(config, _report())
+    loaded = load_report(config)
+
+    assert loaded == _report()
+
+
+def test_save_report_preserves_other_state_keys(tmp_path: Path) -> None:
+    import json
+
+    config = tmp_path / "brand-config.yaml"
+    get_state_file(config).write_text('{"completed": ["buyer-persona"]}')
+
+    save_report(config, _report())
+
+    state = json.loads(get_state_file(config).read_text())
+    assert state["completed"] == ["buyer-persona"]
+    assert load_report(config).brand_name == "Prototype Brand"
+
+
+def test_report_state_is_migrated_from_legacy_yaml(tmp_path: Path) -> None:
+    import yaml
+
+    config = tmp_path / "brand-config.yaml"
+    legacy = tmp_path / ".brandmint-state.yaml"
+    legacy.write_text(yaml.safe_dump({"report": _report().to_dict(), "extra": 1}))
+
+    assert load_report(config) == _report()
+
+    save_report(config, _report())
+
+    assert get_state_file(config).name == ".brandmint-report.json"
+    assert '"extra":1' in get_state_file(config).read_text()
+
+
+def test_load_report_missing_state_returns_none(tmp_path: Path) -> None:
+    assert load_report(tmp_path / "brand-config.yaml") is None
+
+
+def test_to_dict_matches_asdict() -> None:
+    from dataclasses import asdict
+
+    report = _report()
+    report.kickstarter_readiness = {"all_ready": False, "section_status": {}}
+    data = report.to_dict()
+
+    assert data == asdict(report)
+    assert list(data) == list(asdict(report))
+    assert data["routing_decisions"][0] is not report.routing_decisions[0]
+
+
+def test_report_records_are_slotted() -> None:
+    report = _report()
+
+    for record in (report, report.skills[0], report.assets[0]):
+        assert not hasattr(record, "__dict__")
+
+
+def test_format_markdown_and_html_render_rows() -> None:
+    from brandmint.cli.report import format_html, format_markdown
+
+    report = _report()
+    markdown = format_markdown(report)
+    html = format_html(report)
+
+    assert "| buyer-persona | 1 | success | 1.5s |" in markdown
+    assert "| 2A | identity | success | $0.080 |  |" in markdown
+    assert "<tr><td>buyer-persona</td><td>1</td><td>success</td><td>1.5s</td></tr>" in html
+    assert "<tr><td>2A</td><td>identity</td><td>success</td><td>$0.080</td><td></td></tr>" in html
+
+
+def test_render_report_table_colors(monkeypatch) -> None:
+    import io
+
+    from rich.console import Console
+
+    import brandmint.cli.report as report_mod
+
+    console = Console(file=io.StringIO(), force_terminal=True, color_system="standard", width=120)
+    monkeypatch.setattr(report_mod, "console", console)
+    report = _report()
+    report.status = "failed"
+    report.estimated_cost_usd = 1.0
+    report.actual_cost_usd = 2.0
+
+    report_mod.render_report_table(report)
+
+    output = console.file.getvalue()
+    assert "\x1b[31mfailed" in output
+    assert "\x1b[31m$+1.00" in output
+
+
+def test_formatters_use_supplied_generated_at() -> None:
+    from brandmint.cli.report import format_html, format_markdown
+
+    stamp = "2026-03-10T12:00:00"
+
+    assert format_markdown(_report(), generated_at=stamp).endswith(
+        f"*Generated by Brandmint at {stamp}*"
+    )
+    assert f"Generated by Brandmint at {stamp}</em>" in format_html(_report(), generated_at=stamp)
+
+
+def test_formatters_stream_same_document_to_file_object() -> None:
+    import io
+
+    from brandmint.cli.report import format_html, format_markdown
+
+    for formatter in (format_markdown, format_html):
+        buf = io.StringIO()
+
+        assert formatter(_report(), generated_at="now", out=buf) is None
+        assert buf.getvalue() == formatter(_report(), generated_at="now")
+
+
+def test_run_report_writes_output_file(tmp_path: Path) -> None:
+    from brandmint.cli.report import run_report
+
+    config = tmp_path / "brand-config.yaml"
+    config.write_text("brand: {}\n")
+    save_report(config, _report())
+    output = tmp_path / "report.html"
+
+    run_report(config, format="html", output=output)
+
+    text = output.read_text(encoding="utf-8")
+    assert text.startswith("<!DOCTYPE html>")
+    assert "<td>buyer-persona</td>" in text
+
+
+def test_add_skill_and_asset_keep_counters_current() -> None:
+    report = ExecutionReport(brand_name="B", scenario="s", started_at="t")
+    for status in ("success", "success", "failed", "skipped"):
+        report.add_skill(SkillExecution(skill_id=status, wave=1, status=status))
+    for status in ("success", "failed", "skipped"):
+        report.add_asset(AssetExecution(asset_id=status, batch="identity", status=status))
+
+    assert len(report.skills) == 4 and len(report.assets) == 3
+    assert (report.skills_succeeded, report.skills_failed, report.skills_skipped) == (2, 1, 1)
+    assert (report.assets_generated, report.assets_failed) == (1, 1)
+
+
+def test_load_report_header_reads_first_line_only(tmp_path: Path) -> None:
+    import json
+
+    from brandmint.cli.report import load_report_header
+
+    config = tmp_path / "brand-config.yaml"
+    report = _report()
+    report.status = "completed"
+    save_report(config, report)
+    save_report(config, report)
+
+    state_file = get_state_file(config)
+    assert json.loads(state_file.read_text())["report"]["status"] == "completed"
+
+    # Corrupt everything after the header line: the header must still load.
+    first_line = state_file.read_text().splitlines(keepends=True)[0]
+    state_file.write_text(first_line + "not json")
+
+    assert load_report_header(config) == {
+        "brand_name": "Prototype Brand",
+        "scenario": "launch-ready",
+        "status": "completed",
+        "started_at": "2026-03-10T10:00:00",
+        "completed_at": None,
+    }
+
+
+def test_load_report_header_falls_back_to_full_load(tmp_path: Path) -> None:
+    import yaml
+
+    from brandmint.cli.report import load_report_header
+
+    config = tmp_path / "brand-config.yaml"
+    (tmp_path / ".brandmint-state.yaml").write_text(yaml.safe_dump({"report": _report().to_dict()}))
+
+    assert load_report_header(config)["brand_name"] == "Prototype Brand"
+    assert load_report_header(tmp_path / "missing" / "brand-config.yaml") is None
+
+
+def test_format_json_matches_to_dict() -> None:
+    import json
+
+    from brandmint.cli.report import format_json
+
+    report = _report()
+    report.kickstarter_readiness = {"all_ready": False, "section_status": {}}
+
+    assert json.loads(format_json(report)) == report.to_dict()
+
+
+def test_format_json_matches_stdlib_output() -> None:
+    import json
+
+    from brandmint.cli.report import format_json
+
+    report = _report()
+    report.brand_name = "Café"
+    report.routing_decisions = [{1: "nano-banana-pro"}]
+
+    output = format_json(report)
+
+    assert output == json.dumps(report.to_dict(), indent=2)
+    assert "\\u00e9" in output
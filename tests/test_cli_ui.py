@@ -0,0 +1,289 @@
+import io
+
+from rich.console import Console
+
+from brandmint.cli.ui import (
+    _enum_value,
+    _field,
+    prompt_scenario_selection,
+    render_scenario_cards,
+)
+from brandmint.models.scenario import ScenarioMatch, ScenarioType
+
+
+def _console() -> Console:
+    return Console(file=io.StringIO(), width=100, force_terminal=False)
+
+
+def _terminal() -> Console:
+    return Console(file=io.StringIO(), width=100, force_terminal=True, color_system=None)
+
+
+def _scenario(sid: str, name: str) -> dict:
+    return {
+        "id": sid,
+        "name": name,
+        "emoji": "*",
+        "skill_ids": ["a", "b"],
+        "estimated_cost_usd": 120,
+        "estimated_timeline_days": "2-3 days",
+    }
+
+
+def test_field_and_enum_value_accept_models_and_dicts():
+    match = ScenarioMatch(scenario_id=ScenarioType.BRAND_GENESIS, match_score=0.5, reasoning="r")
+
+    assert _field(match, "match_score") == 0.5
+    assert _field({"match_score": 0.7}, "match_score") == 0.7
+    assert _field({}, "pros", []) == []
+    assert _enum_value(match.scenario_id) == "brand-genesis"
+    assert _enum_value("brand-genesis") == "brand-genesis"
+
+
+def _scenario_matches() -> list:
+    return [
+        ScenarioMatch(
+            scenario_id=ScenarioType.CROWDFUNDING_LEAN,
+            match_score=0.91,
+            reasoning="Fits a lean campaign",
+            pros=["cheap"],
+        ),
+        {"scenario_id": "brand-genesis", "match_score": 0.4, "reasoning": "Fallback", "cons": ["slow"]},
+        {"scenario_id": "unknown", "match_score": 0.1, "reasoning": "skipped"},
+    ]
+
+
+_SCENARIOS = [
+    _scenario("crowdfunding-lean", "Crowdfunding Lean"),
+    _scenario("brand-genesis", "Brand Genesis"),
+]
+
+
+def test_render_scenario_cards_mixes_models_and_dicts():
+    console = _terminal()
+
+    render_scenario_cards(_scenario_matches(), _SCENARIOS, console)
+
+    output = console.file.getvalue()
+    assert "#1 - * Crowdfunding Lean" in output
+    assert "91%  <- RECOMMENDED" in output
+    assert "+ cheap" in output
+    assert "#2 - * Brand Genesis" in output
+    assert "x slow" in output
+    assert "skipped" not in output
+
+
+def test_prompt_scenario_selection_returns_enum_value(monkeypatch):
+    from brandmint.cli import ui
+
+    monkeypatch.setattr(ui.IntPrompt, "ask", lambda *a, **k: 2)
+    matches = [
+        {"scenario_id": "brand-genesis", "match_score": 0.9},
+        ScenarioMatch(scenario_id=ScenarioType.ENTERPRISE_GTM, match_score=0.5, reasoning="r"),
+    ]
+
+    assert prompt_scenario_selection(matches, _console()) == "enterprise-gtm"
+
+
+def _banner_config(name: str) -> dict:
+    return {"brand": {"name": name, "domain_tags": ["tea"]}, "theme": {"palette": {"deep_green": "#0a3"}}}
+
+
+def test_brand_banner_skips_animation_off_terminal(monkeypatch):
+    from brandmint.cli import ui
+
+    sleeps = []
+    monkeypatch.setattr(ui, "sleep", sleeps.append)
+    console = _console()
+
+    ui.render_brand_banner(_banner_config("Leaf"), console, animated=True)
+
+    assert sleeps == []
+    assert "LEAF" in console.file.getvalue()
+
+
+def test_brand_banner_animation_time_is_capped(monkeypatch):
+    from brandmint.cli import ui
+
+    sleeps = []
+    monkeypatch.setattr(ui, "sleep", sleeps.append)
+    monkeypatch.delenv("BRANDMINT_NO_ANIM", raising=False)
+    console = Console(file=io.StringIO(), width=100, force_terminal=True)
+
+    ui.render_brand_banner(_banner_config("A" * 60), console, animated=True)
+
+    assert len(sleeps) == 61
+    assert sum(sleeps) <= ui._BANNER_ANIMATION_SECONDS + 1e-9
+
+    sleeps.clear()
+    monkeypatch.setenv("BRANDMINT_NO_ANIM", "1")
+    ui.render_brand_banner(_banner_config("Leaf"), console, animated=True)
+    assert sleeps == []
+
+
+def test_execution_summary_counts_completed_items():
+    from brandmint.cli.ui import render_execution_summary
+
+    console = _console()
+    state = {
+        "waves": {
+            "1": {
+                "status": "completed",
+                "estimated_cost": 1.5,
+                "text_skills": {"a": {"status": "completed"}, "b": {"status": "failed"}},
+                "visual_assets": {"2A": {"status": "completed"}},
+            },
+            "2": {
+                "status": "failed",
+                "estimated_cost": 2.0,
+                "text_skills": {"c": {"status": "completed"}},
+            },
+        },
+        "state_file": "state.json",
+    }
+
+    render_execution_summary(state, console)
+
+    output = console.file.getvalue()
+    assert "Waves completed: 1/2" in output
+    assert "Text skills run: 2" in output
+    assert "Visual assets generated: 1" in output
+    assert "$3.50" in output
+
+
+def test_execution_summary_prints_state_path_verbatim():
+    from brandmint.cli.ui import render_execution_summary
+
+    console = _console()
+    render_execution_summary({"state_file": "runs/[bold]/state.json"}, console)
+
+    assert "runs/[bold]/state.json" in console.file.getvalue()
+
+
+def _wave(number: int, text_skills: list, visual_assets: list, cost: float = 0.0):
+    from brandmint.models.wave import Wave
+
+    return Wave(
+        number=number,
+        name=f"Wave {number}",
+        text_skills=text_skills,
+        visual_assets=visual_assets,
+        estimated_cost=cost,
+    )
+
+
+def test_cost_preview_totals(monkeypatch):
+    from brandmint.cli import ui
+
+    console = _console()
+    waves = [_wave(1, ["a"], ["2A", "2B"]), _wave(2, [], ["2A", "ZZ"])]
+
+    ui.render_cost_preview(waves, seeds=2, console=console)
+
+    output = console.file.getvalue()
+    # 2A listed once in the table, counted per occurrence in the summary.
+    assert output.count("2A ") == 1
+    assert "4 assets" in output
+    assert "$0.42" in output  # table: (0.08 + 0.05 + 0.08) * 2
+    assert "$0.58" in output  # summary: (0.08 + 0.05 + 0.08 + 0.08) * 2
+
+
+def test_cost_preview_walks_waves_once():
+    from brandmint.cli import ui
+
+    console = _console()
+    waves = iter([_wave(1, ["a", "b"], ["2A"]), _wave(2, ["c"], ["2B"])])
+    ui.render_cost_preview(waves, seeds=1, console=console, show_assets=False)
+
+    output = console.file.getvalue()
+    assert "$1.80" in output  # 3 text skills
+    assert "$1.93" in output  # 1.80 + 0.08 + 0.05
+
+
+def test_palette_swatches_use_first_six_entries_and_cache():
+    from brandmint.cli import ui
+
+    palette = {f"tone_{i}": f"#00000{i}" for i in range(8)}
+    entries = tuple(palette.items())[:6]
+
+    line = ui._palette_swatches(entries)
+
+    assert line.startswith("\n[bold]Palette:[/bold] [on #000000]  [/on #000000] Tone 0")
+    assert "Tone 5" in line and "Tone 6" not in line
+    assert ui._palette_swatches(entries) is line
+
+
+def test_render_scenario_cards_plain_text_off_terminal():
+    console = _console()
+
+    render_scenario_cards(_scenario_matches(), _SCENARIOS, console)
+
+    assert console.file.getvalue().splitlines() == [
+        "#1 Crowdfunding Lean (crowdfunding-lean) - 91% match (recommended)",
+        "   skills=2 cost=$120 timeline=2-3 days",
+        "   Fits a lean campaign",
+        "   + cheap",
+        "#2 Brand Genesis (brand-genesis) - 40% match",
+        "   skills=2 cost=$120 timeline=2-3 days",
+        "   Fallback",
+        "   x slow",
+    ]
+
+
+def test_brand_banner_plain_text_off_terminal():
+    from brandmint.cli.ui import render_brand_banner
+
+    console = _console()
+    render_brand_banner(_banner_config("Leaf"), console, animated=False)
+
+    assert console.file.getvalue() == (
+        "BRANDMINT LEAF | domain=tea | channel=dtc | depth=focused\n"
+    )
+
+
+def test_pretty_label():
+    from brandmint.cli.ui import _pretty_label
+
+    assert _pretty_label("deep_green") == "Deep Green"
+    assert _pretty_label("accent") == "Accent"
+
+
+def test_wave_progress_lists_skills_then_assets():
+    from brandmint.cli.ui import render_wave_progress
+
+    console = _terminal()
+    wave = _wave(3, ["buyer-persona"], ["2A"])
+    state = {"text_skills": {"buyer-persona": {"status": "completed", "duration_seconds": 2.0}}}
+
+    render_wave_progress(wave, state, console)
+
+    lines = [line.strip("│ ") for line in console.file.getvalue().splitlines()]
+    assert lines.index("Text Skills") < lines.index("Visual Assets")
+    assert "" in lines[lines.index("Text Skills"):lines.index("Visual Assets")]
+    assert any("buyer-persona (2.0s)" in line for line in lines)
+
+
+def test_normalize_matches_is_idempotent():
+    from brandmint.cli.ui import normalize_matches
+
+    rows = normalize_matches(_scenario_matches())
+
+    assert {"sid", "score", "reasoning", "pros", "cons"} <= set(rows[0])
+    assert isinstance(rows[0]["sid"], str)
+    again = normalize_matches(rows)
+    assert again == rows and again[0] is rows[0]
+
+
+def test_asset_info_is_frozen_and_covers_planner_ids():
+    import pytest
+
+    from brandmint.cli.ui import _ASSET_INFO
+    from brandmint.core.wave_planner import compute_wave_plan
+
+    with pytest.raises(TypeError):
+        _ASSET_INFO["2A"] = ("other", 1.0)
+
+    waves = compute_wave_plan({"brand": {"domain_tags": ["saas"]}}, depth="comprehensive")
+    planned = [aid for w in waves for aid in w.visual_assets]
+    assert planned
+    assert all(aid in _ASSET_INFO for aid in planned)
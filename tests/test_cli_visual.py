@@ -0,0 +1,56 @@
+import sys
+
+from brandmint.cli import visual
+
+
+_FAKE_SCRIPT = '''
+import sys
+
+calls = []
+
+def main(argv=None):
+    calls.append(argv)
+    if argv and argv[0] == "fail":
+        sys.exit(3)
+    if argv and argv[0] == "message":
+        sys.exit("boom")
+'''
+
+
+def _fake_script(tmp_path, name):
+    script = tmp_path / f"{name}.py"
+    script.write_text(_FAKE_SCRIPT)
+    return str(script)
+
+
+def test_run_script_calls_main_in_process(tmp_path, monkeypatch):
+    monkeypatch.delenv("BRANDMINT_CLI_SUBPROCESS", raising=False)
+    monkeypatch.setattr(sys, "path", list(sys.path))
+    script = _fake_script(tmp_path, "bm_fake_inprocess")
+
+    assert visual._run_script([sys.executable, script, "ok", "--x"]) == 0
+    assert visual._run_script([sys.executable, script, "fail"]) == 3
+    assert visual._run_script([sys.executable, script, "message"]) == 1
+
+    module = sys.modules.pop("bm_fake_inprocess")
+    assert module.calls == [["ok", "--x"], ["fail"], ["message"]]
+
+
+def test_run_script_subprocess_escape_hatch(tmp_path, monkeypatch):
+    monkeypatch.setenv("BRANDMINT_CLI_SUBPROCESS", "1")
+    script = tmp_path / "bm_fake_subprocess.py"
+    script.write_text("import sys\nsys.exit(int(sys.argv[1]))\n")
+
+    assert visual._run_script([sys.executable, str(script), "4"]) == 4
+    assert "bm_fake_subprocess" not in sys.modules
+
+
+def test_scripts_dir_is_resolved_once(monkeypatch):
+    import os
+
+    visual._resolve_scripts_dir.cache_clear()
+    first = visual._resolve_scripts_dir()
+    assert os.path.isfile(os.path.join(first, "run_pipeline.py"))
+
+    monkeypatch.setattr(os.path, "isdir", lambda path: False)
+    assert visual._resolve_scripts_dir() is first
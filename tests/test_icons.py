@@ -0,0 +1,71 @@
+from brandmint.cli.icons import (
+    EmojiIcons,
+    Icons,
+    format_status_line,
+    get_status_icon,
+    get_status_style,
+)
+
+
+def test_status_icon_accepts_all_spellings():
+    for spelling in ("in_progress", "in-progress", "IN_PROGRESS", "In-Progress"):
+        assert get_status_icon(spelling) == Icons.IN_PROGRESS
+        assert get_status_icon(spelling, emoji=True) == EmojiIcons.IN_PROGRESS
+        assert get_status_style(spelling) == "yellow"
+
+
+def test_unknown_status_falls_back():
+    assert get_status_icon("bogus") == Icons.QUESTION
+    assert get_status_icon("bogus", emoji=True) == Icons.QUESTION
+    assert get_status_style("bogus") == "white"
+
+
+def test_format_status_line_uses_single_row():
+    line = format_status_line("buyer-persona", "failed", duration=2.34, error="boom")
+
+    assert line == f"  [red]{Icons.FAILED}[/red] buyer-persona (2.3s) [red]- boom[/red]"
+
+
+def test_format_status_line_unknown_status():
+    assert format_status_line("x", "nope") == f"  [white]{Icons.QUESTION}[/white] x"
+
+
+def test_make_progress_bar_widths():
+    from brandmint.cli.icons import make_progress_bar
+
+    assert make_progress_bar(5, 10, width=10) == "[█████░░░░░]"
+    assert make_progress_bar(0, 0, width=4) == "[░░░░]"
+    assert make_progress_bar(10, 10, width=300) == "[" + "█" * 300 + "]"
+
+
+def test_make_progress_bar_clamps_out_of_range_progress():
+    from brandmint.cli.icons import make_progress_bar
+
+    assert make_progress_bar(30, 20, width=20) == "[" + "█" * 20 + "]"
+    assert make_progress_bar(-5, 20, width=20) == "[" + "░" * 20 + "]"
+    assert make_progress_bar(3, 2, width=300) == "[" + "█" * 300 + "]"
+    assert make_progress_bar(1, 2, width=300) == "[" + "█" * 150 + "░" * 150 + "]"
+
+
+def test_format_status_is_memoized():
+    from brandmint.cli.icons import format_status
+
+    first = format_status("completed")
+    assert first == f"[green]{Icons.COMPLETED} completed[/green]"
+    assert format_status("completed") is first
+
+
+def test_progress_chars_frames_are_stable():
+    from brandmint.cli.icons import PROGRESS_CHARS
+
+    assert len(PROGRESS_CHARS) == 10
+    assert "".join(PROGRESS_CHARS) == "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"
+    assert PROGRESS_CHARS[13 % 10] is PROGRESS_CHARS[3]
+
+
+def test_normalize_status():
+    from brandmint.cli.icons import StatusType, _normalize_status
+
+    assert _normalize_status("In-Progress") == StatusType.IN_PROGRESS
+    assert _normalize_status("COMPLETED") == StatusType.COMPLETED
+    assert _normalize_status("unknown") is None
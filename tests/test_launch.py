@@ -0,0 +1,92 @@
+from pathlib import Path
+
+import pytest
+import yaml
+
+from brandmint.cli import launch
+
+
+def test_load_config_parses_yaml_mapping(tmp_path: Path):
+    config = tmp_path / "brand-config.yaml"
+    config.write_text("brand:\n  name: Asha\n  domain_tags: [app, lifestyle]\n", encoding="utf-8")
+
+    cfg = launch._load_config(config)
+
+    assert cfg == {"brand": {"name": "Asha", "domain_tags": ["app", "lifestyle"]}}
+
+
+def test_load_config_rejects_non_mapping(tmp_path: Path):
+    config = tmp_path / "brand-config.yaml"
+    config.write_text("- just\n- a list\n", encoding="utf-8")
+
+    with pytest.raises(SystemExit):
+        launch._load_config(config)
+
+
+def test_load_config_reuses_json_cache_until_yaml_changes(tmp_path: Path, monkeypatch):
+    config = tmp_path / "brand-config.yaml"
+    config.write_text("brand:\n  name: Asha\n", encoding="utf-8")
+
+    assert launch._load_config(config) == {"brand": {"name": "Asha"}}
+    assert launch._config_cache_path(config).exists()
+
+    def fail_yaml_load(*args, **kwargs):
+        raise AssertionError("YAML should not be re-parsed while the cache is fresh")
+
+    monkeypatch.setattr(launch.yaml, "load", fail_yaml_load)
+    assert launch._load_config(config) == {"brand": {"name": "Asha"}}
+
+    monkeypatch.undo()
+    config.write_text("brand:\n  name: Asha Studio\n", encoding="utf-8")
+    assert launch._load_config(config) == {"brand": {"name": "Asha Studio"}}
+
+
+def test_load_config_skips_cache_for_values_json_cannot_represent(tmp_path: Path):
+    config = tmp_path / "brand-config.yaml"
+    config.write_text("launch_date: 2026-03-10\nseeds:\n  1: first\n", encoding="utf-8")
+
+    cfg = launch._load_config(config)
+
+    assert 1 in cfg["seeds"]
+    assert not launch._config_cache_path(config).exists()
+
+
+def test_get_scenario_by_id_returns_none_on_miss():
+    assert launch._get_scenario_by_id("brand-genesis").id == "brand-genesis"
+    assert launch._get_scenario_by_id("does-not-exist") is None
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("1-3", range(1, 4)),
+        (" 4 - 6 ", range(4, 7)),
+        ("3", range(3, 4)),
+        ("", None),
+        (None, None),
+        ("x-2", None),
+    ],
+)
+def test_parse_wave_range(raw, expected):
+    assert launch._parse_wave_range(raw) == expected
+
+
+def test_run_init_writes_config(tmp_path: Path, monkeypatch):
+    from rich.prompt import Prompt
+
+    answers = iter(["Acme", "Make it", "Tools", "app, lifestyle", "kickstarter", "focused"])
+    monkeypatch.setattr(Prompt, "ask", classmethod(lambda cls, *a, **k: next(answers)))
+    out = tmp_path / "brand-config.yaml"
+
+    launch.run_init(out)
+
+    config = yaml.safe_load(out.read_text(encoding="utf-8"))
+    assert config["brand"]["name"] == "Acme"
+    assert config["brand"]["domain_tags"] == ["app", "lifestyle"]
+    assert config["execution_context"]["launch_channel"] == "kickstarter"
+    assert config["generation"]["seeds"] == [42, 137]
+    assert list(config) == [
+        "execution_context", "brand", "theme", "palette", "typography", "generation",
+    ]
+    assert launch._INIT_TEMPLATE["brand"]["name"] == ""
+    assert launch._INIT_TEMPLATE["brand"]["domain_tags"] == []
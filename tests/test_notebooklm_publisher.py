@@ -234,6 +234,25 @@ def test_download_failure_persists_error(monkeypatch, tmp_path: Path) -> None:
 
 
 
+def test_downloads_all_completed_artifacts_concurrently(tmp_path: Path) -> None:
+    publisher = _make_publisher(tmp_path)
+    defs = []
+    for i in range(4):
+        aid = f"report-{i}"
+        defs.append({**MINIMAL_ARTIFACT_DEF, "id": aid, "output_filename": f"{aid}.md"})
+        publisher.state["artifacts"][aid] = {"artifact_id": f"art-{i}", "status": "completed"}
+    publisher.state["artifacts"]["report-3"]["status"] = "failed"
+
+    publisher._download_artifacts("nb-123", defs)
+
+    assert sorted(call[2] for call in publisher.client.download_calls) == ["art-0", "art-1", "art-2"]
+    for i in range(3):
+        info = publisher.state["artifacts"][f"report-{i}"]
+        assert info["downloaded"] is True
+        assert Path(info["path"]).read_text(encoding="utf-8") == f"downloaded:art-{i}"
+    assert "downloaded" not in publisher.state["artifacts"]["report-3"]
+
+
 def test_data_table_artifacts_use_csv_output() -> None:
     assert ext_for_type("data-table") == "csv"
     filenames = {
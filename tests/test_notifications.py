@@ -0,0 +1,276 @@
+import json
+import sys
+import types
+
+import pytest
+
+from brandmint.cli import notifications
+
+
+@pytest.fixture(autouse=True)
+def _fresh_rate_limiters():
+    notifications._BUCKETS.clear()
+    yield
+    notifications._BUCKETS.clear()
+
+
+def test_linux_notify_prefers_in_process_backend(monkeypatch):
+    calls = []
+    monkeypatch.setattr(notifications, "_linux_notify_in_process", lambda t, m: True)
+    monkeypatch.setattr(notifications.subprocess, "run", lambda *a, **k: calls.append(a))
+
+    assert notifications._linux_notify("Title", "Body") is True
+    assert calls == []
+
+
+def test_linux_notify_falls_back_to_notify_send(monkeypatch):
+    calls = []
+    monkeypatch.setattr(notifications, "_linux_notify_in_process", lambda t, m: None)
+    monkeypatch.setattr(notifications.subprocess, "run", lambda cmd, **k: calls.append(cmd))
+
+    assert notifications._linux_notify("Title", "Body") is True
+    assert calls == [["notify-send", "Title", "Body"]]
+
+
+def test_macos_notify_uses_osascript(monkeypatch):
+    calls = []
+    monkeypatch.setattr(notifications.subprocess, "run", lambda cmd, **k: calls.append(cmd))
+
+    assert notifications._macos_notify("Title", "Body", sound=False) is True
+    assert calls[0][:2] == ["osascript", "-e"]
+
+
+def test_linux_notify_reports_missing_notify_send(monkeypatch):
+    def missing(*args, **kwargs):
+        raise FileNotFoundError("notify-send")
+
+    monkeypatch.setattr(notifications, "_linux_notify_in_process", lambda t, m: None)
+    monkeypatch.setattr(notifications.subprocess, "run", missing)
+
+    assert notifications._linux_notify("Title", "Body") is False
+
+
+def _fake_jeepney(monkeypatch, reply_type):
+    class _Connection:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def send_and_get_reply(self, call, timeout=None):
+            header = types.SimpleNamespace(message_type=reply_type)
+            return types.SimpleNamespace(header=header, body=("org.freedesktop.DBus.Error.ServiceUnknown",))
+
+    jeepney = types.ModuleType("jeepney")
+    jeepney.DBusAddress = lambda *a, **k: None
+    jeepney.MessageType = types.SimpleNamespace(method_return=2, error=3)
+    jeepney.new_method_call = lambda *a, **k: None
+    blocking = types.ModuleType("jeepney.io.blocking")
+    blocking.open_dbus_connection = lambda bus: _Connection()
+    monkeypatch.setitem(sys.modules, "jeepney", jeepney)
+    monkeypatch.setitem(sys.modules, "jeepney.io", types.ModuleType("jeepney.io"))
+    monkeypatch.setitem(sys.modules, "jeepney.io.blocking", blocking)
+
+
+def test_dbus_error_reply_falls_back_to_notify_send(monkeypatch):
+    _fake_jeepney(monkeypatch, reply_type=3)
+    calls = []
+    monkeypatch.setattr(notifications.subprocess, "run", lambda cmd, **k: calls.append(cmd))
+
+    assert notifications._linux_notify_in_process("Title", "Body") is None
+    assert notifications._linux_notify("Title", "Body") is True
+    assert calls == [["notify-send", "Title", "Body"]]
+
+
+def test_dbus_method_return_is_delivered(monkeypatch):
+    _fake_jeepney(monkeypatch, reply_type=2)
+
+    assert notifications._linux_notify_in_process("Title", "Body") is True
+
+
+def _drain_notifications():
+    # The pool has a single worker, so this runs after everything queued earlier.
+    notifications._NOTIFY_POOL.submit(lambda: None).result(timeout=5)
+
+
+def test_send_notification_delivers_in_background(monkeypatch):
+    delivered = []
+    monkeypatch.setattr(
+        notifications, "_NOTIFIER", lambda t, m, sound: delivered.append((t, m, sound)) or True
+    )
+
+    assert notifications.send_notification("Title", "Body", sound=False) is True
+    _drain_notifications()
+
+    assert delivered == [("Title", "Body", False)]
+
+
+def test_send_notification_unsupported_platform(monkeypatch):
+    monkeypatch.setattr(notifications, "_NOTIFIER", None)
+
+    assert notifications.send_notification("Title", "Body") is False
+
+
+def test_macos_notify_escapes_quotes_and_backslashes(monkeypatch):
+    calls = []
+    monkeypatch.setattr(notifications.subprocess, "run", lambda cmd, **k: calls.append(cmd))
+
+    notifications._macos_notify('Brand "Noesis"', "path C:\\tmp", sound=False)
+
+    assert [cmd[2] for cmd in calls] == [
+        'display notification "path C:\\\\tmp" with title "Brand \\"Noesis\\""'
+    ]
+
+
+class _FakeResponse:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class _FakeSession:
+    def __init__(self, *statuses):
+        self.statuses = list(statuses)
+        self.posts = []
+
+    def post(self, url, data=None, timeout=None):
+        self.posts.append((url, json.loads(data)))
+        status = self.statuses.pop(0)
+        if isinstance(status, Exception):
+            raise status
+        if isinstance(status, _FakeResponse):
+            return status
+        return _FakeResponse(status)
+
+
+def test_webhook_posts_through_shared_session(monkeypatch):
+    session = _FakeSession(204, 200)
+    monkeypatch.setattr(notifications, "_webhook_session", lambda: session)
+
+    assert notifications.send_webhook_notification("https://example.com/hook", "Acme", True, 3)
+    assert notifications.send_webhook_notification("https://example.com/hook", "Acme", True, 4)
+
+    assert [p[1]["waves_completed"] for p in session.posts] == [3, 4]
+    assert session.posts[0][1]["event"] == "brandmint.pipeline.complete"
+
+
+def test_webhook_retries_transient_errors_with_backoff(monkeypatch):
+    import requests
+
+    sleeps = []
+    session = _FakeSession(requests.ConnectionError("refused"), 502, 204)
+    monkeypatch.setattr(notifications, "_webhook_session", lambda: session)
+    monkeypatch.setattr(notifications.time, "sleep", sleeps.append)
+    monkeypatch.setattr(notifications.random, "random", lambda: 0.0)
+
+    assert notifications.send_webhook_notification("https://example.com/hook", "Acme", True, 1)
+    assert len(session.posts) == 3
+    assert sleeps == [1.0, 2.0]
+
+
+def test_webhook_gives_up_after_retries(monkeypatch):
+    sleeps = []
+    session = _FakeSession(500, 500, 500, 500)
+    monkeypatch.setattr(notifications, "_webhook_session", lambda: session)
+    monkeypatch.setattr(notifications.time, "sleep", sleeps.append)
+
+    assert notifications.send_webhook_notification("https://example.com/hook", "Acme", False, 1) is False
+    assert len(session.posts) == notifications._WEBHOOK_RETRIES + 1
+    assert len(sleeps) == notifications._WEBHOOK_RETRIES
+
+
+def test_webhook_does_not_retry_client_errors(monkeypatch):
+    sleeps = []
+    session = _FakeSession(404)
+    monkeypatch.setattr(notifications, "_webhook_session", lambda: session)
+    monkeypatch.setattr(notifications.time, "sleep", sleeps.append)
+
+    assert notifications.send_webhook_notification("https://example.com/hook", "Acme", True, 1) is False
+    assert sleeps == []
+
+
+def test_webhook_honours_retry_after(monkeypatch):
+    sleeps = []
+    session = _FakeSession(_FakeResponse(429, {"Retry-After": "7"}), 200)
+    monkeypatch.setattr(notifications, "_webhook_session", lambda: session)
+    monkeypatch.setattr(notifications.time, "sleep", sleeps.append)
+
+    assert notifications.send_webhook_notification("https://example.com/hook", "Acme", True, 1)
+    assert sleeps == [7.0]
+
+
+def test_retry_after_parses_http_date():
+    assert notifications._retry_after_seconds("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert notifications._retry_after_seconds("soon") is None
+    assert notifications._retry_after_seconds(None) is None
+
+
+def test_webhook_payload_format_follows_host(monkeypatch):
+    session = _FakeSession(200, 200, 200)
+    monkeypatch.setattr(notifications, "_webhook_session", lambda: session)
+
+    notifications.send_webhook_notification("https://hooks.slack.com/services/T/B/X", "Acme", True, 2)
+    notifications.send_webhook_notification("https://discord.com/api/webhooks/1/abc", "Acme", False, 2, "boom")
+    notifications.send_webhook_notification("https://example.com/hook", "Acme", True, 2)
+
+    slack, discord, generic = (p[1] for p in session.posts)
+    assert slack["blocks"][0]["text"]["text"].startswith("✅ *Acme* pipeline completed successfully")
+    assert discord["embeds"][0]["fields"][-1] == {"name": "Note", "value": "boom"}
+    assert generic["event"] == "brandmint.pipeline.complete"
+
+
+def test_token_bucket_waits_for_refill(monkeypatch):
+    clock = [100.0]
+    sleeps = []
+
+    def fake_sleep(seconds):
+        sleeps.append(seconds)
+        clock[0] += seconds
+
+    monkeypatch.setattr(notifications.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(notifications.time, "sleep", fake_sleep)
+
+    bucket = notifications._TokenBucket(capacity=2, rate=4.0)
+    for _ in range(3):
+        bucket.acquire()
+
+    assert sleeps == [0.25]
+
+
+def test_rate_limiter_is_shared_per_host():
+    slack = notifications._rate_limiter("https://hooks.slack.com/services/A")
+    assert notifications._rate_limiter("https://hooks.slack.com/services/B") is slack
+    assert (slack.capacity, slack.rate) == (1, 1.0)
+
+    other = notifications._rate_limiter("https://example.com/hook")
+    assert other is not slack
+    assert other.capacity == 10
+
+
+def test_enqueue_webhook_returns_future(monkeypatch):
+    session = _FakeSession(204)
+    monkeypatch.setattr(notifications, "_webhook_session", lambda: session)
+
+    future = notifications.enqueue_webhook_notification(
+        "https://discord.com/api/webhooks/1/abc", brand_name="Acme", success=True, waves_completed=5
+    )
+
+    assert future.result(timeout=5) is True
+    assert session.posts[0][1]["embeds"][0]["fields"][1]["value"] == "5"
+
+
+@pytest.mark.parametrize(
+    "url, kind",
+    [
+        ("https://hooks.slack.com/services/T/B/X", "slack"),
+        ("https://HOOKS.SLACK.COM/services/T/B/X", "slack"),
+        ("https://ptb.discord.com/api/webhooks/1/abc", "discord"),
+        ("https://discordapp.com/api/webhooks/1/abc", "discord"),
+        ("https://proxy.example.com/?upstream=hooks.slack.com", "generic"),
+        ("https://example.com/discord.com/relay", "generic"),
+        ("not a url", "generic"),
+    ],
+)
+def test_classify_webhook_url_matches_hostname_only(url, kind):
+    assert notifications._classify_webhook_url(url) == kind
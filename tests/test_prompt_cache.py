@@ -0,0 +1,140 @@
+import yaml
+
+from brandmint.core.cache import PromptCache
+
+
+def test_set_get_roundtrip_uses_json_files(tmp_path):
+    cache = PromptCache(cache_dir=tmp_path)
+    cache.set("a prompt", {"text": "out", "n": 2}, provider="fal", model="m1")
+
+    assert cache.get("a prompt", provider="fal", model="m1") == {"text": "out", "n": 2}
+    assert cache.get("a prompt", provider="fal", model="m2") is None
+    assert not list(tmp_path.glob("*.yaml"))
+
+    reopened = PromptCache(cache_dir=tmp_path)
+    assert reopened.get("a prompt", provider="fal", model="m1") == {"text": "out", "n": 2}
+    assert reopened.stats()["valid_entries"] == 1
+
+
+def test_invalidate_and_missing_entry_file(tmp_path):
+    cache = PromptCache(cache_dir=tmp_path)
+    cache.set("one", "1")
+    cache.set("two", "2")
+
+    cache.invalidate("one")
+    assert cache.get("one") is None
+
+    key = cache._hash_prompt("two")
+    cache._entry_path(key).unlink()
+    reopened = PromptCache(cache_dir=tmp_path)
+    assert reopened.get("two") is None
+    assert key not in PromptCache(cache_dir=tmp_path)._index
+
+
+def test_expired_entries_are_cleared(tmp_path):
+    cache = PromptCache(cache_dir=tmp_path)
+    cache.set("old", "x", expiration_days=-1)
+    cache.set("new", "y")
+
+    assert cache.stats()["expired_entries"] == 1
+    assert cache.clear_expired() == 1
+    assert cache.get("new") == "y"
+
+
+def test_legacy_yaml_cache_is_migrated(tmp_path):
+    key = PromptCache(cache_dir=tmp_path / "probe")._hash_prompt("legacy", "p", "m")
+    entry = {
+        "key": key,
+        "value": "cached",
+        "created_at": "2030-01-01T00:00:00",
+        "expires_at": "2999-01-01T00:00:00",
+        "metadata": {},
+    }
+    (tmp_path / f"{key}.yaml").write_text(yaml.safe_dump(entry))
+    (tmp_path / "index.yaml").write_text(
+        yaml.safe_dump({key: {"provider": "p"}, "gone": {"provider": "p"}})
+    )
+
+    cache = PromptCache(cache_dir=tmp_path)
+
+    assert cache.get("legacy", "p", "m") == "cached"
+    assert list(cache._index) == [key]
+    assert not list(tmp_path.glob("*.yaml"))
+
+
+def test_index_changes_append_to_log_until_compacted(tmp_path):
+    cache = PromptCache(cache_dir=tmp_path)
+    cache.set("one", "1")
+    cache.set("two", "2")
+    cache.invalidate("one")
+
+    assert not (tmp_path / "index.json").exists()
+    assert len((tmp_path / "index.log").read_text().splitlines()) == 3
+    assert list(PromptCache(cache_dir=tmp_path)._index) == [cache._hash_prompt("two")]
+
+    cache.compact()
+    assert not (tmp_path / "index.log").exists()
+    assert list(PromptCache(cache_dir=tmp_path)._index) == [cache._hash_prompt("two")]
+
+
+def test_log_compacts_once_it_outgrows_the_index(tmp_path):
+    from brandmint.core import cache as cache_module
+
+    cache = PromptCache(cache_dir=tmp_path)
+    for _ in range(cache_module._LOG_COMPACT_MIN_LINES + 1):
+        cache.set("same", "v")
+
+    assert (tmp_path / "index.json").exists()
+    assert not (tmp_path / "index.log").exists()
+
+
+def test_torn_log_line_is_ignored(tmp_path):
+    cache = PromptCache(cache_dir=tmp_path)
+    cache.set("kept", "v")
+    with open(tmp_path / "index.log", "a") as f:
+        f.write('{"op":"set","key":')
+
+    reopened = PromptCache(cache_dir=tmp_path)
+    reopened.set("added", "w")
+
+    assert PromptCache(cache_dir=tmp_path).get("kept") == "v"
+    assert PromptCache(cache_dir=tmp_path).get("added") == "w"
+
+
+def test_hot_entries_are_served_from_memory(tmp_path, monkeypatch):
+    from brandmint.core import cache as cache_module
+
+    cache = PromptCache(cache_dir=tmp_path)
+    cache.set("hot", "v")
+
+    def no_disk(path):
+        raise AssertionError(f"unexpected read of {path}")
+
+    monkeypatch.setattr(cache_module, "_read_json", no_disk)
+    assert cache.get("hot") == "v"
+
+    cache.invalidate("hot")
+    assert cache.get("hot") is None
+
+
+def test_memory_lru_is_bounded(tmp_path, monkeypatch):
+    from brandmint.core import cache as cache_module
+
+    monkeypatch.setattr(cache_module, "_MEMORY_ENTRIES", 2)
+    cache = PromptCache(cache_dir=tmp_path)
+    for prompt in ("a", "b", "c"):
+        cache.set(prompt, prompt.upper())
+    cache.get("b")
+    cache.set("d", "D")
+
+    assert list(cache._memory) == [cache._hash_prompt(p) for p in ("b", "d")]
+    assert cache.get("a") == "A"  # evicted entries still load from disk
+
+
+def test_prompt_keys_are_blake2b_of_joined_parts(tmp_path):
+    import hashlib
+
+    key = PromptCache(cache_dir=tmp_path)._hash_prompt("p", "prov", "m")
+
+    assert key == hashlib.blake2b(b"prov:m:p", digest_size=8).hexdigest()
+    assert len(key) == 16
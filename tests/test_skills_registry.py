@@ -173,3 +173,61 @@ def test_non_variant_claude_duplicate_still_conflicts(tmp_path: Path) -> None:
     conflicts = registry.get_conflicts()
     assert len(conflicts) == 1
     assert conflicts[0]["skill_id"] == "alpha"
+
+
+def test_discovery_prefers_candidates_and_prunes_excluded_dirs(tmp_path: Path) -> None:
+    base = tmp_path / "skills"
+    _write_skill(base / "alpha" / "SKILL.md", name="alpha")
+    _write_skill(base / "alpha" / "instructions.md", name="alpha-instructions")
+    _write_skill(base / "group" / "beta" / "skill.md", name="beta")
+    _write_skill(base / "node_modules" / "pkg" / "SKILL.md", name="vendored")
+    _write_skill(base / "external" / "x" / "upstream" / "gamma" / "SKILL.md", name="gamma")
+
+    registry = SkillsRegistry(
+        skills_dir=tmp_path / "orchestrator",
+        brand_skills_dir=tmp_path / "none",
+        claude_skills_dir=tmp_path / "none",
+    )
+
+    found = registry._discover_skill_files(base)
+    assert [p.relative_to(base).as_posix() for p in found] == [
+        "alpha/SKILL.md",
+        "group/beta/skill.md",
+    ]
+
+    shallow = registry._discover_skill_files(base, recursive=False)
+    assert [p.relative_to(base).as_posix() for p in shallow] == ["alpha/SKILL.md"]
+
+
+def test_discovery_follows_symlinked_dirs_only_when_shallow(tmp_path: Path) -> None:
+    base = tmp_path / "skills"
+    _write_skill(base / "local" / "SKILL.md", name="local")
+    _write_skill(tmp_path / "shared" / "linked" / "SKILL.md", name="linked")
+    (base / "linked").symlink_to(tmp_path / "shared" / "linked", target_is_directory=True)
+
+    registry = SkillsRegistry(
+        skills_dir=tmp_path / "orchestrator",
+        brand_skills_dir=tmp_path / "none",
+        claude_skills_dir=tmp_path / "none",
+    )
+
+    deep = registry._discover_skill_files(base)
+    assert [p.relative_to(base).as_posix() for p in deep] == ["local/SKILL.md"]
+
+    shallow = registry._discover_skill_files(base, recursive=False)
+    assert [p.relative_to(base).as_posix() for p in shallow] == ["linked/SKILL.md", "local/SKILL.md"]
+
+
+def test_large_sources_load_through_thread_pool_in_order(tmp_path: Path) -> None:
+    claude_skills = tmp_path / "claude_skills"
+    for i in range(20):
+        _write_skill(claude_skills / f"skill-{i:02d}" / "SKILL.md", name=f"Skill {i:02d}")
+
+    registry = SkillsRegistry(
+        skills_dir=tmp_path / "orchestrator",
+        brand_skills_dir=tmp_path / "brand_skills",
+        claude_skills_dir=claude_skills,
+    )
+
+    assert [s.id for s in registry.get_all_skills()] == [f"skill-{i:02d}" for i in range(20)]
+    assert registry.get_skill("skill-07").description == "Test skill"
@@ -0,0 +1,58 @@
+import io
+
+from rich.console import Console
+from rich.progress import TimeRemainingColumn
+
+from brandmint.cli.spinners import create_asset_progress, create_wave_progress
+
+
+def _console() -> Console:
+    return Console(file=io.StringIO(), force_terminal=False, width=120)
+
+
+def test_progress_factories_share_column_prototypes():
+    first = create_asset_progress(_console())
+    second = create_asset_progress(_console())
+
+    assert first is not second
+    assert first.columns == second.columns
+
+
+def test_wave_progress_gets_its_own_time_remaining_column():
+    first = create_wave_progress(_console()).columns[-1]
+    second = create_wave_progress(_console()).columns[-1]
+
+    assert isinstance(first, TimeRemainingColumn)
+    assert first is not second
+
+
+def test_shared_columns_render_each_progress_independently():
+    console = _console()
+    with create_asset_progress(console) as one, create_asset_progress(console) as two:
+        one.add_task("alpha", total=4, completed=1)
+        two.add_task("beta", total=4, completed=3)
+        one.refresh()
+        two.refresh()
+
+    output = console.file.getvalue()
+    assert "alpha" in output and "1/4" in output
+    assert "beta" in output and "3/4" in output
+
+
+def test_format_duration():
+    from brandmint.cli.spinners import format_duration
+
+    assert format_duration(4.26) == "4.3s"
+    assert format_duration(59.94) == "59.9s"
+    assert format_duration(60) == "1m 0s"
+    assert format_duration(3725.9) == "62m 5s"
+
+
+def test_format_cost_precision_by_magnitude():
+    from brandmint.cli.spinners import format_cost
+
+    assert format_cost(0.00123) == "$0.0012"
+    assert format_cost(0.01) == "$0.010"
+    assert format_cost(0.085) == "$0.085"
+    assert format_cost(1) == "$1.00"
+    assert format_cost(12.345) == "$12.35"